@@ -0,0 +1,9 @@
+"""Caches used by application-layer use cases."""
+
+from __future__ import annotations
+
+from app.application.cache.interaction_cache import InteractionCache
+from app.application.cache.knowledge_base_cache import KnowledgeBaseCache
+from app.application.cache.query_cache import QueryCache
+
+__all__ = ["InteractionCache", "KnowledgeBaseCache", "QueryCache"]
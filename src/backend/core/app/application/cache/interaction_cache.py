@@ -0,0 +1,133 @@
+"""Read-through cache for interaction entities.
+
+Interactions are written once when a query completes and never modified
+afterwards, so a lookup by ID can be served from memory instead of
+opening a database session each time the same interaction is viewed.
+Listing pages do change as new interactions arrive, so they are kept only
+briefly and dropped whenever an interaction is saved.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+from app.domain.models.interaction import Interaction
+
+# Listing page key: knowledge base filter, limit and offset.
+_PageKey = tuple[str | None, int, int]
+
+
+class InteractionCache:
+    """LRU + TTL cache of interactions by ID and of listing pages.
+
+    Only interactions that exist are cached: a miss for an interaction
+    whose save is still in flight must not hide it once it is written.
+
+    Pages are versioned by a generation counter that ``invalidate_pages``
+    bumps. A page read from the store is only cached if no save completed
+    while it was being read, so a slow read cannot reinstate a stale page.
+    Other processes sharing the database may observe a new interaction up
+    to ``page_ttl_seconds`` late.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        max_pages: int = 256,
+        page_ttl_seconds: float = 5.0,
+    ) -> None:
+        """Initialize the interaction cache.
+
+        Args:
+            max_entries: Maximum number of cached interactions before LRU eviction.
+            ttl_seconds: Time-to-live of a cached entry in seconds.
+            max_pages: Maximum number of cached listing pages before LRU eviction.
+            page_ttl_seconds: Time-to-live of a cached listing page in seconds.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._max_pages = max_pages
+        self._page_ttl = page_ttl_seconds
+        self._entries: OrderedDict[str, tuple[Interaction, float]] = OrderedDict()
+        self._pages: OrderedDict[_PageKey, tuple[list[Interaction], float]] = OrderedDict()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached interactions, including expired ones."""
+        return len(self._entries)
+
+    def get(self, interaction_id: str) -> Interaction | None:
+        """Look up an interaction by ID.
+
+        Args:
+            interaction_id: Interaction ID.
+
+        Returns:
+            Cached interaction, or None on a miss.
+        """
+        entry = self._entries.get(interaction_id)
+        if entry is None:
+            return None
+        interaction, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[interaction_id]
+            return None
+        self._entries.move_to_end(interaction_id)
+        return interaction
+
+    def put(self, interaction: Interaction) -> None:
+        """Cache an interaction.
+
+        Args:
+            interaction: Interaction to cache.
+        """
+        self._entries[interaction.id] = (interaction, time.monotonic() + self._ttl)
+        self._entries.move_to_end(interaction.id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    @property
+    def generation(self) -> int:
+        """Current page generation; pass it to ``put_page`` after reading."""
+        return self._generation
+
+    def get_page(self, key: _PageKey) -> list[Interaction] | None:
+        """Look up a cached listing page.
+
+        Args:
+            key: Knowledge base filter, limit and offset of the page.
+
+        Returns:
+            A copy of the cached page, or None on a miss.
+        """
+        entry = self._pages.get(key)
+        if entry is None:
+            return None
+        interactions, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._pages[key]
+            return None
+        self._pages.move_to_end(key)
+        return list(interactions)
+
+    def put_page(self, key: _PageKey, interactions: list[Interaction], generation: int) -> None:
+        """Cache a listing page unless an interaction was saved since it was read.
+
+        Args:
+            key: Knowledge base filter, limit and offset of the page.
+            interactions: Interactions on the page, in store order.
+            generation: Value of ``generation`` taken before the page was read.
+        """
+        if generation != self._generation:
+            return
+        self._pages[key] = (list(interactions), time.monotonic() + self._page_ttl)
+        self._pages.move_to_end(key)
+        while len(self._pages) > self._max_pages:
+            self._pages.popitem(last=False)
+
+    def invalidate_pages(self) -> None:
+        """Drop every cached listing page after an interaction is saved."""
+        self._pages.clear()
+        self._generation += 1
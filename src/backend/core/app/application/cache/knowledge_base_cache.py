@@ -0,0 +1,118 @@
+"""Read-through cache for knowledge base entities.
+
+Knowledge bases change rarely but are read on most requests, so lookups
+by ID and the full listing are served from memory for a short TTL instead
+of opening a database session each time.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+from app.domain.models.knowledge_base import KnowledgeBase
+
+
+class KnowledgeBaseCache:
+    """LRU + TTL cache of knowledge bases by ID, plus the full listing.
+
+    Only knowledge bases that exist are cached. Entries are dropped on
+    ``invalidate``, which callers must invoke whenever a knowledge base is
+    created or deleted. Other processes sharing the database may observe a
+    change up to ``ttl_seconds`` late.
+
+    Writes are versioned by a generation counter that ``invalidate`` bumps.
+    A value read from the store is only cached if no invalidation happened
+    while it was being read, so a slow read cannot reinstate a deleted
+    knowledge base or a listing that misses a new one.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60.0) -> None:
+        """Initialize the knowledge base cache.
+
+        Args:
+            max_entries: Maximum number of cached knowledge bases before LRU eviction.
+            ttl_seconds: Time-to-live of a cached entry in seconds.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[KnowledgeBase, float]] = OrderedDict()
+        self._listing: tuple[list[KnowledgeBase], float] | None = None
+        self._generation = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached knowledge bases, including expired ones."""
+        return len(self._entries)
+
+    def get(self, kb_id: str) -> KnowledgeBase | None:
+        """Look up a knowledge base by ID.
+
+        Args:
+            kb_id: Knowledge base ID.
+
+        Returns:
+            Cached knowledge base, or None on a miss.
+        """
+        entry = self._entries.get(kb_id)
+        if entry is None:
+            return None
+        kb, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[kb_id]
+            return None
+        self._entries.move_to_end(kb_id)
+        return kb
+
+    @property
+    def generation(self) -> int:
+        """Current generation; pass it to ``put`` or ``put_all`` after reading."""
+        return self._generation
+
+    def put(self, kb: KnowledgeBase, generation: int) -> None:
+        """Cache a knowledge base unless the cache was invalidated since it was read.
+
+        Args:
+            kb: Knowledge base to cache.
+            generation: Value of ``generation`` taken before the store was read.
+        """
+        if generation != self._generation:
+            return
+        self._entries[kb.id] = (kb, time.monotonic() + self._ttl)
+        self._entries.move_to_end(kb.id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get_all(self) -> list[KnowledgeBase] | None:
+        """Look up the cached listing of all knowledge bases.
+
+        Returns:
+            A copy of the cached listing, or None on a miss.
+        """
+        if self._listing is None:
+            return None
+        kbs, expires_at = self._listing
+        if expires_at <= time.monotonic():
+            self._listing = None
+            return None
+        return list(kbs)
+
+    def put_all(self, kbs: list[KnowledgeBase], generation: int) -> None:
+        """Cache the listing unless the cache was invalidated since it was read.
+
+        Args:
+            kbs: Every knowledge base, in store order.
+            generation: Value of ``generation`` taken before the store was read.
+        """
+        if generation != self._generation:
+            return
+        self._listing = (list(kbs), time.monotonic() + self._ttl)
+
+    def invalidate(self, kb_id: str) -> None:
+        """Drop a knowledge base and the cached listing.
+
+        Args:
+            kb_id: ID of the knowledge base that was created or deleted.
+        """
+        self._entries.pop(kb_id, None)
+        self._listing = None
+        self._generation += 1
@@ -0,0 +1,268 @@
+"""Semantic query cache for the RAG pipeline.
+
+Repeated or near-duplicate questions against the same knowledge base
+produce the same answer, so the full embed → retrieve → generate → ground
+pipeline can be skipped for them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.domain.models.grounding import QueryResult
+
+# Cache key: knowledge base ID and question hash.
+_Key = tuple[str, bytes]
+
+
+@dataclass
+class _CacheEntry:
+    """A cached query result with its expiry."""
+
+    kb_id: str
+    result: QueryResult
+    expires_at: float
+
+
+class _EmbeddingIndex:
+    """Normalized question embeddings of one knowledge base.
+
+    Embeddings are rows of a contiguous float32 matrix, so a similarity
+    lookup is one matrix-vector product instead of a Python loop over
+    entries. Removing a row moves the last row into its place.
+    """
+
+    def __init__(self, dimension: int) -> None:
+        """Initialize an empty index.
+
+        Args:
+            dimension: Embedding dimension.
+        """
+        self.dimension = dimension
+        self._vectors = np.empty((8, dimension), dtype=np.float32)
+        self._expires = np.empty(8, dtype=np.float64)
+        self._keys: list[_Key] = []
+        self._rows: dict[_Key, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of stored embeddings."""
+        return len(self._keys)
+
+    def set(self, key: _Key, vector: np.ndarray, expires_at: float) -> None:
+        """Store or replace the embedding of a cache key.
+
+        Args:
+            key: Cache key.
+            vector: Unit-length embedding.
+            expires_at: Monotonic time at which the entry expires.
+        """
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._keys)
+            if row == len(self._vectors):
+                self._vectors = np.concatenate([self._vectors, np.empty_like(self._vectors)])
+                self._expires = np.concatenate([self._expires, np.empty_like(self._expires)])
+            self._keys.append(key)
+            self._rows[key] = row
+        self._vectors[row] = vector
+        self._expires[row] = expires_at
+
+    def remove(self, key: _Key) -> None:
+        """Remove the embedding of a cache key, if present.
+
+        Args:
+            key: Cache key.
+        """
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        last = len(self._keys) - 1
+        if row != last:
+            moved = self._keys[last]
+            self._vectors[row] = self._vectors[last]
+            self._expires[row] = self._expires[last]
+            self._keys[row] = moved
+            self._rows[moved] = row
+        self._keys.pop()
+
+    def best(self, query: np.ndarray, now: float) -> tuple[_Key, float] | None:
+        """Find the unexpired embedding most similar to a query.
+
+        Args:
+            query: Unit-length query embedding.
+            now: Current monotonic time.
+
+        Returns:
+            The key and cosine similarity of the best match, or None if
+            every embedding has expired.
+        """
+        count = len(self._keys)
+        scores = self._vectors[:count] @ query
+        scores[self._expires[:count] <= now] = -np.inf
+        row = int(np.argmax(scores))
+        if scores[row] == -np.inf:
+            return None
+        return self._keys[row], float(scores[row])
+
+
+class QueryCache:
+    """LRU + TTL cache of query results, with approximate embedding matches.
+
+    Entries are keyed by knowledge base ID and a hash of the normalized
+    question text. A secondary lookup compares the question embedding
+    against cached embeddings of the same knowledge base and reuses the
+    result when the cosine similarity reaches ``similarity_threshold``.
+    Each knowledge base keeps its embeddings in its own matrix, so the
+    lookup never scans entries of other knowledge bases.
+
+    Cached results carry the interaction ID of the query that produced
+    them; callers are responsible for issuing a fresh one on a hit.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: float = 300.0,
+        similarity_threshold: float = 0.97,
+    ) -> None:
+        """Initialize the query cache.
+
+        Args:
+            max_entries: Maximum number of cached results before LRU eviction.
+            ttl_seconds: Time-to-live of a cached result in seconds.
+            similarity_threshold: Minimum cosine similarity for an
+                approximate (embedding) hit.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._threshold = similarity_threshold
+        self._entries: OrderedDict[_Key, _CacheEntry] = OrderedDict()
+        self._indexes: dict[str, _EmbeddingIndex] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached entries, including expired ones."""
+        return len(self._entries)
+
+    def get(self, kb_id: str, question: str) -> QueryResult | None:
+        """Look up an exact (normalized) question match.
+
+        Args:
+            kb_id: Knowledge base ID.
+            question: User question.
+
+        Returns:
+            Cached query result, or None on a miss.
+        """
+        key = (kb_id, _question_key(question))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.result
+
+    def get_similar(self, kb_id: str, embedding: Sequence[float]) -> QueryResult | None:
+        """Look up the most similar cached question by embedding.
+
+        Args:
+            kb_id: Knowledge base ID.
+            embedding: Embedding of the user question.
+
+        Returns:
+            Cached query result of the closest question above the
+            similarity threshold, or None on a miss.
+        """
+        index = self._indexes.get(kb_id)
+        if index is None:
+            return None
+        query = _normalize(embedding)
+        if query is None or len(query) != index.dimension:
+            return None
+        match = index.best(query, time.monotonic())
+        if match is None or match[1] < self._threshold:
+            return None
+        key = match[0]
+        self._entries.move_to_end(key)
+        return self._entries[key].result
+
+    def put(
+        self,
+        kb_id: str,
+        question: str,
+        embedding: Sequence[float] | None,
+        result: QueryResult,
+    ) -> None:
+        """Cache a query result.
+
+        Args:
+            kb_id: Knowledge base ID.
+            question: User question.
+            embedding: Embedding of the question, if available.
+            result: Result to cache.
+        """
+        key = (kb_id, _question_key(question))
+        expires_at = time.monotonic() + self._ttl
+        self._entries[key] = _CacheEntry(kb_id=kb_id, result=result, expires_at=expires_at)
+        self._entries.move_to_end(key)
+        vector = _normalize(embedding) if embedding is not None else None
+        index = self._indexes.get(kb_id)
+        if vector is None:
+            if index is not None:
+                index.remove(key)
+        else:
+            if index is None or index.dimension != len(vector):
+                # A new embedding model makes the old vectors incomparable.
+                index = self._indexes[kb_id] = _EmbeddingIndex(len(vector))
+            index.set(key, vector, expires_at)
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, kb_id: str) -> None:
+        """Drop every cached result for a knowledge base.
+
+        Called when the knowledge base content changes, since cached
+        answers may no longer reflect the available documents.
+
+        Args:
+            kb_id: Knowledge base ID.
+        """
+        stale = [key for key, entry in self._entries.items() if entry.kb_id == kb_id]
+        for key in stale:
+            del self._entries[key]
+        self._indexes.pop(kb_id, None)
+
+    def _remove(self, key: _Key) -> None:
+        """Drop an entry and its embedding.
+
+        Args:
+            key: Cache key.
+        """
+        del self._entries[key]
+        index = self._indexes.get(key[0])
+        if index is not None:
+            index.remove(key)
+            if not index:
+                del self._indexes[key[0]]
+
+
+def _question_key(question: str) -> bytes:
+    """Hash a question after case and whitespace normalization."""
+    normalized = " ".join(question.lower().split())
+    return hashlib.sha256(normalized.encode()).digest()
+
+
+def _normalize(embedding: Sequence[float]) -> np.ndarray | None:
+    """Scale an embedding to unit length so dot products are cosine similarities."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm == 0.0:
+        return None
+    return vector / norm
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueryInput:
     """Input DTO for query use case."""
 
@@ -13,7 +13,7 @@ class QueryInput:
     question: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateKnowledgeBaseInput:
     """Input DTO for knowledge base creation."""
 
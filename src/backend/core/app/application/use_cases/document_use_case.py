@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
+from app.application.cache.query_cache import QueryCache
 from app.domain.models.document import Document, DocumentStatus
 from app.domain.ports.document_store_port import DocumentStorePort
 from app.domain.ports.vectorstore_port import VectorStorePort
@@ -14,16 +16,22 @@ class DocumentUseCase:
     """Use case for document management."""
 
     def __init__(
-        self, document_store: DocumentStorePort, vectorstore: VectorStorePort
+        self,
+        document_store: DocumentStorePort,
+        vectorstore: VectorStorePort,
+        query_cache: QueryCache | None = None,
     ) -> None:
         """Initialize the document use case.
 
         Args:
             document_store: Document store port.
             vectorstore: Vector store port.
+            query_cache: Optional query cache to invalidate when a
+                knowledge base's documents change.
         """
         self._store = document_store
         self._vectorstore = vectorstore
+        self._query_cache = query_cache
 
     async def upload(
         self, kb_id: str, filename: str, content_hash: str
@@ -46,7 +54,10 @@ class DocumentUseCase:
             status=DocumentStatus.PENDING,
             uploaded_at=datetime.now(UTC),
         )
-        return await self._store.save_document(doc)
+        saved = await self._store.save_document(doc)
+        if self._query_cache is not None:
+            self._query_cache.invalidate(kb_id)
+        return saved
 
     async def list_documents(self, kb_id: str) -> list[Document]:
         """List all documents in a knowledge base.
@@ -59,6 +70,25 @@ class DocumentUseCase:
         """
         return await self._store.list_documents(kb_id)
 
+    def stream_documents(self, kb_id: str) -> AsyncIterator[Document]:
+        """Stream the documents in a knowledge base.
+
+        Args:
+            kb_id: Knowledge base ID.
+
+        Returns:
+            Async iterator over documents.
+        """
+        return self._store.stream_documents(kb_id)
+
+    async def count_all(self) -> int:
+        """Count documents across all knowledge bases.
+
+        Returns:
+            Number of documents.
+        """
+        return await self._store.count_documents()
+
     async def delete(self, kb_id: str, document_id: str) -> None:
         """Delete a document and its chunks.
 
@@ -68,3 +98,5 @@ class DocumentUseCase:
         """
         await self._vectorstore.delete_by_document(document_id)
         await self._store.delete_document(document_id)
+        if self._query_cache is not None:
+            self._query_cache.invalidate(kb_id)
@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
-from app.domain.models.interaction import Interaction
+from collections.abc import AsyncIterator
+
+from app.application.cache.interaction_cache import InteractionCache
+from app.domain.models.interaction import Interaction, InteractionStatus
 from app.domain.ports.interaction_store_port import InteractionStorePort
 
 
 class InteractionUseCase:
     """Use case for interaction history management."""
 
-    def __init__(self, interaction_store: InteractionStorePort) -> None:
+    def __init__(
+        self, interaction_store: InteractionStorePort, cache: InteractionCache | None = None
+    ) -> None:
         """Initialize the interaction use case.
 
         Args:
             interaction_store: Interaction store port.
+            cache: Optional cache serving lookups by ID and listing pages.
         """
         self._store = interaction_store
+        self._cache = cache
 
     async def list_all(
         self, kb_id: str | None = None, limit: int = 50, offset: int = 0
@@ -30,7 +37,39 @@ class InteractionUseCase:
         Returns:
             List of interactions.
         """
-        return await self._store.list_all(kb_id=kb_id, limit=limit, offset=offset)
+        if self._cache is None:
+            return await self._store.list_all(kb_id=kb_id, limit=limit, offset=offset)
+        key = (kb_id, limit, offset)
+        interactions = self._cache.get_page(key)
+        if interactions is None:
+            generation = self._cache.generation
+            interactions = await self._store.list_all(kb_id=kb_id, limit=limit, offset=offset)
+            self._cache.put_page(key, interactions, generation)
+        return interactions
+
+    def stream_all(
+        self, kb_id: str | None = None, limit: int = 50, offset: int = 0
+    ) -> AsyncIterator[Interaction]:
+        """Stream interactions with optional filtering and pagination.
+
+        Args:
+            kb_id: Optional knowledge base ID to filter by.
+            limit: Maximum number of results.
+            offset: Number of results to skip.
+
+        Returns:
+            Async iterator over interactions.
+        """
+        return self._store.stream_all(kb_id=kb_id, limit=limit, offset=offset)
+
+    async def count_by_status(self) -> dict[InteractionStatus, int]:
+        """Count interactions per status.
+
+        Returns:
+            Mapping from status to number of interactions; statuses
+            without interactions may be absent.
+        """
+        return await self._store.count_by_status()
 
     async def get(self, interaction_id: str) -> Interaction | None:
         """Get an interaction by ID.
@@ -41,4 +80,11 @@ class InteractionUseCase:
         Returns:
             Interaction if found, None otherwise.
         """
-        return await self._store.get(interaction_id)
+        if self._cache is None:
+            return await self._store.get(interaction_id)
+        interaction = self._cache.get(interaction_id)
+        if interaction is None:
+            interaction = await self._store.get(interaction_id)
+            if interaction is not None:
+                self._cache.put(interaction)
+        return interaction
@@ -5,6 +5,8 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime
 
+from app.application.cache.knowledge_base_cache import KnowledgeBaseCache
+from app.application.cache.query_cache import QueryCache
 from app.domain.models.knowledge_base import KnowledgeBase
 from app.domain.ports.document_store_port import DocumentStorePort
 
@@ -12,13 +14,23 @@ from app.domain.ports.document_store_port import DocumentStorePort
 class KnowledgeBaseUseCase:
     """Use case for knowledge base management."""
 
-    def __init__(self, document_store: DocumentStorePort) -> None:
+    def __init__(
+        self,
+        document_store: DocumentStorePort,
+        cache: KnowledgeBaseCache | None = None,
+        query_cache: QueryCache | None = None,
+    ) -> None:
         """Initialize the knowledge base use case.
 
         Args:
             document_store: Document store port.
+            cache: Optional cache serving reads of knowledge bases.
+            query_cache: Optional query cache to invalidate when a
+                knowledge base is deleted.
         """
         self._store = document_store
+        self._cache = cache
+        self._query_cache = query_cache
 
     async def create(
         self, name: str, description: str | None = None
@@ -38,7 +50,10 @@ class KnowledgeBaseUseCase:
             description=description,
             created_at=datetime.now(UTC),
         )
-        return await self._store.create_kb(kb)
+        created = await self._store.create_kb(kb)
+        if self._cache is not None:
+            self._cache.invalidate(created.id)
+        return created
 
     async def list_all(self) -> list[KnowledgeBase]:
         """List all knowledge bases.
@@ -46,7 +61,22 @@ class KnowledgeBaseUseCase:
         Returns:
             List of all knowledge bases.
         """
-        return await self._store.list_kbs()
+        if self._cache is None:
+            return await self._store.list_kbs()
+        kbs = self._cache.get_all()
+        if kbs is None:
+            generation = self._cache.generation
+            kbs = await self._store.list_kbs()
+            self._cache.put_all(kbs, generation)
+        return kbs
+
+    async def count(self) -> int:
+        """Count knowledge bases.
+
+        Returns:
+            Number of knowledge bases.
+        """
+        return await self._store.count_kbs()
 
     async def get(self, kb_id: str) -> KnowledgeBase | None:
         """Get a knowledge base by ID.
@@ -57,7 +87,15 @@ class KnowledgeBaseUseCase:
         Returns:
             Knowledge base if found, None otherwise.
         """
-        return await self._store.get_kb(kb_id)
+        if self._cache is None:
+            return await self._store.get_kb(kb_id)
+        kb = self._cache.get(kb_id)
+        if kb is None:
+            generation = self._cache.generation
+            kb = await self._store.get_kb(kb_id)
+            if kb is not None:
+                self._cache.put(kb, generation)
+        return kb
 
     async def delete(self, kb_id: str) -> None:
         """Delete a knowledge base.
@@ -66,3 +104,7 @@ class KnowledgeBaseUseCase:
             kb_id: Knowledge base ID to delete.
         """
         await self._store.delete_kb(kb_id)
+        if self._cache is not None:
+            self._cache.invalidate(kb_id)
+        if self._query_cache is not None:
+            self._query_cache.invalidate(kb_id)
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import uuid
+from collections.abc import Sequence
+from dataclasses import replace
 
 from opentelemetry import trace
 
+from app.application.cache.interaction_cache import InteractionCache
+from app.application.cache.query_cache import QueryCache
+from app.domain.models.chunk import Chunk
 from app.domain.models.citation import Citation
-from app.domain.models.grounding import QueryResult
+from app.domain.models.grounding import GroundingDecision, QueryResult
 from app.domain.models.interaction import Interaction, InteractionStatus
 from app.domain.ports.interaction_store_port import InteractionStorePort
 from app.domain.ports.llm_port import LLMPort
@@ -16,7 +23,20 @@ from app.domain.services.grounding_service import GroundingService
 
 UNKNOWN_MESSAGE = "I don't have that information in the provided knowledge base."
 
+# Constant instructions sent as the system prompt. Keeping them out of the
+# per-query prompt makes them an identical head for every request, so the
+# provider never re-processes them once cached.
+INSTRUCTIONS = (
+    "Answer the following question based ONLY on the provided context. "
+    "If the context doesn't contain the answer, say so."
+)
+
 _tracer = trace.get_tracer(__name__)
+_logger = logging.getLogger(__name__)
+
+# Interaction writes running in the background, kept referenced until done
+# so they are not garbage-collected and can be drained on shutdown.
+_pending_saves: set[asyncio.Task[Interaction]] = set()
 
 
 class QueryUseCase:
@@ -28,6 +48,9 @@ class QueryUseCase:
         vectorstore: VectorStorePort,
         interaction_store: InteractionStorePort,
         grounding_service: GroundingService,
+        cache: QueryCache | None = None,
+        persist_in_background: bool = False,
+        interaction_cache: InteractionCache | None = None,
     ) -> None:
         """Initialize the query use case.
 
@@ -36,11 +59,21 @@ class QueryUseCase:
             vectorstore: Vector store port.
             interaction_store: Interaction store port.
             grounding_service: Grounding evaluation service.
+            cache: Optional query cache shared across requests. When set,
+                repeated or near-duplicate questions skip the RAG pipeline.
+            persist_in_background: When True, the result is returned without
+                waiting for the interaction write; failed writes are logged.
+                Call ``drain_pending_saves`` on shutdown.
+            interaction_cache: Optional interaction cache whose listing
+                pages are dropped once each interaction is saved.
         """
         self._llm = llm
         self._vectorstore = vectorstore
         self._interaction_store = interaction_store
         self._grounding_service = grounding_service
+        self._cache = cache
+        self._persist_in_background = persist_in_background
+        self._interaction_cache = interaction_cache
 
     async def execute(self, kb_id: str, question: str) -> QueryResult:
         """Execute the query against the knowledge base.
@@ -58,9 +91,21 @@ class QueryUseCase:
             root_span.set_attribute("interaction.id", interaction_id)
             root_span.set_attribute("interaction.kb_id", kb_id)
 
+            if self._cache is not None:
+                cached = self._cache.get(kb_id, question)
+                if cached is not None:
+                    root_span.set_attribute("cache.hit", "exact")
+                    return await self._serve_cached(kb_id, question, cached, interaction_id)
+
             # Step 1: Embed the question
             query_embedding = await self._llm.embed(question)
 
+            if self._cache is not None:
+                cached = self._cache.get_similar(kb_id, query_embedding)
+                if cached is not None:
+                    root_span.set_attribute("cache.hit", "semantic")
+                    return await self._serve_cached(kb_id, question, cached, interaction_id)
+
             # Step 2: Retrieve relevant chunks
             with _tracer.start_as_current_span("rag.retrieve") as retrieve_span:
                 retrieve_span.set_attribute("interaction.id", interaction_id)
@@ -69,57 +114,33 @@ class QueryUseCase:
                 retrieve_span.set_attribute("retrieval.chunk_count", len(chunks))
 
             if not chunks:
-                interaction = Interaction(
-                    id=interaction_id,
-                    kb_id=kb_id,
-                    question=question,
-                    answer=UNKNOWN_MESSAGE,
-                    status=InteractionStatus.UNKNOWN,
-                )
-                await self._interaction_store.save(interaction)
-                return QueryResult(
-                    status="unknown",
-                    answer=UNKNOWN_MESSAGE,
-                    citations=[],
-                    interaction_id=interaction_id,
+                return await self._finish_unknown(
+                    kb_id, question, query_embedding, interaction_id
                 )
 
-            # Step 3: Generate answer with context
-            context = "\n\n".join(f"[Chunk {c.id}]: {c.content}" for c in chunks)
-            prompt = (
-                "Answer the following question based ONLY on the provided context. "
-                "If the context doesn't contain the answer, say so.\n\n"
-                f"Context:\n{context}\n\nQuestion: {question}"
-            )
+            # Overlapping chunk windows can retrieve the same text twice;
+            # duplicates only inflate the prompt and the grounding scan.
+            chunks = _unique_by_content(chunks)
 
-            with _tracer.start_as_current_span("rag.generate") as generate_span:
-                generate_span.set_attribute("generation.model", "ollama")
-                generate_span.set_attribute("generation.provider", "ollama")
-                answer = await self._llm.generate(prompt, context)
+            # Step 3: Generate answer with context. The context is ordered by
+            # chunk ID and passed separately from the question so the provider
+            # can place it as a stable prompt prefix and reuse its KV cache
+            # whenever the same chunks are retrieved again.
+            context = "\n\n".join(
+                [f"[Chunk {c.id}]: {c.content}" for c in sorted(chunks, key=lambda c: c.id)]
+            )
+            prompt = f"Question: {question}"
 
-            # Step 4: Evaluate grounding
-            with _tracer.start_as_current_span("rag.ground") as ground_span:
-                grounding = self._grounding_service.evaluate(question, answer, chunks)
-                ground_span.set_attribute("grounding.is_grounded", grounding.is_grounded)
-                ground_span.set_attribute("grounding.confidence", grounding.confidence)
+            # Step 4: Evaluate grounding (speculatively on a draft first)
+            answer, grounding = await self._generate_grounded(question, prompt, context, chunks)
 
             if not grounding.is_grounded:
-                interaction = Interaction(
-                    id=interaction_id,
-                    kb_id=kb_id,
-                    question=question,
-                    answer=UNKNOWN_MESSAGE,
-                    status=InteractionStatus.UNKNOWN,
-                )
-                await self._interaction_store.save(interaction)
-                return QueryResult(
-                    status="unknown",
-                    answer=UNKNOWN_MESSAGE,
-                    citations=[],
-                    interaction_id=interaction_id,
+                return await self._finish_unknown(
+                    kb_id, question, query_embedding, interaction_id
                 )
 
             # Step 5: Build citations from supporting chunks
+            supporting = frozenset(grounding.supporting_chunks)
             citations = [
                 Citation(
                     source_document=c.metadata.get("source_document", ""),
@@ -128,7 +149,7 @@ class QueryUseCase:
                     relevance_score=0.0,
                 )
                 for c in chunks
-                if c.id in grounding.supporting_chunks
+                if c.id in supporting
             ]
 
             # Step 6: Save interaction
@@ -140,11 +161,242 @@ class QueryUseCase:
                 status=InteractionStatus.ANSWERED,
                 citations=citations,
             )
-            await self._interaction_store.save(interaction)
-
-            return QueryResult(
+            result = QueryResult(
                 status="answered",
                 answer=answer,
                 citations=citations,
                 interaction_id=interaction_id,
             )
+            return await self._finish(kb_id, question, query_embedding, interaction, result)
+
+    async def _generate_grounded(
+        self, question: str, prompt: str, context: str, chunks: list[Chunk]
+    ) -> tuple[str, GroundingDecision]:
+        """Generate an answer and evaluate its grounding.
+
+        The full generation starts immediately. Meanwhile a draft is
+        requested from the provider's draft model; if the draft is
+        grounded it becomes the answer and the full generation is
+        cancelled, otherwise the full answer is awaited and grounded.
+
+        Args:
+            question: User question.
+            prompt: Instruction prompt including the question.
+            context: Retrieved chunk context.
+            chunks: Retrieved chunks to ground against.
+
+        Returns:
+            Tuple of the accepted answer and its grounding decision.
+        """
+        full_task = asyncio.create_task(
+            self._llm.generate(prompt, context, system_prompt=INSTRUCTIONS)
+        )
+        try:
+            with _tracer.start_as_current_span("rag.generate_draft") as draft_span:
+                draft = await self._llm.generate_draft(
+                    prompt, context, system_prompt=INSTRUCTIONS
+                )
+                draft_span.set_attribute("generation.draft_available", draft is not None)
+
+            if draft is not None:
+                grounding = self._ground(question, draft, chunks)
+                if grounding.is_grounded:
+                    _discard(full_task)
+                    return draft, grounding
+
+            with _tracer.start_as_current_span("rag.generate") as generate_span:
+                generate_span.set_attribute("generation.model", "ollama")
+                generate_span.set_attribute("generation.provider", "ollama")
+                answer = await full_task
+        except BaseException:
+            _discard(full_task)
+            raise
+
+        return answer, self._ground(question, answer, chunks)
+
+    def _ground(self, question: str, answer: str, chunks: list[Chunk]) -> GroundingDecision:
+        """Evaluate grounding of an answer inside a tracing span.
+
+        Args:
+            question: User question.
+            answer: Candidate answer.
+            chunks: Retrieved chunks to ground against.
+
+        Returns:
+            Grounding decision for the answer.
+        """
+        with _tracer.start_as_current_span("rag.ground") as ground_span:
+            grounding = self._grounding_service.evaluate(question, answer, chunks)
+            ground_span.set_attribute("grounding.is_grounded", grounding.is_grounded)
+            ground_span.set_attribute("grounding.confidence", grounding.confidence)
+        return grounding
+
+    async def _finish_unknown(
+        self,
+        kb_id: str,
+        question: str,
+        query_embedding: Sequence[float],
+        interaction_id: str,
+    ) -> QueryResult:
+        """Record and return an "unknown" outcome.
+
+        Args:
+            kb_id: Knowledge base ID.
+            question: User question.
+            query_embedding: Embedding of the question.
+            interaction_id: Interaction ID for this query.
+
+        Returns:
+            Query result with unknown status.
+        """
+        interaction = Interaction(
+            id=interaction_id,
+            kb_id=kb_id,
+            question=question,
+            answer=UNKNOWN_MESSAGE,
+            status=InteractionStatus.UNKNOWN,
+        )
+        result = QueryResult(
+            status="unknown",
+            answer=UNKNOWN_MESSAGE,
+            citations=[],
+            interaction_id=interaction_id,
+        )
+        return await self._finish(kb_id, question, query_embedding, interaction, result)
+
+    async def _finish(
+        self,
+        kb_id: str,
+        question: str,
+        query_embedding: Sequence[float],
+        interaction: Interaction,
+        result: QueryResult,
+    ) -> QueryResult:
+        """Persist the interaction, then cache the result.
+
+        The result is cached only once the write has succeeded, so a failed
+        write propagates to the caller without leaving its answer cached.
+        When writes run in the background, the result is cached right away.
+
+        Args:
+            kb_id: Knowledge base ID.
+            question: User question.
+            query_embedding: Embedding of the question.
+            interaction: Interaction to persist.
+            result: Result to cache and return.
+
+        Returns:
+            The result, unchanged.
+        """
+        await self._save(interaction)
+        if self._cache is not None:
+            self._cache.put(kb_id, question, query_embedding, result)
+        return result
+
+    async def _serve_cached(
+        self, kb_id: str, question: str, cached: QueryResult, interaction_id: str
+    ) -> QueryResult:
+        """Record a new interaction for a cached result and return it.
+
+        Every query gets its own interaction, so cache hits are persisted
+        under a fresh interaction ID just like a full pipeline run.
+
+        Args:
+            kb_id: Knowledge base ID.
+            question: User question.
+            cached: Cached query result.
+            interaction_id: Interaction ID for this query.
+
+        Returns:
+            The cached result re-issued under the new interaction ID.
+        """
+        answered = cached.status == "answered"
+        interaction = Interaction(
+            id=interaction_id,
+            kb_id=kb_id,
+            question=question,
+            answer=cached.answer if answered else UNKNOWN_MESSAGE,
+            status=InteractionStatus.ANSWERED if answered else InteractionStatus.UNKNOWN,
+            citations=list(cached.citations),
+        )
+        await self._save(interaction)
+        return replace(cached, interaction_id=interaction_id)
+
+    async def _save(self, interaction: Interaction) -> None:
+        """Persist an interaction, or start persisting it in the background.
+
+        Args:
+            interaction: Interaction to persist.
+        """
+        if not self._persist_in_background:
+            await self._write(interaction)
+            return
+        task = asyncio.create_task(self._write(interaction))
+        _pending_saves.add(task)
+        task.add_done_callback(_on_background_save_done)
+
+    async def _write(self, interaction: Interaction) -> Interaction:
+        """Write an interaction and drop the cached listing pages it changes.
+
+        Args:
+            interaction: Interaction to persist.
+
+        Returns:
+            The persisted interaction.
+        """
+        try:
+            return await self._interaction_store.save(interaction)
+        finally:
+            if self._interaction_cache is not None:
+                self._interaction_cache.invalidate_pages()
+
+def _unique_by_content(chunks: list[Chunk]) -> list[Chunk]:
+    """Drop chunks whose content repeats an earlier chunk, keeping retrieval order.
+
+    Args:
+        chunks: Retrieved chunks, most relevant first.
+
+    Returns:
+        Chunks with distinct content.
+    """
+    seen: set[str] = set()
+    unique = []
+    for chunk in chunks:
+        if chunk.content not in seen:
+            seen.add(chunk.content)
+            unique.append(chunk)
+    return unique
+
+
+def _discard(task: asyncio.Task[str]) -> None:
+    """Cancel a task whose result is no longer needed.
+
+    A done callback retrieves the outcome so an exception raised before
+    the cancellation took effect is not reported as never retrieved.
+
+    Args:
+        task: Task to cancel.
+    """
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+def _on_background_save_done(task: asyncio.Task[Interaction]) -> None:
+    """Forget a finished background save and log its failure, if any.
+
+    Args:
+        task: Finished save task.
+    """
+    _pending_saves.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        _logger.error("Failed to persist interaction", exc_info=task.exception())
+
+
+async def drain_pending_saves(timeout: float = 5.0) -> None:
+    """Wait for background interaction writes to finish.
+
+    Args:
+        timeout: Maximum time to wait in seconds.
+    """
+    if _pending_saves:
+        await asyncio.wait(set(_pending_saves), timeout=timeout)
@@ -11,10 +11,36 @@ class Settings(BaseSettings):
     app_name: str = "AI Customer Service Core"
     host: str = "0.0.0.0"
     port: int = 8000
+    cors_allow_origins: list[str] = ["*"]
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "llama3.2"
+    ollama_keep_alive: str = "30m"
+    ollama_draft_model: str | None = None
+    ollama_embed_cache_size: int = 4096
     database_url: str = "sqlite+aiosqlite:///data/db/core.db"
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    faiss_index_description: str = "SQfp16"
+    faiss_search_parameters: str = ""
+    faiss_min_training_vectors: int = 1000
+    vectorstore_batch_window_ms: float = 5.0
+    vectorstore_batch_max_size: int = 32
     otel_exporter_otlp_endpoint: str = "http://localhost:4317"
     otel_service_name: str = "ai-customer-service-core"
+    otel_sdk_disabled: bool = False
+    # Opt-in: respond before the interaction is saved. Lowers query latency,
+    # but a crash or failed save loses the audit record of an answer the user
+    # already has, and an immediate GET of its interaction_id may return 404.
+    query_persist_in_background: bool = False
+    interaction_batch_max_size: int = 256
+    query_cache_max_entries: int = 1000
+    query_cache_ttl_seconds: float = 300.0
+    query_cache_similarity_threshold: float = 0.97
+    kb_cache_max_entries: int = 1024
+    kb_cache_ttl_seconds: float = 60.0
+    interaction_cache_max_entries: int = 1024
+    interaction_cache_ttl_seconds: float = 300.0
+    interaction_page_cache_max_entries: int = 256
+    interaction_page_cache_ttl_seconds: float = 5.0
 
     model_config = {"env_prefix": "", "case_sensitive": False}
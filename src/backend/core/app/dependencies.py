@@ -2,22 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from app.application.cache.interaction_cache import InteractionCache
+from app.application.cache.knowledge_base_cache import KnowledgeBaseCache
+from app.application.cache.query_cache import QueryCache
 from app.application.use_cases.document_use_case import DocumentUseCase
 from app.application.use_cases.interaction_use_case import InteractionUseCase
 from app.application.use_cases.knowledge_base_use_case import KnowledgeBaseUseCase
-from app.application.use_cases.query_use_case import QueryUseCase
+from app.application.use_cases.query_use_case import QueryUseCase, drain_pending_saves
 from app.config import Settings
 from app.domain.services.grounding_service import GroundingService
 from app.infrastructure.llm.ollama import OllamaProvider
+from app.infrastructure.persistence.batching import BatchingInteractionStore
 from app.infrastructure.persistence.sqlite_store import (
-    Base,
     SqliteDocumentStore,
     SqliteInteractionStore,
+    create_engines,
+    create_schema,
 )
+from app.infrastructure.vectorstore.batching import BatchingVectorStore
 from app.infrastructure.vectorstore.faiss_adapter import FaissVectorStore
 
 _settings = Settings()
@@ -25,60 +33,140 @@ _settings = Settings()
 # Database engine and session factory
 _db_dir = Path(_settings.database_url.replace("sqlite+aiosqlite:///", "")).parent
 _db_dir.mkdir(parents=True, exist_ok=True)
-_engine = create_async_engine(_settings.database_url, echo=False)
+_engine, _read_engine = create_engines(
+    _settings.database_url,
+    pool_size=_settings.database_pool_size,
+    max_overflow=_settings.database_max_overflow,
+)
 _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
+_read_session_factory = async_sessionmaker(_read_engine, expire_on_commit=False)
 
 # Real adapter singletons
-_llm = OllamaProvider(base_url=_settings.ollama_base_url, model=_settings.ollama_model)
-_vectorstore = FaissVectorStore(dimension=768)
-_document_store = SqliteDocumentStore(_session_factory)
-_interaction_store = SqliteInteractionStore(_session_factory)
+_llm = OllamaProvider(
+    base_url=_settings.ollama_base_url,
+    model=_settings.ollama_model,
+    keep_alive=_settings.ollama_keep_alive,
+    draft_model=_settings.ollama_draft_model,
+    embed_cache_size=_settings.ollama_embed_cache_size,
+)
+_vectorstore = BatchingVectorStore(
+    FaissVectorStore(
+        dimension=768,
+        index_description=_settings.faiss_index_description,
+        search_parameters=_settings.faiss_search_parameters,
+        min_training_vectors=_settings.faiss_min_training_vectors,
+    ),
+    batch_window_ms=_settings.vectorstore_batch_window_ms,
+    max_batch_size=_settings.vectorstore_batch_max_size,
+)
+_document_store = SqliteDocumentStore(_session_factory, _read_session_factory)
+_interaction_store = BatchingInteractionStore(
+    SqliteInteractionStore(_session_factory, _read_session_factory),
+    max_batch_size=_settings.interaction_batch_max_size,
+)
 _grounding_service = GroundingService()
+_query_cache = QueryCache(
+    max_entries=_settings.query_cache_max_entries,
+    ttl_seconds=_settings.query_cache_ttl_seconds,
+    similarity_threshold=_settings.query_cache_similarity_threshold,
+)
+_kb_cache = KnowledgeBaseCache(
+    max_entries=_settings.kb_cache_max_entries,
+    ttl_seconds=_settings.kb_cache_ttl_seconds,
+)
+_interaction_cache = InteractionCache(
+    max_entries=_settings.interaction_cache_max_entries,
+    ttl_seconds=_settings.interaction_cache_ttl_seconds,
+    max_pages=_settings.interaction_page_cache_max_entries,
+    page_ttl_seconds=_settings.interaction_page_cache_ttl_seconds,
+)
+_query_use_case = QueryUseCase(
+    _llm,
+    _vectorstore,
+    _interaction_store,
+    _grounding_service,
+    cache=_query_cache,
+    persist_in_background=_settings.query_persist_in_background,
+    interaction_cache=_interaction_cache,
+)
+_kb_use_case = KnowledgeBaseUseCase(
+    _document_store, cache=_kb_cache, query_cache=_query_cache
+)
+_document_use_case = DocumentUseCase(_document_store, _vectorstore, query_cache=_query_cache)
+_interaction_use_case = InteractionUseCase(_interaction_store, cache=_interaction_cache)
 
 
 async def init_db() -> None:
-    """Create database tables if they don't exist."""
+    """Create database tables if they don't exist and warm the connection pool."""
     async with _engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_schema)
+    await _warm_pool()
+
+
+async def _warm_pool() -> None:
+    """Open ``pool_size`` read connections up front so requests never pay the connect cost.
+
+    The connections are checked out concurrently, so each one is a distinct
+    pooled connection, and returned to the pool when done. The writer's
+    single connection is already open from creating the schema.
+    """
+
+    async def _ping() -> None:
+        async with _read_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(_settings.database_pool_size)))
+
+
+async def warmup() -> None:
+    """Preload the LLM so the first query does not pay the model load time."""
+    await _llm.warmup()
 
 
 async def shutdown() -> None:
     """Clean up resources on application shutdown."""
+    await drain_pending_saves()
+    await _interaction_store.close()
     await _llm.close()
+    await _vectorstore.close()
     await _engine.dispose()
+    if _read_engine is not _engine:
+        await _read_engine.dispose()
 
 
-def get_query_use_case() -> QueryUseCase:
+# The getters are async so FastAPI calls them on the event loop; sync
+# dependencies are run in the threadpool on every request.
+async def get_query_use_case() -> QueryUseCase:
     """Get query use case with dependencies.
 
     Returns:
-        Configured query use case instance.
+        Shared query use case instance.
     """
-    return QueryUseCase(_llm, _vectorstore, _interaction_store, _grounding_service)
+    return _query_use_case
 
 
-def get_kb_use_case() -> KnowledgeBaseUseCase:
+async def get_kb_use_case() -> KnowledgeBaseUseCase:
     """Get knowledge base use case with dependencies.
 
     Returns:
-        Configured knowledge base use case instance.
+        Shared knowledge base use case instance.
     """
-    return KnowledgeBaseUseCase(_document_store)
+    return _kb_use_case
 
 
-def get_document_use_case() -> DocumentUseCase:
+async def get_document_use_case() -> DocumentUseCase:
     """Get document use case with dependencies.
 
     Returns:
-        Configured document use case instance.
+        Shared document use case instance.
     """
-    return DocumentUseCase(_document_store, _vectorstore)
+    return _document_use_case
 
 
-def get_interaction_use_case() -> InteractionUseCase:
+async def get_interaction_use_case() -> InteractionUseCase:
     """Get interaction use case with dependencies.
 
     Returns:
-        Configured interaction use case instance.
+        Shared interaction use case instance.
     """
-    return InteractionUseCase(_interaction_store)
+    return _interaction_use_case
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from app.domain.models.citation import Citation
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GroundingDecision:
     """Value object representing the result of grounding evaluation.
 
@@ -30,7 +30,7 @@ class GroundingDecision:
     supporting_chunks: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueryResult:
     """Value object representing the result of a knowledge base query.
 
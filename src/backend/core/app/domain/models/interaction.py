@@ -21,7 +21,7 @@ class InteractionStatus(StrEnum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Interaction:
     """Entity representing a question-answer interaction.
 
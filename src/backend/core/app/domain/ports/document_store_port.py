@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from app.domain.models.document import Document, DocumentStatus
 from app.domain.models.knowledge_base import KnowledgeBase
@@ -44,6 +45,17 @@ class DocumentStorePort(ABC):
         """
         ...
 
+    async def count_kbs(self) -> int:
+        """Count knowledge bases.
+
+        The default implementation counts the result of ``list_kbs``;
+        stores backed by a database should count in the query instead.
+
+        Returns:
+            Number of knowledge bases.
+        """
+        return len(await self.list_kbs())
+
     @abstractmethod
     async def delete_kb(self, kb_id: str) -> None:
         """Delete a knowledge base.
@@ -89,6 +101,37 @@ class DocumentStorePort(ABC):
         """
         ...
 
+    async def stream_documents(self, kb_id: str) -> AsyncIterator[Document]:
+        """Iterate over the documents in a knowledge base.
+
+        The default implementation iterates over ``list_documents``;
+        stores backed by a database should stream rows from a cursor
+        so memory stays constant regardless of the row count.
+
+        Args:
+            kb_id: Knowledge base ID.
+
+        Yields:
+            Documents in the knowledge base.
+        """
+        for document in await self.list_documents(kb_id):
+            yield document
+
+    async def count_documents(self) -> int:
+        """Count documents across all knowledge bases.
+
+        The default implementation lists the documents of every knowledge
+        base; stores backed by a database should count in the query
+        instead.
+
+        Returns:
+            Number of documents.
+        """
+        total = 0
+        for kb in await self.list_kbs():
+            total += len(await self.list_documents(kb.id))
+        return total
+
     @abstractmethod
     async def delete_document(self, document_id: str) -> None:
         """Delete a document.
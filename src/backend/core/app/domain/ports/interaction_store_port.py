@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
-from app.domain.models.interaction import Interaction
+from app.domain.models.interaction import Interaction, InteractionStatus
+
+# Page size used by the default count_by_status implementation.
+_COUNT_PAGE_SIZE = 500
 
 
 class InteractionStorePort(ABC):
@@ -22,6 +26,20 @@ class InteractionStorePort(ABC):
         """
         ...
 
+    async def save_many(self, interactions: list[Interaction]) -> list[Interaction]:
+        """Save several interactions.
+
+        The default implementation saves them one at a time; stores backed
+        by a database should write them in a single transaction.
+
+        Args:
+            interactions: Interaction entities to save.
+
+        Returns:
+            Saved interaction entities, in the same order.
+        """
+        return [await self.save(interaction) for interaction in interactions]
+
     @abstractmethod
     async def get(self, interaction_id: str) -> Interaction | None:
         """Retrieve an interaction by ID.
@@ -49,3 +67,41 @@ class InteractionStorePort(ABC):
             List of interactions.
         """
         ...
+
+    async def stream_all(
+        self, kb_id: str | None = None, limit: int = 50, offset: int = 0
+    ) -> AsyncIterator[Interaction]:
+        """Iterate over interactions with optional filtering and pagination.
+
+        The default implementation iterates over ``list_all``; stores
+        backed by a database should stream rows from a cursor so memory
+        stays constant regardless of the row count.
+
+        Args:
+            kb_id: Optional knowledge base ID to filter by.
+            limit: Maximum number of results.
+            offset: Number of results to skip.
+
+        Yields:
+            Interactions in the same order as ``list_all``.
+        """
+        for interaction in await self.list_all(kb_id=kb_id, limit=limit, offset=offset):
+            yield interaction
+
+    async def count_by_status(self) -> dict[InteractionStatus, int]:
+        """Count interactions per status.
+
+        The default implementation pages through ``list_all``; stores
+        backed by a database should aggregate in the query instead.
+
+        Returns:
+            Mapping from status to number of interactions; statuses
+            without interactions may be absent.
+        """
+        counts: dict[InteractionStatus, int] = {}
+        offset = 0
+        while page := await self.list_all(limit=_COUNT_PAGE_SIZE, offset=offset):
+            for interaction in page:
+                counts[interaction.status] = counts.get(interaction.status, 0) + 1
+            offset += len(page)
+        return counts
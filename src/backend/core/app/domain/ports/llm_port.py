@@ -9,18 +9,46 @@ class LLMPort(ABC):
     """Abstract interface for language model providers."""
 
     @abstractmethod
-    async def generate(self, prompt: str, context: str) -> str:
+    async def generate(
+        self, prompt: str, context: str, system_prompt: str | None = None
+    ) -> str:
         """Generate text based on prompt and context.
 
+        Implementations should place ``system_prompt`` first and ``context``
+        before ``prompt`` so that requests sharing the same instructions and
+        context share a prompt prefix.
+
         Args:
             prompt: The instruction prompt for the LLM.
             context: The contextual information to ground the response.
+            system_prompt: Optional constant instructions sent ahead of
+                the context, e.g. as the model's system message.
 
         Returns:
             Generated text response.
         """
         ...
 
+    async def generate_draft(
+        self, prompt: str, context: str, system_prompt: str | None = None
+    ) -> str | None:
+        """Generate a quick draft answer with a smaller, faster model.
+
+        Drafts enable speculative generation: a grounded draft is used as
+        the answer and the full generation is abandoned. The default
+        implementation has no draft model and returns None.
+
+        Args:
+            prompt: The instruction prompt for the LLM.
+            context: The contextual information to ground the response.
+            system_prompt: Optional constant instructions sent ahead of
+                the context.
+
+        Returns:
+            Draft text response, or None if no draft model is available.
+        """
+        return None
+
     @abstractmethod
     async def embed(self, text: str) -> list[float]:
         """Generate embedding vector for the given text.
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from app.domain.models.chunk import Chunk
 from app.domain.models.grounding import GroundingDecision
 
@@ -12,6 +14,11 @@ _STOPWORDS = frozenset({
     "can", "could", "should", "may", "might", "i", "you", "we", "they", "he", "she",
 })
 
+# Number of distinct chunk texts whose lowercased form and word set are
+# kept. The same chunks are retrieved again and again for a knowledge base,
+# so they are prepared once instead of on every query.
+_CHUNK_CACHE_SIZE = 1024
+
 
 class GroundingService:
     """Service to evaluate if LLM-generated answers are grounded in retrieved chunks."""
@@ -21,6 +28,10 @@ class GroundingService:
     ) -> GroundingDecision:
         """Evaluate if the answer is grounded in the provided chunks.
 
+        An answer word counts as found if it occurs anywhere in a chunk's
+        lowercased text, including inside a longer word ("refund" is found
+        in "refunds").
+
         Args:
             question: The original question.
             answer: The LLM-generated answer.
@@ -36,7 +47,6 @@ class GroundingService:
                 reasoning="No chunks retrieved",
             )
 
-        chunk_text = " ".join(c.content.lower() for c in chunks)
         meaningful_words = set(answer.lower().split()) - _STOPWORDS
 
         if not meaningful_words:
@@ -46,12 +56,28 @@ class GroundingService:
                 reasoning="No meaningful content in answer",
             )
 
-        overlap = sum(1 for w in meaningful_words if w in chunk_text)
-        confidence = overlap / len(meaningful_words)
+        # Words that are whole words of a chunk are found with a set
+        # intersection; only the rest need a substring scan. The result is
+        # the same as testing every word with ``in``.
+        prepared = [_prepared_chunk(chunk.content) for chunk in chunks]
+        found: set[str] = set()
+        for _, chunk_words in prepared:
+            found |= meaningful_words & chunk_words
+        rest = meaningful_words - found
+        if rest:
+            # Words never contain whitespace, so a match in the joined text
+            # is a match inside a single chunk.
+            chunk_text = " ".join(text for text, _ in prepared)
+            found.update(w for w in rest if w in chunk_text)
         supporting = [
-            c.id for c in chunks if any(w in c.content.lower() for w in meaningful_words)
+            chunk.id
+            for chunk, (text, chunk_words) in zip(chunks, prepared, strict=True)
+            if not chunk_words.isdisjoint(found) or any(w in text for w in found)
         ]
 
+        overlap = len(found)
+        confidence = overlap / len(meaningful_words)
+
         return GroundingDecision(
             is_grounded=confidence >= 0.3,
             confidence=confidence,
@@ -61,3 +87,17 @@ class GroundingService:
             ),
             supporting_chunks=supporting,
         )
+
+
+@functools.lru_cache(maxsize=_CHUNK_CACHE_SIZE)
+def _prepared_chunk(content: str) -> tuple[str, frozenset[str]]:
+    """Lowercase chunk content and split it into words, caching by content.
+
+    Args:
+        content: Chunk text.
+
+    Returns:
+        The lowercased text and its set of whitespace-separated words.
+    """
+    text = content.lower()
+    return text, frozenset(text.split())
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
+
 import httpx
+import orjson
 
 from app.domain.ports.llm_port import LLMPort
 
@@ -16,6 +20,10 @@ class OllamaProvider(LLMPort):
     Attributes:
         _base_url: Base URL of the Ollama API endpoint.
         _model: Model name to use for generation and embedding.
+        _draft_model: Optional smaller model used for speculative drafts.
+        _keep_alive: How long Ollama keeps the model (and its KV cache) loaded.
+        _embed_cache: LRU cache of embeddings keyed by a digest of model and text.
+        _embed_cache_size: Maximum number of cached embeddings (0 disables caching).
         _client: Async HTTP client for API requests.
     """
 
@@ -23,23 +31,49 @@ class OllamaProvider(LLMPort):
         self,
         base_url: str = "http://localhost:11434",
         model: str = "llama3.2",
+        keep_alive: str = "30m",
+        draft_model: str | None = None,
+        embed_cache_size: int = 4096,
     ) -> None:
         """Initialize Ollama provider.
 
         Args:
             base_url: Base URL of the Ollama API endpoint.
             model: Model name to use for generation and embedding.
+            keep_alive: Duration Ollama keeps the model loaded after a request
+                (e.g. "30m"). Keeping it resident lets consecutive requests
+                reuse the KV cache of a shared prompt prefix.
+            draft_model: Optional smaller model for speculative drafts.
+                Drafting is disabled when None.
+            embed_cache_size: Maximum number of embeddings kept in memory so
+                repeated texts (recurring questions, boilerplate chunks) skip
+                the HTTP round-trip. Set to 0 to disable.
         """
         self._base_url = base_url.rstrip("/")
         self._model = model
-        self._client = httpx.AsyncClient(base_url=self._base_url, timeout=120.0)
+        self._keep_alive = keep_alive
+        self._draft_model = draft_model
+        self._embed_cache: OrderedDict[bytes, list[float]] = OrderedDict()
+        self._embed_cache_size = embed_cache_size
+        # Generation can take minutes, but an unreachable server should fail
+        # fast. The pool keeps enough idle connections for bursts of
+        # concurrent embedding requests during ingestion.
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=httpx.Timeout(120.0, connect=5.0),
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+        )
 
-    async def generate(self, prompt: str, context: str) -> str:
+    async def generate(
+        self, prompt: str, context: str, system_prompt: str | None = None
+    ) -> str:
         """Generate text based on prompt and context.
 
         Args:
             prompt: The instruction prompt for the LLM.
             context: The contextual information to ground the response.
+            system_prompt: Optional constant instructions, sent as Ollama's
+                ``system`` message so they form the head of every prompt.
 
         Returns:
             Generated text response.
@@ -47,17 +81,59 @@ class OllamaProvider(LLMPort):
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        full_prompt = f"{context}\n\n{prompt}"
-        response = await self._client.post(
-            "/api/generate",
-            json={
-                "model": self._model,
-                "prompt": full_prompt,
-                "stream": False,
-            },
-        )
+        return await self._complete(self._model, prompt, context, system_prompt)
+
+    async def generate_draft(
+        self, prompt: str, context: str, system_prompt: str | None = None
+    ) -> str | None:
+        """Generate a draft answer with the configured draft model.
+
+        Args:
+            prompt: The instruction prompt for the LLM.
+            context: The contextual information to ground the response.
+            system_prompt: Optional constant instructions.
+
+        Returns:
+            Draft text response, or None if no draft model is configured.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        if self._draft_model is None:
+            return None
+        return await self._complete(self._draft_model, prompt, context, system_prompt)
+
+    async def _complete(
+        self, model: str, prompt: str, context: str, system_prompt: str | None
+    ) -> str:
+        """Run a non-streaming completion against the given model.
+
+        Args:
+            model: Ollama model name.
+            prompt: The instruction prompt for the LLM.
+            context: The contextual information to ground the response.
+            system_prompt: Optional system message.
+
+        Returns:
+            Generated text response.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        # Context leads so repeated retrievals share a prefix that Ollama
+        # can serve from the KV cache instead of prefilling it again.
+        full_prompt = f"Context:\n{context}\n\n{prompt}"
+        payload: dict[str, object] = {
+            "model": model,
+            "prompt": full_prompt,
+            "stream": False,
+            "keep_alive": self._keep_alive,
+        }
+        if system_prompt is not None:
+            payload["system"] = system_prompt
+        response = await self._client.post("/api/generate", json=payload)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         return data["response"]
 
     async def embed(self, text: str) -> list[float]:
@@ -72,6 +148,10 @@ class OllamaProvider(LLMPort):
         Raises:
             httpx.HTTPError: If the API request fails.
         """
+        key = self._embed_key(text)
+        cached = self._cached_embedding(key)
+        if cached is not None:
+            return cached
         response = await self._client.post(
             "/api/embed",
             json={
@@ -80,9 +160,68 @@ class OllamaProvider(LLMPort):
             },
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         # Ollama returns {"embeddings": [[...]]}
-        return data["embeddings"][0]
+        embedding = data["embeddings"][0]
+        self._cache_embedding(key, embedding)
+        return embedding
+
+    def _embed_key(self, text: str) -> bytes:
+        """Build the embedding cache key for a text under the current model.
+
+        Args:
+            text: Input text.
+
+        Returns:
+            SHA-256 digest of the model name and the text.
+        """
+        return hashlib.sha256(f"{self._model}\0{text}".encode()).digest()
+
+    def _cached_embedding(self, key: bytes) -> list[float] | None:
+        """Look up an embedding and mark it as recently used.
+
+        Args:
+            key: Embedding cache key.
+
+        Returns:
+            Cached embedding, or None on a miss.
+        """
+        embedding = self._embed_cache.get(key)
+        if embedding is not None:
+            self._embed_cache.move_to_end(key)
+        return embedding
+
+    def _cache_embedding(self, key: bytes, embedding: list[float]) -> None:
+        """Store an embedding, evicting the least recently used ones.
+
+        Args:
+            key: Embedding cache key.
+            embedding: Embedding vector to cache.
+        """
+        if self._embed_cache_size <= 0:
+            return
+        self._embed_cache[key] = embedding
+        self._embed_cache.move_to_end(key)
+        while len(self._embed_cache) > self._embed_cache_size:
+            self._embed_cache.popitem(last=False)
+
+    async def warmup(self) -> None:
+        """Load the model into Ollama's memory ahead of the first query.
+
+        Ollama loads a model lazily on its first request, which otherwise
+        adds the model load time to the first embedding of the first query.
+        A request without a prompt only loads the model. Failures are
+        ignored since Ollama may still be starting; the first real request
+        then loads the model as before.
+        """
+        try:
+            response = await self._client.post(
+                "/api/generate",
+                json={"model": self._model, "keep_alive": self._keep_alive},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return
 
     async def close(self) -> None:
         """Close the HTTP client connection.
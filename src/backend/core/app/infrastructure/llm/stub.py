@@ -8,12 +8,15 @@ from app.domain.ports.llm_port import LLMPort
 class StubLLMProvider(LLMPort):
     """Stub implementation of LLM provider for development."""
 
-    async def generate(self, prompt: str, context: str) -> str:
+    async def generate(
+        self, prompt: str, context: str, system_prompt: str | None = None
+    ) -> str:
         """Generate a stub response.
 
         Args:
             prompt: The instruction prompt.
             context: The contextual information.
+            system_prompt: Optional constant instructions.
 
         Returns:
             Stub response message.
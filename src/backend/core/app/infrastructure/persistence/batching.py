@@ -0,0 +1,168 @@
+"""Group-commit wrapper for the interaction store."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from app.domain.models.interaction import Interaction, InteractionStatus
+from app.domain.ports.interaction_store_port import InteractionStorePort
+
+
+@dataclass
+class _PendingSave:
+    """A queued interaction write awaiting its batch."""
+
+    interaction: Interaction
+    future: asyncio.Future[Interaction]
+
+
+class BatchingInteractionStore(InteractionStorePort):
+    """Interaction store that commits concurrent saves together.
+
+    Every query saves one interaction, and committing each in its own
+    transaction costs one WAL commit per query. Saves are queued instead,
+    and a background task writes whatever has queued up with a single
+    ``save_many`` call. It does not wait for a batch to fill: a lone save
+    is written immediately, and saves arriving while a write is in
+    progress form the next batch. Reads go straight to the wrapped store.
+
+    Attributes:
+        _inner: Wrapped interaction store.
+        _max_batch_size: Maximum number of interactions per transaction.
+        _queue: Pending saves.
+        _worker: Background task draining the queue.
+    """
+
+    def __init__(self, inner: InteractionStorePort, max_batch_size: int = 256) -> None:
+        """Initialize the batching interaction store.
+
+        Args:
+            inner: Interaction store to wrap.
+            max_batch_size: Maximum number of interactions per transaction.
+        """
+        self._inner = inner
+        self._max_batch_size = max_batch_size
+        self._queue: asyncio.Queue[_PendingSave] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
+
+    async def save(self, interaction: Interaction) -> Interaction:
+        """Queue an interaction and wait for its batch to be committed.
+
+        Args:
+            interaction: Interaction entity to save.
+
+        Returns:
+            Saved interaction entity.
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future: asyncio.Future[Interaction] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_PendingSave(interaction, future))
+        return await future
+
+    async def save_many(self, interactions: list[Interaction]) -> list[Interaction]:
+        """Save several interactions in one transaction of the wrapped store.
+
+        Args:
+            interactions: Interaction entities to save.
+
+        Returns:
+            Saved interaction entities, in the same order.
+        """
+        return await self._inner.save_many(interactions)
+
+    async def get(self, interaction_id: str) -> Interaction | None:
+        """Retrieve an interaction by ID.
+
+        Args:
+            interaction_id: Interaction ID.
+
+        Returns:
+            Interaction entity if found, None otherwise.
+        """
+        return await self._inner.get(interaction_id)
+
+    async def list_all(
+        self, kb_id: str | None = None, limit: int = 50, offset: int = 0
+    ) -> list[Interaction]:
+        """List interactions with optional filtering and pagination.
+
+        Args:
+            kb_id: Optional knowledge base ID to filter by.
+            limit: Maximum number of results.
+            offset: Number of results to skip.
+
+        Returns:
+            List of interactions ordered by creation time descending.
+        """
+        return await self._inner.list_all(kb_id=kb_id, limit=limit, offset=offset)
+
+    async def stream_all(
+        self, kb_id: str | None = None, limit: int = 50, offset: int = 0
+    ) -> AsyncIterator[Interaction]:
+        """Stream interactions from the wrapped store.
+
+        Args:
+            kb_id: Optional knowledge base ID to filter by.
+            limit: Maximum number of results.
+            offset: Number of results to skip.
+
+        Yields:
+            Interactions ordered by creation time descending.
+        """
+        async for interaction in self._inner.stream_all(kb_id=kb_id, limit=limit, offset=offset):
+            yield interaction
+
+    async def count_by_status(self) -> dict[InteractionStatus, int]:
+        """Count interactions per status.
+
+        Returns:
+            Mapping from status to number of interactions.
+        """
+        return await self._inner.count_by_status()
+
+    async def close(self) -> None:
+        """Stop the background batching task.
+
+        This method should be called during application shutdown, after
+        pending saves have been drained.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    async def _run(self) -> None:
+        """Collect queued saves into batches and write them."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await self._execute(batch)
+
+    async def _execute(self, batch: list[_PendingSave]) -> None:
+        """Write a batch in one transaction and resolve its futures.
+
+        If the transaction fails, the interactions are retried one by one
+        so that a single bad row only fails its own save.
+
+        Args:
+            batch: Saves collected for this batch.
+        """
+        pending = [p for p in batch if not p.future.done()]
+        if not pending:
+            return
+        try:
+            await self._inner.save_many([p.interaction for p in pending])
+        except Exception as exc:
+            if len(pending) == 1:
+                if not pending[0].future.done():
+                    pending[0].future.set_exception(exc)
+                return
+            for p in pending:
+                await self._execute([p])
+            return
+        for p in pending:
+            if not p.future.done():
+                p.future.set_result(p.interaction)
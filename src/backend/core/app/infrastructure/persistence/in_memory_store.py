@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import bisect
+import itertools
+from collections import Counter, defaultdict
+
 from app.domain.models.document import Document, DocumentStatus
-from app.domain.models.interaction import Interaction
+from app.domain.models.interaction import Interaction, InteractionStatus
 from app.domain.models.knowledge_base import KnowledgeBase
 from app.domain.ports.document_store_port import DocumentStorePort
 from app.domain.ports.interaction_store_port import InteractionStorePort
 
 
 class InMemoryDocumentStore(DocumentStorePort):
-    """In-memory implementation of document store for development."""
+    """In-memory implementation of document store for development.
+
+    Document IDs are also indexed per knowledge base, so listing or deleting
+    a knowledge base's documents only touches that knowledge base.
+    """
 
     def __init__(self) -> None:
         """Initialize the in-memory document store."""
         self._kbs: dict[str, KnowledgeBase] = {}
         self._documents: dict[str, Document] = {}
+        # kb_id -> document IDs; dict keys keep save order, unlike a set.
+        self._docs_by_kb: defaultdict[str, dict[str, None]] = defaultdict(dict)
 
     async def create_kb(self, kb: KnowledgeBase) -> KnowledgeBase:
         """Create a new knowledge base."""
@@ -30,14 +40,23 @@ class InMemoryDocumentStore(DocumentStorePort):
         """List all knowledge bases."""
         return list(self._kbs.values())
 
+    async def count_kbs(self) -> int:
+        """Count knowledge bases."""
+        return len(self._kbs)
+
     async def delete_kb(self, kb_id: str) -> None:
         """Delete a knowledge base."""
         self._kbs.pop(kb_id, None)
-        self._documents = {k: v for k, v in self._documents.items() if v.kb_id != kb_id}
+        for document_id in self._docs_by_kb.pop(kb_id, {}):
+            self._documents.pop(document_id, None)
 
     async def save_document(self, document: Document) -> Document:
         """Save a document entity."""
+        previous = self._documents.get(document.id)
+        if previous is not None and previous.kb_id != document.kb_id:
+            self._docs_by_kb[previous.kb_id].pop(document.id, None)
         self._documents[document.id] = document
+        self._docs_by_kb[document.kb_id][document.id] = None
         return document
 
     async def get_document(self, document_id: str) -> Document | None:
@@ -46,11 +65,17 @@ class InMemoryDocumentStore(DocumentStorePort):
 
     async def list_documents(self, kb_id: str) -> list[Document]:
         """List all documents in a knowledge base."""
-        return [d for d in self._documents.values() if d.kb_id == kb_id]
+        return [self._documents[i] for i in self._docs_by_kb.get(kb_id, ())]
+
+    async def count_documents(self) -> int:
+        """Count documents across all knowledge bases."""
+        return len(self._documents)
 
     async def delete_document(self, document_id: str) -> None:
         """Delete a document."""
-        self._documents.pop(document_id, None)
+        document = self._documents.pop(document_id, None)
+        if document is not None:
+            self._docs_by_kb[document.kb_id].pop(document_id, None)
 
     async def update_document_status(
         self, document_id: str, status: DocumentStatus, chunks_count: int = 0
@@ -62,15 +87,43 @@ class InMemoryDocumentStore(DocumentStorePort):
             doc.chunks_count = chunks_count
 
 
+# Index entry: (created_at timestamp, negated save sequence, interaction ID).
+# Indexes are sorted ascending and read from the end, newest first; negating
+# the sequence keeps interactions with equal timestamps in save order.
+_IndexEntry = tuple[float, int, str]
+
+
 class InMemoryInteractionStore(InteractionStorePort):
-    """In-memory implementation of interaction store for development."""
+    """In-memory implementation of interaction store for development.
+
+    Interactions are indexed by creation time, globally and per knowledge
+    base, in lists kept sorted on save. Listing the latest page walks the
+    tail of the relevant index instead of sorting every interaction.
+    """
 
     def __init__(self) -> None:
         """Initialize the in-memory interaction store."""
         self._interactions: dict[str, Interaction] = {}
+        self._entries: dict[str, _IndexEntry] = {}
+        self._by_time: list[_IndexEntry] = []
+        self._by_kb: defaultdict[str, list[_IndexEntry]] = defaultdict(list)
+        self._sequence = itertools.count()
 
     async def save(self, interaction: Interaction) -> Interaction:
         """Save an interaction."""
+        entry = self._entries.get(interaction.id)
+        if entry is not None:
+            _remove(self._by_time, entry)
+            _remove(self._by_kb[self._interactions[interaction.id].kb_id], entry)
+            sequence = -entry[1]
+        else:
+            sequence = next(self._sequence)
+        created_at = interaction.created_at
+        timestamp = created_at.timestamp() if created_at is not None else float("-inf")
+        entry = (timestamp, -sequence, interaction.id)
+        self._entries[interaction.id] = entry
+        bisect.insort(self._by_time, entry)
+        bisect.insort(self._by_kb[interaction.kb_id], entry)
         self._interactions[interaction.id] = interaction
         return interaction
 
@@ -82,8 +135,23 @@ class InMemoryInteractionStore(InteractionStorePort):
         self, kb_id: str | None = None, limit: int = 50, offset: int = 0
     ) -> list[Interaction]:
         """List interactions with optional filtering and pagination."""
-        items = list(self._interactions.values())
-        if kb_id:
-            items = [i for i in items if i.kb_id == kb_id]
-        items.sort(key=lambda i: i.created_at or "", reverse=True)
-        return items[offset : offset + limit]
+        index = self._by_kb.get(kb_id, []) if kb_id else self._by_time
+        stop = len(index) - offset
+        if stop <= 0 or limit <= 0:
+            return []
+        page = index[max(stop - limit, 0) : stop]
+        return [self._interactions[entry[2]] for entry in reversed(page)]
+
+    async def count_by_status(self) -> dict[InteractionStatus, int]:
+        """Count interactions per status."""
+        return dict(Counter(i.status for i in self._interactions.values()))
+
+
+def _remove(index: list[_IndexEntry], entry: _IndexEntry) -> None:
+    """Remove an entry from a sorted index.
+
+    Args:
+        index: Sorted index list.
+        entry: Entry known to be present in ``index``.
+    """
+    del index[bisect.bisect_left(index, entry)]
@@ -2,12 +2,35 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
-
-from sqlalchemy import Column, DateTime, Integer, String, Text, select
+from typing import Any
+
+import orjson
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Index,
+    Integer,
+    Row,
+    Select,
+    String,
+    Text,
+    event,
+    func,
+    select,
+)
 from sqlalchemy import delete as sa_delete
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import insert as sa_insert
+from sqlalchemy import update as sa_update
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from app.domain.models.citation import Citation
@@ -17,6 +40,87 @@ from app.domain.models.knowledge_base import KnowledgeBase
 from app.domain.ports.document_store_port import DocumentStorePort
 from app.domain.ports.interaction_store_port import InteractionStorePort
 
+# Applied to every new connection. WAL lets readers proceed while a write is
+# in progress, and with synchronous=NORMAL a commit no longer waits for an
+# fsync (durability is kept across application crashes, only a power loss
+# can drop the last commits). The rest keep temp tables and a 64 MiB page
+# cache in memory and memory-map up to 256 MiB of the database file.
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def create_engines(
+    url: str, pool_size: int = 5, max_overflow: int = 10
+) -> tuple[AsyncEngine, AsyncEngine]:
+    """Create the writer and reader engines for a SQLite database.
+
+    SQLite admits one writer at a time. The writer engine therefore holds
+    a single connection, so concurrent writes queue in the pool instead of
+    retrying against SQLite's lock. Reads go through a separate pool of
+    read-only connections, which WAL lets run alongside the writer.
+
+    In-memory databases cannot be shared between engines, so a single
+    engine serves both roles.
+
+    Args:
+        url: SQLAlchemy database URL.
+        pool_size: Number of pooled read connections.
+        max_overflow: Number of read connections allowed beyond ``pool_size``.
+
+    Returns:
+        The writer engine and the reader engine, both tuned with
+        ``configure_sqlite``.
+    """
+    sa_url = make_url(url)
+    if _is_in_memory(sa_url):
+        engine = create_async_engine(url, pool_size=pool_size, max_overflow=max_overflow)
+        configure_sqlite(engine)
+        return engine, engine
+
+    writer = create_async_engine(sa_url, pool_size=1, max_overflow=0)
+    configure_sqlite(writer)
+    read_url = sa_url.set(
+        database=f"file:{sa_url.database}",
+        query={**sa_url.query, "mode": "ro", "uri": "true"},
+    )
+    reader = create_async_engine(read_url, pool_size=pool_size, max_overflow=max_overflow)
+    configure_sqlite(reader, read_only=True)
+    return writer, reader
+
+
+def configure_sqlite(engine: AsyncEngine, read_only: bool = False) -> None:
+    """Register a connect hook that tunes SQLite connections of an engine.
+
+    In-memory databases keep their default journal mode since WAL needs a
+    database file. Read-only connections leave the journal mode to the
+    writer, which switches the database file to WAL.
+
+    Args:
+        engine: Async engine backed by SQLite.
+        read_only: Whether the engine opens read-only connections.
+    """
+    set_wal = not read_only and not _is_in_memory(engine.url)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            if set_wal:
+                cursor.execute("PRAGMA journal_mode=WAL")
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def _is_in_memory(url: URL) -> bool:
+    """Return whether a SQLite URL points to an in-memory database."""
+    return url.database in (None, "", ":memory:")
+
 
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base for all ORM models."""
@@ -42,13 +146,15 @@ class DocumentRow(Base):
     __tablename__ = "documents"
 
     id = Column(String, primary_key=True)
-    kb_id = Column(String, nullable=False, index=True)
+    kb_id = Column(String, nullable=False)
     filename = Column(String, nullable=False)
     content_hash = Column(String, nullable=False)
     status = Column(String, nullable=False, default="pending")
     chunks_count = Column(Integer, default=0)
     uploaded_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (Index("ix_documents_kb_uploaded", "kb_id", "uploaded_at"),)
+
 
 class InteractionRow(Base):
     """Interaction table schema."""
@@ -56,13 +162,35 @@ class InteractionRow(Base):
     __tablename__ = "interactions"
 
     id = Column(String, primary_key=True)
-    kb_id = Column(String, nullable=False, index=True)
+    kb_id = Column(String, nullable=False)
     question = Column(Text, nullable=False)
     answer = Column(Text, nullable=True)
     status = Column(String, nullable=False, default="unknown")
     citations_json = Column(Text, nullable=True)  # JSON array
     created_at = Column(DateTime, nullable=True)
 
+    # Listings filter by knowledge base and page newest first; these let
+    # SQLite walk an index in order instead of sorting every matching row.
+    __table_args__ = (
+        Index("ix_interactions_kb_created", "kb_id", created_at.desc()),
+        Index("ix_interactions_created", created_at.desc()),
+    )
+
+
+def create_schema(connection: Connection) -> None:
+    """Create missing tables and indexes.
+
+    ``create_all`` only emits indexes together with a new table, so indexes
+    added to an existing table are created separately.
+
+    Args:
+        connection: Synchronous connection, e.g. from ``AsyncConnection.run_sync``.
+    """
+    Base.metadata.create_all(connection)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
 
 class SqliteDocumentStore(DocumentStorePort):
     """SQLite implementation of document and knowledge base persistence.
@@ -71,16 +199,24 @@ class SqliteDocumentStore(DocumentStorePort):
     knowledge bases and documents to a SQLite database.
 
     Attributes:
-        _session_factory: SQLAlchemy session factory for database operations.
+        _session_factory: SQLAlchemy session factory for writes.
+        _read_session_factory: SQLAlchemy session factory for reads.
     """
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        read_session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
         """Initialize SQLite document store.
 
         Args:
-            session_factory: SQLAlchemy async session factory.
+            session_factory: SQLAlchemy async session factory used for writes.
+            read_session_factory: Optional session factory for reads, e.g. bound
+                to a read-only engine. Defaults to ``session_factory``.
         """
         self._session_factory = session_factory
+        self._read_session_factory = read_session_factory or session_factory
 
     async def create_kb(self, kb: KnowledgeBase) -> KnowledgeBase:
         """Create a new knowledge base.
@@ -112,17 +248,10 @@ class SqliteDocumentStore(DocumentStorePort):
         Returns:
             Knowledge base entity if found, None otherwise.
         """
-        async with self._session_factory() as session:
-            row = await session.get(KBRow, kb_id)
-            if not row:
-                return None
-            return KnowledgeBase(
-                id=row.id,
-                name=row.name,
-                description=row.description,
-                created_at=row.created_at,
-                updated_at=row.updated_at,
-            )
+        stmt = select(*KBRow.__table__.columns).where(KBRow.id == kb_id)
+        async with self._read_session_factory() as session:
+            row = (await session.execute(stmt)).one_or_none()
+            return _kb_from_row(row) if row is not None else None
 
     async def list_kbs(self) -> list[KnowledgeBase]:
         """List all knowledge bases.
@@ -130,18 +259,18 @@ class SqliteDocumentStore(DocumentStorePort):
         Returns:
             List of all knowledge bases.
         """
-        async with self._session_factory() as session:
-            result = await session.execute(select(KBRow))
-            return [
-                KnowledgeBase(
-                    id=r.id,
-                    name=r.name,
-                    description=r.description,
-                    created_at=r.created_at,
-                    updated_at=r.updated_at,
-                )
-                for r in result.scalars()
-            ]
+        async with self._read_session_factory() as session:
+            result = await session.execute(select(*KBRow.__table__.columns))
+            return [_kb_from_row(row) for row in result.all()]
+
+    async def count_kbs(self) -> int:
+        """Count knowledge bases with a single aggregate query.
+
+        Returns:
+            Number of knowledge bases.
+        """
+        async with self._read_session_factory() as session:
+            return await session.scalar(select(func.count()).select_from(KBRow)) or 0
 
     async def delete_kb(self, kb_id: str) -> None:
         """Delete a knowledge base and all its documents.
@@ -186,19 +315,10 @@ class SqliteDocumentStore(DocumentStorePort):
         Returns:
             Document entity if found, None otherwise.
         """
-        async with self._session_factory() as session:
-            row = await session.get(DocumentRow, document_id)
-            if not row:
-                return None
-            return Document(
-                id=row.id,
-                kb_id=row.kb_id,
-                filename=row.filename,
-                content_hash=row.content_hash,
-                status=DocumentStatus(row.status),
-                chunks_count=row.chunks_count,
-                uploaded_at=row.uploaded_at,
-            )
+        stmt = select(*DocumentRow.__table__.columns).where(DocumentRow.id == document_id)
+        async with self._read_session_factory() as session:
+            row = (await session.execute(stmt)).one_or_none()
+            return _document_from_row(row) if row is not None else None
 
     async def list_documents(self, kb_id: str) -> list[Document]:
         """List all documents in a knowledge base.
@@ -209,20 +329,32 @@ class SqliteDocumentStore(DocumentStorePort):
         Returns:
             List of documents in the knowledge base.
         """
-        async with self._session_factory() as session:
-            result = await session.execute(select(DocumentRow).where(DocumentRow.kb_id == kb_id))
-            return [
-                Document(
-                    id=r.id,
-                    kb_id=r.kb_id,
-                    filename=r.filename,
-                    content_hash=r.content_hash,
-                    status=DocumentStatus(r.status),
-                    chunks_count=r.chunks_count,
-                    uploaded_at=r.uploaded_at,
-                )
-                for r in result.scalars()
-            ]
+        async with self._read_session_factory() as session:
+            result = await session.execute(_list_documents_stmt(kb_id))
+            return [_document_from_row(row) for row in result.all()]
+
+    async def stream_documents(self, kb_id: str) -> AsyncIterator[Document]:
+        """Stream the documents in a knowledge base from a database cursor.
+
+        Args:
+            kb_id: Knowledge base ID.
+
+        Yields:
+            Documents in the knowledge base.
+        """
+        async with self._read_session_factory() as session:
+            rows = await session.stream(_list_documents_stmt(kb_id))
+            async for row in rows:
+                yield _document_from_row(row)
+
+    async def count_documents(self) -> int:
+        """Count documents across all knowledge bases with a single aggregate query.
+
+        Returns:
+            Number of documents.
+        """
+        async with self._read_session_factory() as session:
+            return await session.scalar(select(func.count()).select_from(DocumentRow)) or 0
 
     async def delete_document(self, document_id: str) -> None:
         """Delete a document.
@@ -244,12 +376,14 @@ class SqliteDocumentStore(DocumentStorePort):
             status: New status.
             chunks_count: Number of chunks created from the document.
         """
+        stmt = (
+            sa_update(DocumentRow)
+            .where(DocumentRow.id == document_id)
+            .values(status=status.value, chunks_count=chunks_count)
+        )
         async with self._session_factory() as session:
-            row = await session.get(DocumentRow, document_id)
-            if row:
-                row.status = status.value
-                row.chunks_count = chunks_count
-                await session.commit()
+            await session.execute(stmt)
+            await session.commit()
 
 
 class SqliteInteractionStore(InteractionStorePort):
@@ -259,16 +393,24 @@ class SqliteInteractionStore(InteractionStorePort):
     user interactions and their outcomes.
 
     Attributes:
-        _session_factory: SQLAlchemy session factory for database operations.
+        _session_factory: SQLAlchemy session factory for writes.
+        _read_session_factory: SQLAlchemy session factory for reads.
     """
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        read_session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
         """Initialize SQLite interaction store.
 
         Args:
-            session_factory: SQLAlchemy async session factory.
+            session_factory: SQLAlchemy async session factory used for writes.
+            read_session_factory: Optional session factory for reads, e.g. bound
+                to a read-only engine. Defaults to ``session_factory``.
         """
         self._session_factory = session_factory
+        self._read_session_factory = read_session_factory or session_factory
 
     async def save(self, interaction: Interaction) -> Interaction:
         """Save an interaction.
@@ -279,30 +421,26 @@ class SqliteInteractionStore(InteractionStorePort):
         Returns:
             Saved interaction entity.
         """
-        citations_json = json.dumps(
-            [
-                {
-                    "source_document": c.source_document,
-                    "page": c.page,
-                    "chunk_id": c.chunk_id,
-                    "relevance_score": c.relevance_score,
-                }
-                for c in interaction.citations
-            ]
-        )
+        await self.save_many([interaction])
+        return interaction
+
+    async def save_many(self, interactions: list[Interaction]) -> list[Interaction]:
+        """Save several interactions with one executemany in a single transaction.
+
+        Args:
+            interactions: Interaction entities to save.
+
+        Returns:
+            Saved interaction entities, in the same order.
+        """
+        if not interactions:
+            return interactions
         async with self._session_factory() as session:
-            row = InteractionRow(
-                id=interaction.id,
-                kb_id=interaction.kb_id,
-                question=interaction.question,
-                answer=interaction.answer,
-                status=interaction.status.value,
-                citations_json=citations_json,
-                created_at=interaction.created_at or datetime.now(UTC),
+            await session.execute(
+                sa_insert(InteractionRow), [_interaction_values(i) for i in interactions]
             )
-            session.add(row)
             await session.commit()
-        return interaction
+        return interactions
 
     async def get(self, interaction_id: str) -> Interaction | None:
         """Retrieve an interaction by ID.
@@ -313,20 +451,10 @@ class SqliteInteractionStore(InteractionStorePort):
         Returns:
             Interaction entity if found, None otherwise.
         """
-        async with self._session_factory() as session:
-            row = await session.get(InteractionRow, interaction_id)
-            if not row:
-                return None
-            citations = [Citation(**c) for c in json.loads(row.citations_json or "[]")]
-            return Interaction(
-                id=row.id,
-                kb_id=row.kb_id,
-                question=row.question,
-                answer=row.answer,
-                status=InteractionStatus(row.status),
-                citations=citations,
-                created_at=row.created_at,
-            )
+        stmt = select(*InteractionRow.__table__.columns).where(InteractionRow.id == interaction_id)
+        async with self._read_session_factory() as session:
+            row = (await session.execute(stmt)).one_or_none()
+            return _interaction_from_row(row) if row is not None else None
 
     async def list_all(
         self, kb_id: str | None = None, limit: int = 50, offset: int = 0
@@ -341,29 +469,160 @@ class SqliteInteractionStore(InteractionStorePort):
         Returns:
             List of interactions ordered by creation time descending.
         """
-        async with self._session_factory() as session:
-            stmt = (
-                select(InteractionRow)
-                .order_by(InteractionRow.created_at.desc())
-                .offset(offset)
-                .limit(limit)
-            )
-            if kb_id:
-                stmt = stmt.where(InteractionRow.kb_id == kb_id)
+        async with self._read_session_factory() as session:
+            result = await session.execute(_list_interactions_stmt(kb_id, limit, offset))
+            return [_interaction_from_row(row) for row in result.all()]
+
+    async def stream_all(
+        self, kb_id: str | None = None, limit: int = 50, offset: int = 0
+    ) -> AsyncIterator[Interaction]:
+        """Stream interactions from a database cursor.
+
+        Args:
+            kb_id: Optional knowledge base ID to filter by.
+            limit: Maximum number of results.
+            offset: Number of results to skip.
+
+        Yields:
+            Interactions ordered by creation time descending.
+        """
+        async with self._read_session_factory() as session:
+            rows = await session.stream(_list_interactions_stmt(kb_id, limit, offset))
+            async for row in rows:
+                yield _interaction_from_row(row)
+
+    async def count_by_status(self) -> dict[InteractionStatus, int]:
+        """Count interactions per status with a single grouped query.
+
+        Returns:
+            Mapping from status to number of interactions; statuses
+            without interactions are absent.
+        """
+        stmt = select(InteractionRow.status, func.count()).group_by(InteractionRow.status)
+        async with self._read_session_factory() as session:
             result = await session.execute(stmt)
+            return {InteractionStatus(status): count for status, count in result.tuples()}
 
-            interactions = []
-            for row in result.scalars():
-                citations = [Citation(**c) for c in json.loads(row.citations_json or "[]")]
-                interactions.append(
-                    Interaction(
-                        id=row.id,
-                        kb_id=row.kb_id,
-                        question=row.question,
-                        answer=row.answer,
-                        status=InteractionStatus(row.status),
-                        citations=citations,
-                        created_at=row.created_at,
-                    )
-                )
-            return interactions
+
+def _interaction_values(interaction: Interaction) -> dict[str, Any]:
+    """Build the column values of an interaction row.
+
+    Args:
+        interaction: Interaction entity.
+
+    Returns:
+        Mapping from column name to value.
+    """
+    return {
+        "id": interaction.id,
+        "kb_id": interaction.kb_id,
+        "question": interaction.question,
+        "answer": interaction.answer,
+        "status": interaction.status.value,
+        # orjson serializes the citation dataclasses natively. The column
+        # stays TEXT so existing databases keep working without a migration.
+        "citations_json": orjson.dumps(interaction.citations).decode(),
+        "created_at": interaction.created_at or datetime.now(UTC),
+    }
+
+
+def _list_documents_stmt(kb_id: str) -> Select[Any]:
+    """Build the query listing the documents of a knowledge base.
+
+    Args:
+        kb_id: Knowledge base ID.
+
+    Returns:
+        Select statement ordered by upload time.
+    """
+    return (
+        select(*DocumentRow.__table__.columns)
+        .where(DocumentRow.kb_id == kb_id)
+        .order_by(DocumentRow.uploaded_at)
+    )
+
+
+def _list_interactions_stmt(kb_id: str | None, limit: int, offset: int) -> Select[Any]:
+    """Build the paginated interaction listing query.
+
+    Args:
+        kb_id: Optional knowledge base ID to filter by.
+        limit: Maximum number of results.
+        offset: Number of results to skip.
+
+    Returns:
+        Select statement ordered by creation time descending.
+    """
+    stmt = (
+        select(*InteractionRow.__table__.columns)
+        .order_by(InteractionRow.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    if kb_id:
+        stmt = stmt.where(InteractionRow.kb_id == kb_id)
+    return stmt
+
+
+# Read paths select table columns rather than ORM entities: the rows are
+# converted to domain models straight away, so hydrating mapped objects and
+# tracking them in the session identity map would be wasted work.
+
+
+def _kb_from_row(row: Row[Any]) -> KnowledgeBase:
+    """Convert a knowledge base row into a domain entity.
+
+    Args:
+        row: Row of knowledge base columns.
+
+    Returns:
+        Knowledge base entity.
+    """
+    return KnowledgeBase(
+        id=row.id,
+        name=row.name,
+        description=row.description,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+def _document_from_row(row: Row[Any]) -> Document:
+    """Convert a document row into a domain entity.
+
+    Args:
+        row: Row of document columns.
+
+    Returns:
+        Document entity.
+    """
+    return Document(
+        id=row.id,
+        kb_id=row.kb_id,
+        filename=row.filename,
+        content_hash=row.content_hash,
+        status=DocumentStatus(row.status),
+        chunks_count=row.chunks_count,
+        uploaded_at=row.uploaded_at,
+    )
+
+
+def _interaction_from_row(row: Row[Any]) -> Interaction:
+    """Convert an interaction row into a domain entity.
+
+    Args:
+        row: Row of interaction columns.
+
+    Returns:
+        Interaction entity with decoded citations.
+    """
+    citations = [Citation(**c) for c in orjson.loads(row.citations_json or "[]")]
+    return Interaction(
+        id=row.id,
+        kb_id=row.kb_id,
+        question=row.question,
+        answer=row.answer,
+        status=InteractionStatus(row.status),
+        citations=citations,
+        created_at=row.created_at,
+    )
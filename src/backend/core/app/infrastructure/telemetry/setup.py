@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -9,6 +11,15 @@ from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
+# Span export tuning. The larger queue absorbs bursts without dropping
+# spans, and shorter, larger batches drain it before it fills up. The
+# export timeout keeps a stalled collector from holding the export
+# thread for the default 30 s.
+_MAX_QUEUE_SIZE = 8192
+_MAX_EXPORT_BATCH_SIZE = 1024
+_SCHEDULE_DELAY_MILLIS = 2000
+_EXPORT_TIMEOUT_MILLIS = 5000
+
 
 def init_telemetry(settings: object) -> None:
     """Initialize OpenTelemetry with OTLP gRPC exporter and FastAPI instrumentation.
@@ -16,10 +27,17 @@ def init_telemetry(settings: object) -> None:
     Configures a TracerProvider with the OTLP gRPC exporter, registers it as the
     global tracer provider, and applies FastAPI auto-instrumentation.
 
+    When ``OTEL_SDK_DISABLED`` is set, nothing is configured: the global tracer
+    provider stays the API's no-op implementation, so spans are not recorded
+    or exported and no instrumentation middleware is installed.
+
     Args:
-        settings: Application settings object. Must expose ``otel_service_name``
-            and ``otel_exporter_otlp_endpoint`` attributes.
+        settings: Application settings object. Must expose ``otel_service_name``,
+            ``otel_exporter_otlp_endpoint`` and ``otel_sdk_disabled`` attributes.
     """
+    if settings.otel_sdk_disabled:  # type: ignore[attr-defined]
+        return
+
     resource = Resource.create(
         {"service.name": settings.otel_service_name}  # type: ignore[attr-defined]
     )
@@ -30,16 +48,29 @@ def init_telemetry(settings: object) -> None:
     )
 
     provider = TracerProvider(resource=resource)
-    provider.add_span_processor(BatchSpanProcessor(exporter))
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            exporter,
+            max_queue_size=_MAX_QUEUE_SIZE,
+            max_export_batch_size=_MAX_EXPORT_BATCH_SIZE,
+            schedule_delay_millis=_SCHEDULE_DELAY_MILLIS,
+            export_timeout_millis=_EXPORT_TIMEOUT_MILLIS,
+        )
+    )
 
     trace.set_tracer_provider(provider)
 
     FastAPIInstrumentor().instrument()
 
 
+@functools.cache
 def get_tracer(name: str) -> trace.Tracer:
     """Return a named tracer from the global tracer provider.
 
+    Tracers are cached per name. A tracer obtained before ``init_telemetry``
+    is a proxy that switches to the configured provider once it is set, so
+    caching it is safe.
+
     Args:
         name: Instrumentation scope name, typically ``__name__``.
 
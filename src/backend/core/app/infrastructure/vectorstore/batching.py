@@ -0,0 +1,166 @@
+"""Micro-batching wrapper for the FAISS vector store."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+
+from app.domain.models.chunk import Chunk
+from app.domain.ports.vectorstore_port import VectorStorePort
+from app.infrastructure.vectorstore.faiss_adapter import FaissVectorStore
+
+
+@dataclass
+class _PendingSearch:
+    """A queued search request awaiting its batch."""
+
+    query_embedding: list[float]
+    kb_id: str
+    top_k: int
+    future: asyncio.Future[list[Chunk]]
+
+
+class BatchingVectorStore(VectorStorePort):
+    """Vector store that coalesces concurrent searches into batch searches.
+
+    Searches issued by concurrent requests are queued and a background
+    task drains the queue, waiting at most ``batch_window_ms`` for more
+    requests to arrive, then runs one FAISS batch search per
+    (knowledge base, top_k) group and resolves each caller's future.
+    Writes and deletes go straight to the wrapped store.
+
+    Attributes:
+        _inner: Wrapped FAISS vector store.
+        _window: Maximum time in seconds to wait for a batch to fill.
+        _max_batch_size: Maximum number of searches per batch.
+        _queue: Pending search requests.
+        _worker: Background task draining the queue.
+    """
+
+    def __init__(
+        self,
+        inner: FaissVectorStore,
+        batch_window_ms: float = 5.0,
+        max_batch_size: int = 32,
+    ) -> None:
+        """Initialize the batching vector store.
+
+        Args:
+            inner: FAISS vector store to wrap.
+            batch_window_ms: Maximum time to wait for a batch to fill.
+            max_batch_size: Maximum number of searches per batch.
+        """
+        self._inner = inner
+        self._window = batch_window_ms / 1000
+        self._max_batch_size = max_batch_size
+        self._queue: asyncio.Queue[_PendingSearch] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
+
+    async def store(self, chunks: list[Chunk]) -> None:
+        """Store chunks with their embeddings in the vector store.
+
+        Args:
+            chunks: List of chunks to store.
+        """
+        await self._inner.store(chunks)
+
+    async def search(
+        self, query_embedding: list[float], kb_id: str, top_k: int = 5
+    ) -> list[Chunk]:
+        """Queue a search and wait for its batch to be executed.
+
+        Args:
+            query_embedding: Query vector to search for.
+            kb_id: Knowledge base ID to scope the search.
+            top_k: Maximum number of results to return.
+
+        Returns:
+            List of most similar chunks ordered by relevance.
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future: asyncio.Future[list[Chunk]] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_PendingSearch(query_embedding, kb_id, top_k, future))
+        return await future
+
+    async def delete_by_document(self, document_id: str) -> None:
+        """Delete all chunks associated with a document.
+
+        Args:
+            document_id: ID of the document whose chunks should be deleted.
+        """
+        await self._inner.delete_by_document(document_id)
+
+    async def delete_by_kb(self, kb_id: str) -> None:
+        """Delete all chunks associated with a knowledge base.
+
+        Args:
+            kb_id: ID of the knowledge base whose chunks should be deleted.
+        """
+        await self._inner.delete_by_kb(kb_id)
+
+    async def close(self) -> None:
+        """Stop the background batching task.
+
+        This method should be called during application shutdown.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    async def _run(self) -> None:
+        """Collect queued searches into batches and execute them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+            await self._execute(batch)
+
+    async def _execute(self, batch: list[_PendingSearch]) -> None:
+        """Run one batch search per (kb_id, top_k) group and resolve futures.
+
+        Args:
+            batch: Searches collected for this batch.
+        """
+        groups: dict[tuple[str, int], list[_PendingSearch]] = {}
+        for pending in batch:
+            if not pending.future.done():
+                groups.setdefault((pending.kb_id, pending.top_k), []).append(pending)
+
+        for (kb_id, top_k), group in groups.items():
+            await self._search_group(kb_id, top_k, group)
+
+    async def _search_group(self, kb_id: str, top_k: int, group: list[_PendingSearch]) -> None:
+        """Run one batch search for a group and resolve its futures.
+
+        If the batch search fails, the queries are retried one by one so
+        that a single bad query only fails its own caller.
+
+        Args:
+            kb_id: Knowledge base ID shared by the group.
+            top_k: Maximum number of results shared by the group.
+            group: Searches to run together.
+        """
+        try:
+            results = await self._inner.search_batch(
+                [p.query_embedding for p in group], kb_id, top_k
+            )
+        except Exception as exc:
+            if len(group) == 1:
+                if not group[0].future.done():
+                    group[0].future.set_exception(exc)
+                return
+            for pending in group:
+                await self._search_group(kb_id, top_k, [pending])
+            return
+        for pending, chunks in zip(group, results, strict=True):
+            if not pending.future.done():
+                pending.future.set_result(chunks)
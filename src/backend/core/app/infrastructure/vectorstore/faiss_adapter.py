@@ -14,25 +14,74 @@ class FaissVectorStore(VectorStorePort):
 
     This adapter uses FAISS (Facebook AI Similarity Search) for efficient
     similarity search over chunk embeddings. It maintains an in-memory index
-    with L2 distance metric.
+    ranked by cosine similarity: stored and query vectors are L2-normalized
+    and compared by inner product. Vectors are scalar-quantized by default
+    (``SQfp16``), halving the memory scanned per candidate compared to
+    FP32 with negligible recall loss.
+
+    The index is wrapped in an ``IDMap2`` so every vector carries a stable
+    64-bit ID. Search results map straight back to chunks by ID, and
+    deleting a document removes its vectors in place instead of rebuilding
+    the index (indexes without removal support still fall back to a
+    rebuild).
+
+    For large corpora the brute-force scan can be swapped for an
+    approximate graph index such as ``HNSW32``, whose query cost grows
+    roughly logarithmically with the number of vectors; its recall/latency
+    trade-off is tuned with the ``efSearch`` search parameter.
+
+    Indexes that need training (e.g. ``SQ8`` or IVF) are not trained on
+    whatever the first stored batch happens to be. Vectors are served from
+    an exact staging index until ``min_training_vectors`` are stored, then
+    the index is trained on all of them and takes over.
 
     Attributes:
         _dimension: Dimension of the embedding vectors.
+        _index_description: FAISS index factory string.
+        _search_parameters: FAISS search-time parameters, e.g. "efSearch=64".
         _index: FAISS index for similarity search.
-        _chunks: List of chunks ordered by their position in the index.
-        _chunk_map: Mapping from chunk ID to position in _chunks list.
+        _staging: Exact index serving searches until ``_index`` is trained.
+        _min_training_vectors: Vectors required before ``_index`` is trained.
+        _chunks: Mapping from FAISS vector ID to chunk.
+        _document_ids: Mapping from document ID to its chunks' vector IDs.
+        _next_id: Next vector ID to assign.
     """
 
-    def __init__(self, dimension: int = 768) -> None:
+    def __init__(
+        self,
+        dimension: int = 768,
+        index_description: str = "SQfp16",
+        search_parameters: str = "",
+        min_training_vectors: int = 1000,
+    ) -> None:
         """Initialize FAISS vector store.
 
         Args:
             dimension: Dimension of the embedding vectors (default: 768 for Ollama).
+            index_description: FAISS index factory string, e.g. "Flat" for
+                exact FP32 search, "SQfp16" for 16-bit scalar quantization,
+                or "HNSW32" for approximate graph search. "SQ8" (8-bit) and
+                IVF indexes need training: they save memory only once
+                ``min_training_vectors`` vectors are stored, and their
+                quantizer is fitted to the vectors present at that point,
+                so pick a threshold representative of the corpus.
+                "SQfp16" needs no training and is the safe default.
+            search_parameters: Comma-separated FAISS search parameters
+                applied to the index, e.g. "efSearch=64" for HNSW. Empty
+                keeps the FAISS defaults.
+            min_training_vectors: Number of stored vectors to train on for
+                indexes that need training; until then searches are exact.
+                IVF indexes need roughly 40 vectors per list.
         """
         self._dimension = dimension
-        self._index = faiss.IndexFlatL2(dimension)
-        self._chunks: list[Chunk] = []  # ordered list matching index positions
-        self._chunk_map: dict[str, int] = {}  # chunk_id -> position in _chunks
+        self._index_description = index_description
+        self._search_parameters = search_parameters
+        self._min_training_vectors = min_training_vectors
+        self._index = self._new_index()
+        self._staging = self._new_staging_index()
+        self._chunks: dict[int, Chunk] = {}
+        self._document_ids: dict[str, list[int]] = {}
+        self._next_id = 0
 
     async def store(self, chunks: list[Chunk]) -> None:
         """Store chunks with their embeddings in the vector store.
@@ -40,18 +89,17 @@ class FaissVectorStore(VectorStorePort):
         Args:
             chunks: List of chunks to store. Chunks without embeddings are skipped.
         """
-        vectors = []
-        for chunk in chunks:
-            if chunk.embedding is None:
-                continue
-            pos = len(self._chunks)
-            self._chunks.append(chunk)
-            self._chunk_map[chunk.id] = pos
-            vectors.append(chunk.embedding)
-
-        if vectors:
-            arr = np.array(vectors, dtype=np.float32)
-            self._index.add(arr)
+        embedded = [c for c in chunks if c.embedding is not None]
+        if not embedded:
+            return
+        vectors = np.empty((len(embedded), self._dimension), dtype=np.float32)
+        ids = np.arange(self._next_id, self._next_id + len(embedded), dtype=np.int64)
+        self._next_id += len(embedded)
+        for row, (vector_id, chunk) in enumerate(zip(ids.tolist(), embedded, strict=True)):
+            vectors[row] = chunk.embedding
+            self._chunks[vector_id] = chunk
+            self._document_ids.setdefault(chunk.document_id, []).append(vector_id)
+        self._add(vectors, ids)
 
     async def search(
         self, query_embedding: list[float], kb_id: str, top_k: int = 5
@@ -66,26 +114,50 @@ class FaissVectorStore(VectorStorePort):
         Returns:
             List of most similar chunks ordered by relevance.
         """
-        if self._index.ntotal == 0:
-            return []
+        results = await self.search_batch([query_embedding], kb_id, top_k)
+        return results[0]
+
+    async def search_batch(
+        self, query_embeddings: list[list[float]], kb_id: str, top_k: int = 5
+    ) -> list[list[Chunk]]:
+        """Search for several query vectors with a single FAISS call.
 
-        query = np.array([query_embedding], dtype=np.float32)
+        FAISS scans the index once for the whole batch, which is
+        considerably cheaper than one call per query.
+
+        Args:
+            query_embeddings: Query vectors to search for.
+            kb_id: Knowledge base ID to scope the search (currently unused in basic impl).
+            top_k: Maximum number of results to return per query.
+
+        Returns:
+            One list of most similar chunks per query, ordered by relevance.
+        """
+        index = self._active_index()
+        if index.ntotal == 0:
+            return [[] for _ in query_embeddings]
+
+        queries = np.array(query_embeddings, dtype=np.float32)
+        faiss.normalize_L2(queries)
         # Search extra to allow filtering by kb_id
-        k = min(top_k * 3, self._index.ntotal)
-        distances, indices = self._index.search(query, k)
-
-        results = []
-        for idx in indices[0]:
-            if idx < 0 or idx >= len(self._chunks):
-                continue
-            chunk = self._chunks[idx]
-            # TODO: Filter by kb_id via document->kb mapping from document store
-            # For now we return all matches since kb filtering needs cross-reference
-            results.append(chunk)
-            if len(results) >= top_k:
-                break
-
-        return results
+        k = min(top_k * 3, index.ntotal)
+        distances, labels = index.search(queries, k)
+
+        batch_results = []
+        for row in labels.tolist():
+            results = []
+            for vector_id in row:
+                chunk = self._chunks.get(vector_id)
+                if chunk is None:
+                    continue
+                # TODO: Filter by kb_id via document->kb mapping from document store
+                # For now we return all matches since kb filtering needs cross-reference
+                results.append(chunk)
+                if len(results) >= top_k:
+                    break
+            batch_results.append(results)
+
+        return batch_results
 
     async def delete_by_document(self, document_id: str) -> None:
         """Delete all chunks associated with a document.
@@ -94,10 +166,18 @@ class FaissVectorStore(VectorStorePort):
             document_id: ID of the document whose chunks should be deleted.
 
         Note:
-            FAISS doesn't support deletion, so we rebuild the entire index.
+            Vectors are removed by ID. Index types that do not support
+            removal (e.g. HNSW) are rebuilt from the remaining chunks.
         """
-        remaining = [c for c in self._chunks if c.document_id != document_id]
-        self._rebuild(remaining)
+        vector_ids = self._document_ids.pop(document_id, None)
+        if not vector_ids:
+            return
+        for vector_id in vector_ids:
+            del self._chunks[vector_id]
+        try:
+            self._active_index().remove_ids(np.asarray(vector_ids, dtype=np.int64))
+        except RuntimeError:
+            self._rebuild()
 
     async def delete_by_kb(self, kb_id: str) -> None:
         """Delete all chunks associated with a knowledge base.
@@ -113,25 +193,65 @@ class FaissVectorStore(VectorStorePort):
         # For now this is a no-op; real implementation needs cross-reference
         pass
 
-    def _rebuild(self, chunks: list[Chunk]) -> None:
-        """Rebuild the FAISS index with the given chunks.
+    def _rebuild(self) -> None:
+        """Rebuild the FAISS index from the chunks still stored, keeping their IDs."""
+        self._index = self._new_index()
+        self._staging = self._new_staging_index()
+        if not self._chunks:
+            return
+        ids = np.fromiter(self._chunks, dtype=np.int64, count=len(self._chunks))
+        vectors = np.array([c.embedding for c in self._chunks.values()], dtype=np.float32)
+        self._add(vectors, ids)
+
+    def _new_index(self) -> faiss.Index:
+        """Create an empty ID-mapped index from the configured factory string.
+
+        Returns:
+            A new FAISS index using the inner-product metric.
+        """
+        index = faiss.index_factory(
+            self._dimension, f"IDMap2,{self._index_description}", faiss.METRIC_INNER_PRODUCT
+        )
+        if self._search_parameters:
+            faiss.ParameterSpace().set_index_parameters(index, self._search_parameters)
+        return index
+
+    def _new_staging_index(self) -> faiss.Index:
+        """Create an empty exact index for vectors stored before training.
+
+        Returns:
+            A new ID-mapped flat index using the inner-product metric.
+        """
+        return faiss.index_factory(self._dimension, "IDMap2,Flat", faiss.METRIC_INNER_PRODUCT)
+
+    def _active_index(self) -> faiss.Index:
+        """Return the index that currently holds the stored vectors."""
+        return self._index if self._index.is_trained else self._staging
+
+    def _add(self, vectors: np.ndarray, ids: np.ndarray) -> None:
+        """Normalize and add vectors, training the index once enough are stored.
+
+        Until ``_min_training_vectors`` chunks are stored, vectors go to the
+        exact staging index. The index is then trained on every stored
+        vector, so its quantizer reflects the corpus rather than one batch.
 
         Args:
-            chunks: List of chunks to rebuild the index with.
+            vectors: Float32 matrix of shape (n, dimension), normalized in place.
+            ids: Int64 vector IDs, one per row of ``vectors``.
         """
-        self._index = faiss.IndexFlatL2(self._dimension)
-        self._chunks = []
-        self._chunk_map = {}
-        vectors = []
-
-        for chunk in chunks:
-            if chunk.embedding is None:
-                continue
-            pos = len(self._chunks)
-            self._chunks.append(chunk)
-            self._chunk_map[chunk.id] = pos
-            vectors.append(chunk.embedding)
-
-        if vectors:
-            arr = np.array(vectors, dtype=np.float32)
-            self._index.add(arr)
+        faiss.normalize_L2(vectors)
+        if self._index.is_trained:
+            self._index.add_with_ids(vectors, ids)
+        elif len(self._chunks) < self._min_training_vectors:
+            self._staging.add_with_ids(vectors, ids)
+        else:
+            self._train()
+
+    def _train(self) -> None:
+        """Train the index on every stored vector and move them out of staging."""
+        ids = np.fromiter(self._chunks, dtype=np.int64, count=len(self._chunks))
+        vectors = np.array([c.embedding for c in self._chunks.values()], dtype=np.float32)
+        faiss.normalize_L2(vectors)
+        self._index.train(vectors)
+        self._index.add_with_ids(vectors, ids)
+        self._staging.reset()
@@ -2,38 +2,97 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from app.domain.models.chunk import Chunk
 from app.domain.ports.vectorstore_port import VectorStorePort
 
 
 class InMemoryVectorStore(VectorStorePort):
-    """In-memory implementation of vector store for development."""
+    """In-memory implementation of vector store for development.
+
+    Embeddings are kept in a single contiguous float32 matrix whose rows run
+    parallel to the stored chunks, so a search is one matrix-vector product
+    over the whole store instead of a Python loop over chunk objects. Rows
+    are L2-normalized when stored, which turns that product into cosine
+    similarity without per-query normalization of the stored vectors.
+
+    Attributes:
+        _embeddings: Float32 buffer of shape (capacity, dimension); the first
+            ``len(_chunks)`` rows hold unit-length chunk embeddings.
+        _chunks: Chunks ordered by their row in ``_embeddings``.
+        _rows: Mapping from chunk ID to row index.
+    """
 
     def __init__(self) -> None:
         """Initialize the in-memory vector store."""
-        self._chunks: dict[str, Chunk] = {}
+        self._embeddings: np.ndarray | None = None
+        self._chunks: list[Chunk] = []
+        self._rows: dict[str, int] = {}
 
     async def store(self, chunks: list[Chunk]) -> None:
-        """Store chunks with their embeddings."""
-        for chunk in chunks:
-            self._chunks[chunk.id] = chunk
+        """Store chunks with their embeddings.
+
+        Chunks without embeddings are skipped. Storing a chunk whose ID is
+        already present replaces it.
+        """
+        # Last copy wins when a batch repeats an ID, so each ID maps to
+        # exactly one row.
+        batch = {chunk.id: chunk for chunk in chunks if chunk.embedding is not None}
+        if not batch:
+            return
+        replaced = [chunk for chunk in batch.values() if chunk.id in self._rows]
+        added = [chunk for chunk in batch.values() if chunk.id not in self._rows]
+
+        # Build and check every vector before touching the store, so a bad
+        # batch leaves it unchanged.
+        vectors = _normalize(
+            np.asarray([chunk.embedding for chunk in replaced + added], dtype=np.float32)
+        )
+        if self._embeddings is not None and vectors.shape[1] != self._embeddings.shape[1]:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match "
+                f"stored dimension {self._embeddings.shape[1]}"
+            )
+
+        for chunk, vector in zip(replaced, vectors, strict=False):
+            row = self._rows[chunk.id]
+            self._chunks[row] = chunk
+            self._embeddings[row] = vector
+        if not added:
+            return
+        start = len(self._chunks)
+        self._reserve(start + len(added), vectors.shape[1])
+        self._embeddings[start : start + len(added)] = vectors[len(replaced) :]
+        for offset, chunk in enumerate(added):
+            self._rows[chunk.id] = start + offset
+        self._chunks.extend(added)
 
     async def search(
         self, query_embedding: list[float], kb_id: str, top_k: int = 5
     ) -> list[Chunk]:
-        """Search for similar chunks using vector similarity.
+        """Search for similar chunks by cosine similarity.
 
-        Note: This is a stub implementation that returns all chunks for the KB
-        without performing real vector similarity search.
+        Like the FAISS adapter, results are not yet scoped by ``kb_id``
+        since chunks carry no knowledge base reference.
         """
-        all_chunks = list(self._chunks.values())
-        return all_chunks[:top_k]
+        if not self._chunks or top_k <= 0:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        scores = self._embeddings[: len(self._chunks)] @ query
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [self._chunks[i] for i in top]
 
     async def delete_by_document(self, document_id: str) -> None:
         """Delete all chunks associated with a document."""
-        self._chunks = {
-            k: v for k, v in self._chunks.items() if v.document_id != document_id
-        }
+        keep = [i for i, c in enumerate(self._chunks) if c.document_id != document_id]
+        if len(keep) == len(self._chunks):
+            return
+        self._chunks = [self._chunks[i] for i in keep]
+        self._rows = {c.id: row for row, c in enumerate(self._chunks)}
+        self._embeddings = self._embeddings[keep] if keep else None
 
     async def delete_by_kb(self, kb_id: str) -> None:
         """Delete all chunks associated with a knowledge base.
@@ -41,3 +100,35 @@ class InMemoryVectorStore(VectorStorePort):
         Note: Would need document-to-kb mapping in real implementation.
         """
         pass
+
+    def _reserve(self, rows: int, dimension: int) -> None:
+        """Grow the embedding buffer to hold at least ``rows`` rows.
+
+        Capacity doubles on growth so that repeated stores copy the
+        matrix an amortized constant number of times.
+
+        Args:
+            rows: Required number of rows.
+            dimension: Embedding dimension.
+        """
+        capacity = 0 if self._embeddings is None else len(self._embeddings)
+        if rows <= capacity:
+            return
+        grown = np.empty((max(rows, 2 * capacity), dimension), dtype=np.float32)
+        if self._embeddings is not None:
+            grown[: len(self._chunks)] = self._embeddings[: len(self._chunks)]
+        self._embeddings = grown
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit L2 norm, leaving zero rows unchanged.
+
+    Args:
+        vectors: Matrix of shape (n, dimension).
+
+    Returns:
+        Float32 matrix of unit-length rows.
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
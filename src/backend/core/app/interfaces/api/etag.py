@@ -0,0 +1,50 @@
+"""Helpers for conditional GET requests with entity tags."""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def entity_tag(*parts: object) -> str:
+    """Build a weak entity tag from the values that identify a representation.
+
+    The tag is weak because the same entity may be sent with different
+    content codings (e.g. gzip).
+
+    Args:
+        *parts: Values that change whenever the representation changes,
+            such as IDs and modification timestamps.
+
+    Returns:
+        Entity tag suitable for the ``ETag`` header.
+    """
+    digest = hashlib.blake2b(
+        "\0".join(str(part) for part in parts).encode(), digest_size=8
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    """Tag the response and short-circuit when the client already has it.
+
+    Args:
+        request: Incoming request, checked for ``If-None-Match``.
+        response: Response whose headers receive the ``ETag``.
+        etag: Entity tag of the current representation.
+
+    Returns:
+        A ``304 Not Modified`` response if the client's copy is current,
+        None otherwise.
+    """
+    response.headers["ETag"] = etag
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return None
+    current = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == current:
+            return Response(status_code=304, headers={"ETag": etag})
+    return None
@@ -2,55 +2,51 @@
 
 from __future__ import annotations
 
-import json
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
 
-
-class InteractionIdMiddleware(BaseHTTPMiddleware):
+class InteractionIdMiddleware:
     """Middleware that injects ``X-Interaction-Id`` into response headers.
 
-    Reads the JSON response body and, if it contains an ``interaction_id``
-    field, adds it as the ``X-Interaction-Id`` HTTP response header. Only
-    responses with ``Content-Type: application/json`` are inspected; all
-    other responses pass through unchanged.
+    Route handlers that create an interaction record its ID on
+    ``request.state.interaction_id``; the middleware copies it into the
+    ``X-Interaction-Id`` HTTP response header. It is a plain ASGI
+    middleware that only touches the ``http.response.start`` message, so
+    responses stream through without the extra tasks and body buffering
+    of ``BaseHTTPMiddleware``.
+
+    Attributes:
+        app: Wrapped ASGI application.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        """Process the request and inject the interaction ID header.
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
 
         Args:
-            request: Incoming HTTP request.
-            call_next: Next middleware or route handler.
+            app: ASGI application to wrap.
+        """
+        self.app = app
 
-        Returns:
-            HTTP response, potentially with ``X-Interaction-Id`` header added.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process the request and inject the interaction ID header.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
         """
-        response = await call_next(request)
-
-        content_type = response.headers.get("content-type", "")
-        if "application/json" not in content_type:
-            return response
-
-        body = b""
-        async for chunk in response.body_iterator:  # type: ignore[attr-defined]
-            body += chunk
-
-        try:
-            payload = json.loads(body)
-            interaction_id = payload.get("interaction_id")
-        except (json.JSONDecodeError, AttributeError):
-            interaction_id = None
-
-        headers = dict(response.headers)
-        if interaction_id:
-            headers["x-interaction-id"] = str(interaction_id)
-
-        return Response(
-            content=body,
-            status_code=response.status_code,
-            headers=headers,
-            media_type=response.media_type,
-        )
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_interaction_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # request.state is backed by scope["state"], which the route
+                # has filled in by the time the response starts.
+                interaction_id = scope.get("state", {}).get("interaction_id")
+                if interaction_id:
+                    MutableHeaders(scope=message).append("x-interaction-id", str(interaction_id))
+            await send(message)
+
+        await self.app(scope, receive, send_with_interaction_id)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, Depends
 
 from app.application.use_cases.document_use_case import DocumentUseCase
 from app.application.use_cases.interaction_use_case import InteractionUseCase
 from app.application.use_cases.knowledge_base_use_case import KnowledgeBaseUseCase
 from app.dependencies import get_document_use_case, get_interaction_use_case, get_kb_use_case
+from app.domain.models.interaction import InteractionStatus
 from app.interfaces.api.schemas.dashboard import DashboardStatsSchema
 
 router = APIRouter(prefix="/api/v1", tags=["dashboard"])
@@ -24,21 +27,17 @@ async def get_dashboard_stats(
     Returns:
         Dashboard statistics including interaction counts, KB count, and document count.
     """
-    kbs = await kb_use_case.list_all()
-    interactions = await interaction_use_case.list_all()
-
-    answered = sum(1 for i in interactions if i.status.value == "answered")
-    unknown = sum(1 for i in interactions if i.status.value == "unknown")
-
-    doc_count = 0
-    for kb in kbs:
-        docs = await doc_use_case.list_documents(kb.id)
-        doc_count += len(docs)
+    # The counts are independent and each runs on its own pooled connection.
+    kb_count, doc_count, status_counts = await asyncio.gather(
+        kb_use_case.count(),
+        doc_use_case.count_all(),
+        interaction_use_case.count_by_status(),
+    )
 
     return DashboardStatsSchema(
-        total_interactions=len(interactions),
-        answered_count=answered,
-        unknown_count=unknown,
-        knowledge_base_count=len(kbs),
+        total_interactions=sum(status_counts.values()),
+        answered_count=status_counts.get(InteractionStatus.ANSWERED, 0),
+        unknown_count=status_counts.get(InteractionStatus.UNKNOWN, 0),
+        knowledge_base_count=kb_count,
         document_count=doc_count,
     )
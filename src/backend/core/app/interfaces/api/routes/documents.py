@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 
-from fastapi import APIRouter, Depends, File, UploadFile
+from fastapi import APIRouter, Depends, File, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
 
 from app.application.use_cases.document_use_case import DocumentUseCase
 from app.dependencies import get_document_use_case
+from app.domain.models.document import Document
 from app.interfaces.api.schemas.document import DocumentSchema
+from app.interfaces.api.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/api/v1", tags=["documents"])
 
@@ -22,7 +26,7 @@ async def upload_document(
     kb_id: str,
     file: UploadFile = File(...),
     use_case: DocumentUseCase = Depends(get_document_use_case),
-) -> DocumentSchema:
+) -> Document:
     """Upload a document to a knowledge base.
 
     Args:
@@ -33,49 +37,40 @@ async def upload_document(
     Returns:
         Created document entity.
     """
-    content = await file.read()
-    content_hash = hashlib.sha256(content).hexdigest()
-    doc = await use_case.upload(kb_id, file.filename or "unnamed", content_hash)
-    return DocumentSchema(
-        id=doc.id,
-        kb_id=doc.kb_id,
-        filename=doc.filename,
-        status=doc.status.value,
-        chunks_count=doc.chunks_count,
-        uploaded_at=doc.uploaded_at,
-    )
+    # Hash the spooled upload in chunks instead of reading it into memory;
+    # the file may have rolled over to disk, so this runs off the event loop.
+    await file.seek(0)
+    digest = await asyncio.to_thread(hashlib.file_digest, file.file, "sha256")
+    content_hash = digest.hexdigest()
+    return await use_case.upload(kb_id, file.filename or "unnamed", content_hash)
 
 
 @router.get("/knowledge-bases/{kb_id}/documents", response_model=list[DocumentSchema])
 async def list_documents(
-    kb_id: str, use_case: DocumentUseCase = Depends(get_document_use_case)
-) -> list[DocumentSchema]:
+    kb_id: str, request: Request, use_case: DocumentUseCase = Depends(get_document_use_case)
+) -> list[Document] | StreamingResponse:
     """List all documents in a knowledge base.
 
+    Clients sending ``Accept: application/x-ndjson`` receive the rows as a
+    newline-delimited JSON stream read directly from the database cursor.
+
     Args:
         kb_id: Knowledge base ID.
+        request: Incoming request, used for content negotiation.
         use_case: Injected document use case.
 
     Returns:
-        List of documents.
+        List of documents, or an NDJSON stream of them.
     """
-    docs = await use_case.list_documents(kb_id)
-    return [
-        DocumentSchema(
-            id=d.id,
-            kb_id=d.kb_id,
-            filename=d.filename,
-            status=d.status.value,
-            chunks_count=d.chunks_count,
-            uploaded_at=d.uploaded_at,
-        )
-        for d in docs
-    ]
+    if wants_ndjson(request):
+        return ndjson_response(use_case.stream_documents(kb_id), _to_schema)
+    return await use_case.list_documents(kb_id)
 
 
 @router.delete(
     "/knowledge-bases/{kb_id}/documents/{doc_id}",
     status_code=204,
+    response_class=Response,
 )
 async def delete_document(
     kb_id: str, doc_id: str, use_case: DocumentUseCase = Depends(get_document_use_case)
@@ -101,3 +96,15 @@ async def trigger_indexing(kb_id: str) -> dict[str, str]:
         Status message.
     """
     return {"status": "indexing_triggered", "kb_id": kb_id}
+
+
+def _to_schema(doc: Document) -> DocumentSchema:
+    """Convert a document entity into its response schema.
+
+    Args:
+        doc: Document entity.
+
+    Returns:
+        Document response schema.
+    """
+    return DocumentSchema.model_validate(doc)
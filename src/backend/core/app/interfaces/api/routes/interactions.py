@@ -2,70 +2,70 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from app.application.use_cases.interaction_use_case import InteractionUseCase
 from app.dependencies import get_interaction_use_case
+from app.domain.models.interaction import Interaction
+from app.interfaces.api.etag import entity_tag, not_modified
 from app.interfaces.api.schemas.interaction import InteractionSchema
-from app.interfaces.api.schemas.query import CitationSchema
+from app.interfaces.api.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/api/v1", tags=["interactions"])
 
 
 @router.get("/interactions", response_model=list[InteractionSchema])
 async def list_interactions(
+    request: Request,
     kb_id: str | None = Query(None),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     use_case: InteractionUseCase = Depends(get_interaction_use_case),
-) -> list[InteractionSchema]:
+) -> list[Interaction] | StreamingResponse:
     """List interactions with optional filtering and pagination.
 
+    Clients sending ``Accept: application/x-ndjson`` receive the rows as a
+    newline-delimited JSON stream read directly from the database cursor.
+
     Args:
+        request: Incoming request, used for content negotiation.
         kb_id: Optional knowledge base ID to filter by.
         limit: Maximum number of results (1-200).
         offset: Number of results to skip.
         use_case: Injected interaction use case.
 
     Returns:
-        List of interactions.
+        List of interactions, or an NDJSON stream of them.
     """
-    interactions = await use_case.list_all(kb_id=kb_id, limit=limit, offset=offset)
-    return [
-        InteractionSchema(
-            id=i.id,
-            kb_id=i.kb_id,
-            question=i.question,
-            answer=i.answer,
-            status=i.status.value,
-            citations=[
-                CitationSchema(
-                    source_document=c.source_document,
-                    page=c.page,
-                    chunk_id=c.chunk_id,
-                    relevance_score=c.relevance_score,
-                )
-                for c in i.citations
-            ],
-            created_at=i.created_at,
+    if wants_ndjson(request):
+        return ndjson_response(
+            use_case.stream_all(kb_id=kb_id, limit=limit, offset=offset), _to_schema
         )
-        for i in interactions
-    ]
+    # The response model converts the entities straight from their attributes.
+    return await use_case.list_all(kb_id=kb_id, limit=limit, offset=offset)
 
 
 @router.get("/interactions/{interaction_id}", response_model=InteractionSchema)
 async def get_interaction(
     interaction_id: str,
+    request: Request,
+    response: Response,
     use_case: InteractionUseCase = Depends(get_interaction_use_case),
-) -> InteractionSchema:
+) -> Interaction | Response:
     """Get an interaction by ID.
 
+    Interactions never change once saved, so their ID, creation time and
+    status identify the representation.
+
     Args:
         interaction_id: Interaction ID.
+        request: Incoming request, checked for ``If-None-Match``.
+        response: Response receiving the ``ETag`` header.
         use_case: Injected interaction use case.
 
     Returns:
-        Interaction entity.
+        Interaction entity, or 304 if the client's copy is current.
 
     Raises:
         HTTPException: If interaction is not found.
@@ -73,20 +73,17 @@ async def get_interaction(
     interaction = await use_case.get(interaction_id)
     if not interaction:
         raise HTTPException(status_code=404, detail="Interaction not found")
-    return InteractionSchema(
-        id=interaction.id,
-        kb_id=interaction.kb_id,
-        question=interaction.question,
-        answer=interaction.answer,
-        status=interaction.status.value,
-        citations=[
-            CitationSchema(
-                source_document=c.source_document,
-                page=c.page,
-                chunk_id=c.chunk_id,
-                relevance_score=c.relevance_score,
-            )
-            for c in interaction.citations
-        ],
-        created_at=interaction.created_at,
-    )
+    etag = entity_tag(interaction.id, interaction.created_at, interaction.status)
+    return not_modified(request, response, etag) or interaction
+
+
+def _to_schema(interaction: Interaction) -> InteractionSchema:
+    """Convert an interaction entity into its response schema.
+
+    Args:
+        interaction: Interaction entity.
+
+    Returns:
+        Interaction response schema.
+    """
+    return InteractionSchema.model_validate(interaction)
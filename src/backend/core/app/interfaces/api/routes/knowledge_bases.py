@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
 from app.application.use_cases.knowledge_base_use_case import KnowledgeBaseUseCase
 from app.dependencies import get_kb_use_case
+from app.domain.models.knowledge_base import KnowledgeBase
+from app.interfaces.api.etag import entity_tag, not_modified
 from app.interfaces.api.schemas.knowledge_base import (
     CreateKnowledgeBaseSchema,
     KnowledgeBaseSchema,
@@ -18,7 +20,7 @@ router = APIRouter(prefix="/api/v1", tags=["knowledge-bases"])
 async def create_kb(
     request: CreateKnowledgeBaseSchema,
     use_case: KnowledgeBaseUseCase = Depends(get_kb_use_case),
-) -> KnowledgeBaseSchema:
+) -> KnowledgeBase:
     """Create a new knowledge base.
 
     Args:
@@ -28,45 +30,47 @@ async def create_kb(
     Returns:
         Created knowledge base entity.
     """
-    kb = await use_case.create(request.name, request.description)
-    return KnowledgeBaseSchema(
-        id=kb.id, name=kb.name, description=kb.description, created_at=kb.created_at
-    )
+    return await use_case.create(request.name, request.description)
 
 
 @router.get("/knowledge-bases", response_model=list[KnowledgeBaseSchema])
 async def list_kbs(
+    request: Request,
+    response: Response,
     use_case: KnowledgeBaseUseCase = Depends(get_kb_use_case),
-) -> list[KnowledgeBaseSchema]:
+) -> list[KnowledgeBase] | Response:
     """List all knowledge bases.
 
     Args:
+        request: Incoming request, checked for ``If-None-Match``.
+        response: Response receiving the ``ETag`` header.
         use_case: Injected knowledge base use case.
 
     Returns:
-        List of all knowledge bases.
+        List of all knowledge bases, or 304 if the client's copy is current.
     """
     kbs = await use_case.list_all()
-    return [
-        KnowledgeBaseSchema(
-            id=kb.id, name=kb.name, description=kb.description, created_at=kb.created_at
-        )
-        for kb in kbs
-    ]
+    etag = entity_tag(*(part for kb in kbs for part in _kb_version(kb)))
+    return not_modified(request, response, etag) or kbs
 
 
 @router.get("/knowledge-bases/{kb_id}", response_model=KnowledgeBaseSchema)
 async def get_kb(
-    kb_id: str, use_case: KnowledgeBaseUseCase = Depends(get_kb_use_case)
-) -> KnowledgeBaseSchema:
+    kb_id: str,
+    request: Request,
+    response: Response,
+    use_case: KnowledgeBaseUseCase = Depends(get_kb_use_case),
+) -> KnowledgeBase | Response:
     """Get a knowledge base by ID.
 
     Args:
         kb_id: Knowledge base ID.
+        request: Incoming request, checked for ``If-None-Match``.
+        response: Response receiving the ``ETag`` header.
         use_case: Injected knowledge base use case.
 
     Returns:
-        Knowledge base entity.
+        Knowledge base entity, or 304 if the client's copy is current.
 
     Raises:
         HTTPException: If knowledge base is not found.
@@ -74,12 +78,10 @@ async def get_kb(
     kb = await use_case.get(kb_id)
     if not kb:
         raise HTTPException(status_code=404, detail="Knowledge base not found")
-    return KnowledgeBaseSchema(
-        id=kb.id, name=kb.name, description=kb.description, created_at=kb.created_at
-    )
+    return not_modified(request, response, entity_tag(*_kb_version(kb))) or kb
 
 
-@router.delete("/knowledge-bases/{kb_id}", status_code=204)
+@router.delete("/knowledge-bases/{kb_id}", status_code=204, response_class=Response)
 async def delete_kb(
     kb_id: str, use_case: KnowledgeBaseUseCase = Depends(get_kb_use_case)
 ) -> None:
@@ -90,3 +92,15 @@ async def delete_kb(
         use_case: Injected knowledge base use case.
     """
     await use_case.delete(kb_id)
+
+
+def _kb_version(kb: KnowledgeBase) -> tuple[object, ...]:
+    """Return the values that identify a version of a knowledge base.
+
+    Args:
+        kb: Knowledge base entity.
+
+    Returns:
+        Fields that change whenever the knowledge base's representation does.
+    """
+    return (kb.id, kb.name, kb.description, kb.created_at, kb.updated_at)
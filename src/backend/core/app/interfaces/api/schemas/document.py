@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class DocumentSchema(BaseModel):
     """Schema for document entity."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     kb_id: str
     filename: str
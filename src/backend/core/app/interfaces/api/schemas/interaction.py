@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.interfaces.api.schemas.query import CitationSchema
 
@@ -12,6 +12,8 @@ from app.interfaces.api.schemas.query import CitationSchema
 class InteractionSchema(BaseModel):
     """Schema for interaction entity."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     kb_id: str
     question: str
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CreateKnowledgeBaseSchema(BaseModel):
@@ -17,6 +17,8 @@ class CreateKnowledgeBaseSchema(BaseModel):
 class KnowledgeBaseSchema(BaseModel):
     """Schema for knowledge base entity."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     name: str
     description: str | None = None
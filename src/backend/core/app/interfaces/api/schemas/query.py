@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class QueryRequestSchema(BaseModel):
@@ -15,6 +15,8 @@ class QueryRequestSchema(BaseModel):
 class CitationSchema(BaseModel):
     """Schema for citation information."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     source_document: str
     page: int | None = None
     chunk_id: str
@@ -24,6 +26,8 @@ class CitationSchema(BaseModel):
 class QueryResponseSchema(BaseModel):
     """Response schema for query endpoint."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     status: str
     answer: str | None = None
     citations: list[CitationSchema] = Field(default_factory=list)
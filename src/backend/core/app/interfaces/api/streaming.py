@@ -0,0 +1,46 @@
+"""Helpers for streaming list responses as newline-delimited JSON."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Check whether the client asked for a newline-delimited JSON stream.
+
+    Args:
+        request: Incoming request.
+
+    Returns:
+        True if the Accept header includes ``application/x-ndjson``.
+    """
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response[T](
+    items: AsyncIterator[T], to_schema: Callable[[T], BaseModel]
+) -> StreamingResponse:
+    """Stream items as one JSON document per line.
+
+    Rows are encoded as they are read, so memory stays constant
+    regardless of how many items are returned.
+
+    Args:
+        items: Async iterator over domain entities.
+        to_schema: Converter from a domain entity to its response schema.
+
+    Returns:
+        Streaming response with media type ``application/x-ndjson``.
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for item in items:
+            yield to_schema(item).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
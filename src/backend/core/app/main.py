@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import Settings
-from app.dependencies import init_db, shutdown
+from app.dependencies import init_db, shutdown, warmup
 from app.infrastructure.telemetry.setup import init_telemetry
 from app.interfaces.api.middleware.tracing import InteractionIdMiddleware
 from app.interfaces.api.routes import (
@@ -28,7 +30,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings = Settings()
     init_telemetry(settings)
     await init_db()
+    warmup_task = asyncio.create_task(warmup())
     yield
+    warmup_task.cancel()
     await shutdown()
 
 
@@ -45,14 +49,21 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # CORS middleware for development
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # CORS middleware for development. Deployments reached only through the
+    # API gateway can set CORS_ALLOW_ORIGINS='[]' to leave it out.
+    settings = Settings()
+    if settings.cors_allow_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.cors_allow_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    # Compress large responses (e.g. interaction listings with citations)
+    # for clients that send Accept-Encoding: gzip
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
     # Inject interaction_id into response headers
     app.add_middleware(InteractionIdMiddleware)
@@ -12,8 +12,10 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from app.application.cache.query_cache import QueryCache
 from app.domain.models.document import Document, DocumentStatus
 from app.application.use_cases.document_use_case import DocumentUseCase
+from app.domain.models.grounding import QueryResult
 
 
 # ---------------------------------------------------------------------------
@@ -188,6 +190,31 @@ class TestDocumentUseCaseListDocuments:
         mock_document_store.list_documents.assert_called_once_with("kb-xyz")
 
 
+    async def test_stream_documents_yields_store_documents(
+        self, doc_use_case: DocumentUseCase, mock_document_store: AsyncMock
+    ) -> None:
+        """stream_documents() yields the documents streamed by the store for the KB."""
+        doc = Document(id="doc-1", kb_id="kb-001", filename="a.pdf", content_hash="hash1")
+        mock_document_store.stream_documents.return_value.__aiter__.return_value = [doc]
+
+        result = [d async for d in doc_use_case.stream_documents(kb_id="kb-001")]
+
+        assert result == [doc]
+        mock_document_store.stream_documents.assert_called_once_with("kb-001")
+
+
+    async def test_count_all_returns_store_count(
+        self, doc_use_case: DocumentUseCase, mock_document_store: AsyncMock
+    ) -> None:
+        """count_all() returns the document count without listing documents."""
+        mock_document_store.count_documents.return_value = 7
+
+        result = await doc_use_case.count_all()
+
+        assert result == 7
+        mock_document_store.list_documents.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Delete document
 # ---------------------------------------------------------------------------
@@ -237,3 +264,45 @@ class TestDocumentUseCaseDelete:
         result = await doc_use_case.delete(kb_id="kb-001", document_id="doc-1")
 
         assert result is None
+
+
+# ---------------------------------------------------------------------------
+# Query cache invalidation
+# ---------------------------------------------------------------------------
+
+class TestDocumentUseCaseQueryCache:
+    """Tests that document changes invalidate cached query results."""
+
+    @pytest.fixture
+    def query_cache(self) -> QueryCache:
+        """QueryCache holding one result for kb-001."""
+        cache = QueryCache()
+        cache.put(
+            "kb-001",
+            "Q?",
+            None,
+            QueryResult(status="unknown", answer=None, citations=[], interaction_id="int-1"),
+        )
+        return cache
+
+    async def test_upload_invalidates_cached_results(
+        self, mock_document_store: AsyncMock, mock_vectorstore: AsyncMock,
+        query_cache: QueryCache
+    ) -> None:
+        """upload() drops cached results for the knowledge base."""
+        use_case = DocumentUseCase(mock_document_store, mock_vectorstore, query_cache)
+
+        await use_case.upload(kb_id="kb-001", filename="faq.pdf", content_hash="abc")
+
+        assert query_cache.get("kb-001", "Q?") is None
+
+    async def test_delete_invalidates_cached_results(
+        self, mock_document_store: AsyncMock, mock_vectorstore: AsyncMock,
+        query_cache: QueryCache
+    ) -> None:
+        """delete() drops cached results for the knowledge base."""
+        use_case = DocumentUseCase(mock_document_store, mock_vectorstore, query_cache)
+
+        await use_case.delete(kb_id="kb-001", document_id="doc-1")
+
+        assert query_cache.get("kb-001", "Q?") is None
@@ -13,6 +13,7 @@ import pytest
 
 from app.domain.models.citation import Citation
 from app.domain.models.interaction import Interaction, InteractionStatus
+from app.application.cache.interaction_cache import InteractionCache
 from app.application.use_cases.interaction_use_case import InteractionUseCase
 
 
@@ -88,92 +89,103 @@ class TestInteractionUseCaseListAll:
         assert len(result) == 3
         assert result == interactions
 
-    async def test_list_all_passes_kb_id_filter_to_store(
+    @pytest.mark.parametrize(
+        ("call_kwargs", "expected"),
+        [
+            ({"kb_id": "kb-specific"}, {"kb_id": "kb-specific", "limit": 50, "offset": 0}),
+            ({"limit": 10}, {"kb_id": None, "limit": 10, "offset": 0}),
+            ({"offset": 20}, {"kb_id": None, "limit": 50, "offset": 20}),
+            ({}, {"kb_id": None, "limit": 50, "offset": 0}),
+            ({"kb_id": None}, {"kb_id": None, "limit": 50, "offset": 0}),
+        ],
+        ids=["kb_id", "limit", "offset", "defaults", "no_kb_filter"],
+    )
+    async def test_list_all_forwards_filter_and_pagination(
         self,
         interaction_use_case: InteractionUseCase,
         mock_interaction_store: AsyncMock,
+        call_kwargs: dict[str, object],
+        expected: dict[str, object],
     ) -> None:
-        """list_all() forwards the kb_id filter to the interaction store."""
+        """list_all() forwards kb_id, limit and offset, defaulting to 50 and 0."""
         mock_interaction_store.list_all.return_value = []
 
-        await interaction_use_case.list_all(kb_id="kb-specific")
+        await interaction_use_case.list_all(**call_kwargs)
 
-        mock_interaction_store.list_all.assert_called_once_with(
-            kb_id="kb-specific", limit=50, offset=0
-        )
+        mock_interaction_store.list_all.assert_called_once_with(**expected)
 
-    async def test_list_all_passes_limit_to_store(
+    async def test_list_all_returns_interactions_of_mixed_statuses(
         self,
         interaction_use_case: InteractionUseCase,
         mock_interaction_store: AsyncMock,
     ) -> None:
-        """list_all() forwards the limit parameter to the interaction store."""
-        mock_interaction_store.list_all.return_value = []
+        """list_all() returns interactions regardless of their status."""
+        interactions = [
+            _make_interaction("int-a", status=InteractionStatus.ANSWERED),
+            _make_interaction("int-b", status=InteractionStatus.UNKNOWN),
+        ]
+        mock_interaction_store.list_all.return_value = interactions
 
-        await interaction_use_case.list_all(limit=10)
+        result = await interaction_use_case.list_all()
 
-        mock_interaction_store.list_all.assert_called_once_with(
-            kb_id=None, limit=10, offset=0
-        )
+        statuses = {i.status for i in result}
+        assert InteractionStatus.ANSWERED in statuses
+        assert InteractionStatus.UNKNOWN in statuses
 
-    async def test_list_all_passes_offset_to_store(
-        self,
-        interaction_use_case: InteractionUseCase,
-        mock_interaction_store: AsyncMock,
-    ) -> None:
-        """list_all() forwards the offset parameter to the interaction store."""
-        mock_interaction_store.list_all.return_value = []
 
-        await interaction_use_case.list_all(offset=20)
+# ---------------------------------------------------------------------------
+# Stream all
+# ---------------------------------------------------------------------------
 
-        mock_interaction_store.list_all.assert_called_once_with(
-            kb_id=None, limit=50, offset=20
-        )
+class TestInteractionUseCaseStreamAll:
+    """Tests for streaming interactions."""
 
-    async def test_list_all_default_parameters(
+    async def test_stream_all_yields_store_interactions(
         self,
         interaction_use_case: InteractionUseCase,
         mock_interaction_store: AsyncMock,
     ) -> None:
-        """list_all() uses default limit=50 and offset=0 when not specified."""
-        mock_interaction_store.list_all.return_value = []
+        """stream_all() yields the interactions streamed by the store."""
+        interactions = [_make_interaction("int-1"), _make_interaction("int-2")]
+        mock_interaction_store.stream_all.return_value.__aiter__.return_value = interactions
 
-        await interaction_use_case.list_all()
+        result = [i async for i in interaction_use_case.stream_all()]
 
-        mock_interaction_store.list_all.assert_called_once_with(
-            kb_id=None, limit=50, offset=0
-        )
+        assert result == interactions
 
-    async def test_list_all_without_kb_filter_returns_all(
+    async def test_stream_all_forwards_filter_and_pagination(
         self,
         interaction_use_case: InteractionUseCase,
         mock_interaction_store: AsyncMock,
     ) -> None:
-        """list_all() without kb_id filter calls store with kb_id=None."""
-        mock_interaction_store.list_all.return_value = []
+        """stream_all() passes kb_id, limit and offset to the store."""
+        _ = [i async for i in interaction_use_case.stream_all(kb_id="kb-9", limit=5, offset=10)]
 
-        await interaction_use_case.list_all(kb_id=None)
+        mock_interaction_store.stream_all.assert_called_once_with(
+            kb_id="kb-9", limit=5, offset=10
+        )
 
-        call_kwargs = mock_interaction_store.list_all.call_args[1]
-        assert call_kwargs["kb_id"] is None
 
-    async def test_list_all_returns_interactions_of_mixed_statuses(
+# ---------------------------------------------------------------------------
+# Count by status
+# ---------------------------------------------------------------------------
+
+class TestInteractionUseCaseCountByStatus:
+    """Tests for counting interactions per status."""
+
+    async def test_count_by_status_returns_store_counts(
         self,
         interaction_use_case: InteractionUseCase,
         mock_interaction_store: AsyncMock,
     ) -> None:
-        """list_all() returns interactions regardless of their status."""
-        interactions = [
-            _make_interaction("int-a", status=InteractionStatus.ANSWERED),
-            _make_interaction("int-b", status=InteractionStatus.UNKNOWN),
-        ]
-        mock_interaction_store.list_all.return_value = interactions
+        """count_by_status() returns the per-status counts from the store."""
+        counts = {InteractionStatus.ANSWERED: 4, InteractionStatus.UNKNOWN: 1}
+        mock_interaction_store.count_by_status.return_value = counts
 
-        result = await interaction_use_case.list_all()
+        result = await interaction_use_case.count_by_status()
 
-        statuses = {i.status for i in result}
-        assert InteractionStatus.ANSWERED in statuses
-        assert InteractionStatus.UNKNOWN in statuses
+        assert result == counts
+        mock_interaction_store.list_all.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -248,3 +260,70 @@ class TestInteractionUseCaseGet:
         assert result is not None
         assert len(result.citations) > 0
         assert result.citations[0].source_document == "policy.pdf"
+
+
+# ---------------------------------------------------------------------------
+# Caching
+# ---------------------------------------------------------------------------
+
+class TestInteractionUseCaseCache:
+    """Tests for lookups served from InteractionCache."""
+
+    async def test_get_is_served_from_cache(self, mock_interaction_store: AsyncMock) -> None:
+        """A second get() for the same ID does not reach the store."""
+        use_case = InteractionUseCase(mock_interaction_store, cache=InteractionCache())
+        interaction = _make_interaction("int-001")
+        mock_interaction_store.get.return_value = interaction
+
+        assert await use_case.get("int-001") is interaction
+        assert await use_case.get("int-001") is interaction
+
+        mock_interaction_store.get.assert_awaited_once_with("int-001")
+
+    async def test_missing_interaction_is_not_cached(
+        self, mock_interaction_store: AsyncMock
+    ) -> None:
+        """A miss is looked up again, since the interaction may still be saving."""
+        use_case = InteractionUseCase(mock_interaction_store, cache=InteractionCache())
+        mock_interaction_store.get.return_value = None
+        assert await use_case.get("int-001") is None
+
+        interaction = _make_interaction("int-001")
+        mock_interaction_store.get.return_value = interaction
+
+        assert await use_case.get("int-001") is interaction
+
+    async def test_list_all_is_served_from_cache(
+        self, mock_interaction_store: AsyncMock
+    ) -> None:
+        """A repeated page request does not reach the store."""
+        use_case = InteractionUseCase(mock_interaction_store, cache=InteractionCache())
+        mock_interaction_store.list_all.return_value = [_make_interaction("int-001")]
+
+        first = await use_case.list_all(kb_id="kb-001", limit=10)
+        second = await use_case.list_all(kb_id="kb-001", limit=10)
+
+        assert second == first
+        mock_interaction_store.list_all.assert_awaited_once_with(
+            kb_id="kb-001", limit=10, offset=0
+        )
+
+    async def test_page_read_during_a_save_is_not_cached(
+        self, mock_interaction_store: AsyncMock
+    ) -> None:
+        """A page read while an interaction was being saved is read again."""
+        cache = InteractionCache()
+        use_case = InteractionUseCase(mock_interaction_store, cache=cache)
+
+        async def list_during_save(**_: object) -> list[Interaction]:
+            cache.invalidate_pages()
+            return []
+
+        mock_interaction_store.list_all.side_effect = list_during_save
+        await use_case.list_all()
+        mock_interaction_store.list_all.side_effect = None
+        mock_interaction_store.list_all.return_value = [_make_interaction("int-001")]
+
+        result = await use_case.list_all()
+
+        assert [i.id for i in result] == ["int-001"]
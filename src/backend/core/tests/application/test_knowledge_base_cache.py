@@ -0,0 +1,73 @@
+"""Unit tests for KnowledgeBaseCache.
+
+Tests cover lookups by ID, the cached listing, TTL expiry, LRU eviction,
+and invalidation.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from app.application.cache.knowledge_base_cache import KnowledgeBaseCache
+from app.domain.models.knowledge_base import KnowledgeBase
+
+
+class TestKnowledgeBaseCache:
+    """Tests for KnowledgeBaseCache."""
+
+    def test_hit_returns_cached_kb(self) -> None:
+        """A stored knowledge base is returned by ID."""
+        cache = KnowledgeBaseCache()
+        kb = KnowledgeBase(id="kb-001", name="Support")
+        cache.put(kb, cache.generation)
+
+        assert cache.get("kb-001") is kb
+        assert cache.get("kb-002") is None
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        """Entries and the listing older than the TTL are not returned."""
+        cache = KnowledgeBaseCache(ttl_seconds=10.0)
+        kb = KnowledgeBase(id="kb-001", name="Support")
+        with patch("app.application.cache.knowledge_base_cache.time.monotonic", return_value=100.0):
+            cache.put(kb, cache.generation)
+            cache.put_all([kb], cache.generation)
+        with patch("app.application.cache.knowledge_base_cache.time.monotonic", return_value=111.0):
+            assert cache.get("kb-001") is None
+            assert cache.get_all() is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Exceeding max_entries evicts the least recently used entry."""
+        cache = KnowledgeBaseCache(max_entries=2)
+        cache.put(KnowledgeBase(id="kb-1", name="One"), cache.generation)
+        cache.put(KnowledgeBase(id="kb-2", name="Two"), cache.generation)
+        cache.get("kb-1")
+        cache.put(KnowledgeBase(id="kb-3", name="Three"), cache.generation)
+
+        assert cache.get("kb-2") is None
+        assert cache.get("kb-1") is not None
+
+    def test_invalidate_drops_entry_and_listing(self) -> None:
+        """invalidate() drops the knowledge base and the cached listing."""
+        cache = KnowledgeBaseCache()
+        kb = KnowledgeBase(id="kb-001", name="Support")
+        cache.put(kb, cache.generation)
+        cache.put_all([kb], cache.generation)
+
+        cache.invalidate("kb-001")
+
+        assert cache.get("kb-001") is None
+        assert cache.get_all() is None
+
+    def test_put_after_invalidation_is_dropped(self) -> None:
+        """Values read before an invalidation are not cached after it."""
+        cache = KnowledgeBaseCache()
+        kb = KnowledgeBase(id="kb-001", name="Support")
+        generation = cache.generation
+
+        cache.invalidate("kb-001")
+        cache.put(kb, generation)
+        cache.put_all([kb], generation)
+
+        assert cache.get("kb-001") is None
+        assert cache.get_all() is None
@@ -6,11 +6,16 @@ All port methods are mocked with AsyncMock.
 
 from __future__ import annotations
 
+import asyncio
+import uuid
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 
 import pytest
 
+from app.application.cache.knowledge_base_cache import KnowledgeBaseCache
+from app.application.cache.query_cache import QueryCache
+from app.domain.models.grounding import QueryResult
 from app.domain.models.knowledge_base import KnowledgeBase
 from app.domain.ports.document_store_port import DocumentStorePort
 from app.application.use_cases.knowledge_base_use_case import KnowledgeBaseUseCase
@@ -62,8 +67,6 @@ class TestKnowledgeBaseUseCaseCreate:
         self, kb_use_case: KnowledgeBaseUseCase, mock_document_store: AsyncMock
     ) -> None:
         """create() generates a UUID for the new KB's id."""
-        import uuid
-
         mock_document_store.create_kb.side_effect = lambda kb: kb
 
         result = await kb_use_case.create(name="UUID KB")
@@ -141,6 +144,25 @@ class TestKnowledgeBaseUseCaseListAll:
         mock_document_store.list_kbs.assert_called_once()
 
 
+# ---------------------------------------------------------------------------
+# Count
+# ---------------------------------------------------------------------------
+
+class TestKnowledgeBaseUseCaseCount:
+    """Tests for counting knowledge bases."""
+
+    async def test_count_returns_store_count(
+        self, kb_use_case: KnowledgeBaseUseCase, mock_document_store: AsyncMock
+    ) -> None:
+        """count() returns the number of KBs reported by the store."""
+        mock_document_store.count_kbs.return_value = 3
+
+        result = await kb_use_case.count()
+
+        assert result == 3
+        mock_document_store.list_kbs.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Get by ID
 # ---------------------------------------------------------------------------
@@ -204,3 +226,92 @@ class TestKnowledgeBaseUseCaseDelete:
         result = await kb_use_case.delete(kb_id="kb-1")
 
         assert result is None
+
+
+# ---------------------------------------------------------------------------
+# Caching
+# ---------------------------------------------------------------------------
+
+class TestKnowledgeBaseUseCaseCache:
+    """Tests for reads served from KnowledgeBaseCache."""
+
+    async def test_get_is_served_from_cache(self, mock_document_store: AsyncMock) -> None:
+        """A second get() for the same ID does not reach the store."""
+        use_case = KnowledgeBaseUseCase(mock_document_store, cache=KnowledgeBaseCache())
+        kb = KnowledgeBase(id="kb-001", name="Support")
+        mock_document_store.get_kb.return_value = kb
+
+        assert await use_case.get("kb-001") is kb
+        assert await use_case.get("kb-001") is kb
+
+        mock_document_store.get_kb.assert_awaited_once_with("kb-001")
+
+    async def test_delete_invalidates_cached_reads(self, mock_document_store: AsyncMock) -> None:
+        """delete() evicts the KB so later reads go back to the store."""
+        use_case = KnowledgeBaseUseCase(mock_document_store, cache=KnowledgeBaseCache())
+        kb = KnowledgeBase(id="kb-001", name="Support")
+        mock_document_store.get_kb.return_value = kb
+        mock_document_store.list_kbs.return_value = [kb]
+        await use_case.get("kb-001")
+        await use_case.list_all()
+
+        await use_case.delete("kb-001")
+        mock_document_store.get_kb.return_value = None
+        mock_document_store.list_kbs.return_value = []
+
+        assert await use_case.get("kb-001") is None
+        assert await use_case.list_all() == []
+
+    async def test_delete_invalidates_cached_query_results(
+        self, mock_document_store: AsyncMock
+    ) -> None:
+        """delete() drops cached answers for the KB, by question and by embedding."""
+        query_cache = QueryCache()
+        query_cache.put(
+            "kb-001",
+            "Q?",
+            [1.0, 0.0],
+            QueryResult(status="unknown", answer=None, citations=[], interaction_id="int-1"),
+        )
+        use_case = KnowledgeBaseUseCase(mock_document_store, query_cache=query_cache)
+
+        await use_case.delete("kb-001")
+
+        assert query_cache.get("kb-001", "Q?") is None
+        assert query_cache.get_similar("kb-001", [1.0, 0.0]) is None
+
+    async def test_read_racing_delete_is_not_cached(self, mock_document_store: AsyncMock) -> None:
+        """A get() and list_all() that read before a concurrent delete() are not cached."""
+        use_case = KnowledgeBaseUseCase(mock_document_store, cache=KnowledgeBaseCache())
+        kb = KnowledgeBase(id="kb-001", name="Support")
+        read_started = asyncio.Event()
+        deleted = asyncio.Event()
+
+        async def get_before_delete(_: str) -> KnowledgeBase:
+            read_started.set()
+            await deleted.wait()
+            return kb
+
+        async def list_before_delete() -> list[KnowledgeBase]:
+            read_started.set()
+            await deleted.wait()
+            return [kb]
+
+        async def delete_during_read() -> None:
+            await read_started.wait()
+            await use_case.delete("kb-001")
+            deleted.set()
+
+        mock_document_store.get_kb.side_effect = get_before_delete
+        await asyncio.gather(use_case.get("kb-001"), delete_during_read())
+        read_started.clear()
+        deleted.clear()
+        mock_document_store.list_kbs.side_effect = list_before_delete
+        await asyncio.gather(use_case.list_all(), delete_during_read())
+
+        mock_document_store.get_kb.side_effect = None
+        mock_document_store.get_kb.return_value = None
+        mock_document_store.list_kbs.side_effect = None
+        mock_document_store.list_kbs.return_value = []
+        assert await use_case.get("kb-001") is None
+        assert await use_case.list_all() == []
@@ -0,0 +1,171 @@
+"""Unit tests for QueryCache.
+
+Tests cover exact question hits, approximate embedding hits, TTL expiry,
+LRU eviction, and per-knowledge-base invalidation.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from app.application.cache.query_cache import QueryCache
+from app.domain.models.citation import Citation
+from app.domain.models.grounding import QueryResult
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_result(interaction_id: str = "int-001") -> QueryResult:
+    """Return an answered QueryResult with a single citation."""
+    return QueryResult(
+        status="answered",
+        answer="Refunds are accepted within 30 days.",
+        citations=[
+            Citation(source_document="policy.pdf", page=1, chunk_id="c1", relevance_score=0.0)
+        ],
+        interaction_id=interaction_id,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Exact hits
+# ---------------------------------------------------------------------------
+
+class TestQueryCacheExact:
+    """Tests for lookups by normalized question text."""
+
+    def test_miss_on_empty_cache(self) -> None:
+        """An empty cache returns None."""
+        assert QueryCache().get("kb-001", "What is the refund policy?") is None
+
+    def test_hit_returns_cached_result(self) -> None:
+        """A stored result is returned for the same question."""
+        cache = QueryCache()
+        result = _make_result()
+        cache.put("kb-001", "What is the refund policy?", None, result)
+
+        assert cache.get("kb-001", "What is the refund policy?") is result
+
+    def test_hit_ignores_case_and_whitespace(self) -> None:
+        """Questions differing only in case and whitespace share an entry."""
+        cache = QueryCache()
+        result = _make_result()
+        cache.put("kb-001", "What is the refund policy?", None, result)
+
+        assert cache.get("kb-001", "  what is   the REFUND policy? ") is result
+
+    def test_entries_are_scoped_to_knowledge_base(self) -> None:
+        """The same question in another knowledge base is a miss."""
+        cache = QueryCache()
+        cache.put("kb-001", "What is the refund policy?", None, _make_result())
+
+        assert cache.get("kb-002", "What is the refund policy?") is None
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        """Entries older than the TTL are not returned."""
+        cache = QueryCache(ttl_seconds=10.0)
+        with patch("app.application.cache.query_cache.time.monotonic", return_value=100.0):
+            cache.put("kb-001", "What is the refund policy?", None, _make_result())
+        with patch("app.application.cache.query_cache.time.monotonic", return_value=111.0):
+            assert cache.get("kb-001", "What is the refund policy?") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Exceeding max_entries evicts the least recently used entry."""
+        cache = QueryCache(max_entries=2)
+        cache.put("kb-001", "first", None, _make_result("int-1"))
+        cache.put("kb-001", "second", None, _make_result("int-2"))
+        cache.get("kb-001", "first")
+        cache.put("kb-001", "third", None, _make_result("int-3"))
+
+        assert cache.get("kb-001", "second") is None
+        assert cache.get("kb-001", "first") is not None
+        assert cache.get("kb-001", "third") is not None
+
+
+# ---------------------------------------------------------------------------
+# Approximate hits
+# ---------------------------------------------------------------------------
+
+class TestQueryCacheSimilar:
+    """Tests for lookups by question embedding."""
+
+    def test_near_duplicate_embedding_is_a_hit(self) -> None:
+        """An embedding above the similarity threshold reuses the result."""
+        cache = QueryCache(similarity_threshold=0.97)
+        result = _make_result()
+        cache.put("kb-001", "What is the refund policy?", [1.0, 0.0, 0.0], result)
+
+        assert cache.get_similar("kb-001", [0.99, 0.05, 0.0]) is result
+
+    def test_dissimilar_embedding_is_a_miss(self) -> None:
+        """An embedding below the similarity threshold is a miss."""
+        cache = QueryCache(similarity_threshold=0.97)
+        cache.put("kb-001", "What is the refund policy?", [1.0, 0.0, 0.0], _make_result())
+
+        assert cache.get_similar("kb-001", [0.0, 1.0, 0.0]) is None
+
+    def test_similarity_is_scale_invariant(self) -> None:
+        """Embeddings are compared by cosine similarity, not raw dot product."""
+        cache = QueryCache()
+        result = _make_result()
+        cache.put("kb-001", "What is the refund policy?", [2.0, 2.0], result)
+
+        assert cache.get_similar("kb-001", [0.5, 0.5]) is result
+
+    def test_similar_lookup_is_scoped_to_knowledge_base(self) -> None:
+        """Matching embeddings from another knowledge base are ignored."""
+        cache = QueryCache()
+        cache.put("kb-001", "What is the refund policy?", [1.0, 0.0], _make_result())
+
+        assert cache.get_similar("kb-002", [1.0, 0.0]) is None
+
+    def test_most_similar_entry_wins(self) -> None:
+        """Among several entries above the threshold, the closest one is returned."""
+        cache = QueryCache(similarity_threshold=0.9)
+        cache.put("kb-001", "first", [1.0, 0.2], _make_result("int-1"))
+        cache.put("kb-001", "second", [1.0, 0.0], _make_result("int-2"))
+        cache.put("kb-001", "third", [1.0, 0.4], _make_result("int-3"))
+
+        assert cache.get_similar("kb-001", [1.0, 0.01]).interaction_id == "int-2"
+
+    def test_evicted_and_expired_entries_are_not_similar_hits(self) -> None:
+        """Embeddings leave the similarity lookup with their entries."""
+        cache = QueryCache(max_entries=2, ttl_seconds=10.0)
+        with patch("app.application.cache.query_cache.time.monotonic", return_value=100.0):
+            cache.put("kb-001", "first", [1.0, 0.0], _make_result("int-1"))
+            cache.put("kb-001", "second", [0.0, 1.0], _make_result("int-2"))
+            cache.put("kb-001", "third", [0.6, 0.8], _make_result("int-3"))
+
+            assert cache.get_similar("kb-001", [1.0, 0.0]) is None
+            assert cache.get_similar("kb-001", [0.0, 1.0]).interaction_id == "int-2"
+        with patch("app.application.cache.query_cache.time.monotonic", return_value=111.0):
+            assert cache.get_similar("kb-001", [0.0, 1.0]) is None
+
+    def test_zero_embedding_is_a_miss(self) -> None:
+        """A zero vector has no direction and never matches."""
+        cache = QueryCache()
+        cache.put("kb-001", "What is the refund policy?", [1.0, 0.0], _make_result())
+
+        assert cache.get_similar("kb-001", [0.0, 0.0]) is None
+
+
+# ---------------------------------------------------------------------------
+# Invalidation
+# ---------------------------------------------------------------------------
+
+class TestQueryCacheInvalidate:
+    """Tests for per-knowledge-base invalidation."""
+
+    def test_invalidate_drops_only_that_knowledge_base(self) -> None:
+        """invalidate() removes entries of one knowledge base and keeps others."""
+        cache = QueryCache()
+        cache.put("kb-001", "question", [1.0, 0.0], _make_result("int-1"))
+        cache.put("kb-002", "question", [1.0, 0.0], _make_result("int-2"))
+
+        cache.invalidate("kb-001")
+
+        assert cache.get("kb-001", "question") is None
+        assert cache.get_similar("kb-001", [1.0, 0.0]) is None
+        assert cache.get("kb-002", "question") is not None
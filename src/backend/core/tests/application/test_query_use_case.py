@@ -7,15 +7,24 @@ but its behaviour is controlled through the content of the mocked chunks and ans
 
 from __future__ import annotations
 
+import asyncio
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
+from app.application.cache.interaction_cache import InteractionCache
+from app.application.cache.query_cache import QueryCache
 from app.domain.models.chunk import Chunk
 from app.domain.models.grounding import GroundingDecision
 from app.domain.models.interaction import InteractionStatus
-from app.application.use_cases.query_use_case import QueryUseCase, UNKNOWN_MESSAGE
+from app.application.use_cases.query_use_case import (
+    INSTRUCTIONS,
+    QueryUseCase,
+    UNKNOWN_MESSAGE,
+    drain_pending_saves,
+)
+from app.domain.services.grounding_service import GroundingService
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +49,14 @@ def _make_chunk(chunk_id: str, content: str) -> Chunk:
 class TestQueryUseCaseSuccess:
     """Tests for the happy path: query returns 'answered'."""
 
+    @pytest.fixture
+    def grounded_refund(self, mock_vectorstore: AsyncMock, mock_llm: AsyncMock) -> None:
+        """Retrieve one refund-policy chunk and generate an answer grounded in it."""
+        mock_vectorstore.search.return_value = [
+            _make_chunk("c1", "Refunds allowed within 30 days purchase.")
+        ]
+        mock_llm.generate.return_value = "Refunds allowed within 30 days purchase."
+
     async def test_successful_query_returns_answered_status(
         self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock, mock_llm: AsyncMock
     ) -> None:
@@ -69,14 +86,11 @@ class TestQueryUseCaseSuccess:
         assert result.answer == expected_answer
         assert result.answer != UNKNOWN_MESSAGE
 
+    @pytest.mark.usefixtures("grounded_refund")
     async def test_successful_query_returns_interaction_id(
-        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock, mock_llm: AsyncMock
+        self, query_use_case: QueryUseCase
     ) -> None:
         """A UUID interaction_id is always included in the result."""
-        chunks = [_make_chunk("c1", "Refunds allowed within 30 days purchase.")]
-        mock_vectorstore.search.return_value = chunks
-        mock_llm.generate.return_value = "Refunds allowed within 30 days purchase."
-
         result = await query_use_case.execute(kb_id="kb-001", question="Refund?")
 
         assert result.interaction_id is not None
@@ -105,34 +119,27 @@ class TestQueryUseCaseSuccess:
         for citation in result.citations:
             assert citation.chunk_id in chunk_ids
 
+    @pytest.mark.usefixtures("grounded_refund")
     async def test_successful_query_saves_interaction_with_answered_status(
-        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock,
-        mock_llm: AsyncMock, mock_interaction_store: AsyncMock
+        self, query_use_case: QueryUseCase, mock_interaction_store: AsyncMock
     ) -> None:
         """An ANSWERED interaction is persisted to the interaction store."""
-        chunks = [_make_chunk("c1", "Refunds allowed within 30 days purchase.")]
-        mock_vectorstore.search.return_value = chunks
-        mock_llm.generate.return_value = "Refunds allowed within 30 days purchase."
-
         await query_use_case.execute(kb_id="kb-001", question="Refund?")
 
         mock_interaction_store.save.assert_called_once()
         saved_interaction = mock_interaction_store.save.call_args[0][0]
         assert saved_interaction.status == InteractionStatus.ANSWERED
 
+    @pytest.mark.usefixtures("grounded_refund")
     async def test_llm_embed_called_with_question(
-        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock,
-        mock_llm: AsyncMock
+        self, query_use_case: QueryUseCase, mock_llm: AsyncMock
     ) -> None:
         """LLM embed is called with the user's question to produce the query vector."""
-        chunks = [_make_chunk("c1", "Refunds allowed within 30 days purchase.")]
-        mock_vectorstore.search.return_value = chunks
-        mock_llm.generate.return_value = "Refunds allowed within 30 days purchase."
-
         await query_use_case.execute(kb_id="kb-001", question="Refund policy?")
 
         mock_llm.embed.assert_called_once_with("Refund policy?")
 
+    @pytest.mark.usefixtures("grounded_refund")
     async def test_vectorstore_search_called_with_embedding_and_kb_id(
         self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock,
         mock_llm: AsyncMock
@@ -140,14 +147,55 @@ class TestQueryUseCaseSuccess:
         """Vector store search receives the query embedding and correct kb_id."""
         query_vector = [0.9, 0.8, 0.7]
         mock_llm.embed.return_value = query_vector
-        chunks = [_make_chunk("c1", "Refunds allowed within 30 days purchase.")]
-        mock_vectorstore.search.return_value = chunks
-        mock_llm.generate.return_value = "Refunds allowed within 30 days purchase."
 
         await query_use_case.execute(kb_id="kb-test", question="Refund?")
 
         mock_vectorstore.search.assert_called_once_with(query_vector, "kb-test")
 
+    async def test_generate_receives_context_separately_from_question(
+        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock, mock_llm: AsyncMock
+    ) -> None:
+        """Chunks go into the context argument only, ordered by chunk ID."""
+        mock_vectorstore.search.return_value = [
+            _make_chunk("c2", "Returns require original receipt."),
+            _make_chunk("c1", "Refunds are allowed within 30 days."),
+        ]
+
+        await query_use_case.execute(kb_id="kb-001", question="What is the refund policy?")
+
+        prompt, context = mock_llm.generate.call_args[0]
+        assert context.index("[Chunk c1]") < context.index("[Chunk c2]")
+        assert "[Chunk" not in prompt
+        assert prompt.endswith("Question: What is the refund policy?")
+
+    async def test_duplicate_chunk_content_is_sent_once(
+        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock, mock_llm: AsyncMock
+    ) -> None:
+        """Chunks with identical content appear once in the context and citations."""
+        mock_vectorstore.search.return_value = [
+            _make_chunk("c1", "Refunds allowed within 30 days purchase receipt."),
+            _make_chunk("c2", "Refunds allowed within 30 days purchase receipt."),
+        ]
+        mock_llm.generate.return_value = "Refunds allowed within 30 days purchase receipt."
+
+        result = await query_use_case.execute(kb_id="kb-001", question="Refund policy?")
+
+        context = mock_llm.generate.call_args[0][1]
+        assert "[Chunk c1]" in context
+        assert "[Chunk c2]" not in context
+        assert [c.chunk_id for c in result.citations] == ["c1"]
+
+    async def test_generate_receives_constant_instructions_as_system_prompt(
+        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock, mock_llm: AsyncMock
+    ) -> None:
+        """The KB-only instructions are passed as the system prompt, not in the prompt."""
+        mock_vectorstore.search.return_value = [_make_chunk("c1", "Refunds allowed.")]
+
+        await query_use_case.execute(kb_id="kb-001", question="What is the refund policy?")
+
+        assert mock_llm.generate.call_args[1]["system_prompt"] == INSTRUCTIONS
+        assert INSTRUCTIONS not in mock_llm.generate.call_args[0][0]
+
     async def test_citations_have_source_document_from_metadata(
         self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock, mock_llm: AsyncMock
     ) -> None:
@@ -240,64 +288,45 @@ class TestQueryUseCaseNoChunks:
 class TestQueryUseCaseGroundingFails:
     """Tests for the case where chunks exist but the answer is not grounded."""
 
-    async def test_ungrounded_answer_returns_unknown_status(
-        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock,
-        mock_llm: AsyncMock
-    ) -> None:
-        """When grounding fails the result status is 'unknown'."""
-        # Chunks about one topic, LLM generates completely unrelated answer
-        chunks = [_make_chunk("c1", "The store is located in downtown Manhattan area.")]
-        mock_vectorstore.search.return_value = chunks
+    @pytest.fixture(autouse=True)
+    def ungrounded_answer(self, mock_vectorstore: AsyncMock, mock_llm: AsyncMock) -> None:
+        """Retrieve a store-location chunk and generate an unrelated answer."""
+        mock_vectorstore.search.return_value = [
+            _make_chunk("c1", "The store is located in downtown Manhattan area.")
+        ]
         # Unrelated answer — no keyword overlap with chunks
         mock_llm.generate.return_value = (
             "Jupiter astronomy planet universe galaxy telescope nebula observatory cosmos."
         )
 
+    async def test_ungrounded_answer_returns_unknown_status(
+        self, query_use_case: QueryUseCase
+    ) -> None:
+        """When grounding fails the result status is 'unknown'."""
         result = await query_use_case.execute(kb_id="kb-001", question="Where is the store?")
 
         assert result.status == "unknown"
 
     async def test_ungrounded_answer_returns_unknown_message(
-        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock,
-        mock_llm: AsyncMock
+        self, query_use_case: QueryUseCase
     ) -> None:
         """The UNKNOWN_MESSAGE is returned when grounding fails."""
-        chunks = [_make_chunk("c1", "The store is located in downtown Manhattan area.")]
-        mock_vectorstore.search.return_value = chunks
-        mock_llm.generate.return_value = (
-            "Jupiter astronomy planet universe galaxy telescope nebula observatory cosmos."
-        )
-
         result = await query_use_case.execute(kb_id="kb-001", question="Where is the store?")
 
         assert result.answer == UNKNOWN_MESSAGE
 
     async def test_ungrounded_answer_returns_empty_citations(
-        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock,
-        mock_llm: AsyncMock
+        self, query_use_case: QueryUseCase
     ) -> None:
         """No citations are returned when grounding fails."""
-        chunks = [_make_chunk("c1", "The store is located in downtown Manhattan area.")]
-        mock_vectorstore.search.return_value = chunks
-        mock_llm.generate.return_value = (
-            "Jupiter astronomy planet universe galaxy telescope nebula observatory cosmos."
-        )
-
         result = await query_use_case.execute(kb_id="kb-001", question="Where is the store?")
 
         assert result.citations == []
 
     async def test_ungrounded_answer_saves_unknown_interaction(
-        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock,
-        mock_llm: AsyncMock, mock_interaction_store: AsyncMock
+        self, query_use_case: QueryUseCase, mock_interaction_store: AsyncMock
     ) -> None:
         """An UNKNOWN interaction is persisted when grounding fails."""
-        chunks = [_make_chunk("c1", "The store is located in downtown Manhattan area.")]
-        mock_vectorstore.search.return_value = chunks
-        mock_llm.generate.return_value = (
-            "Jupiter astronomy planet universe galaxy telescope nebula observatory cosmos."
-        )
-
         await query_use_case.execute(kb_id="kb-001", question="Where is the store?")
 
         mock_interaction_store.save.assert_called_once()
@@ -305,16 +334,9 @@ class TestQueryUseCaseGroundingFails:
         assert saved.status == InteractionStatus.UNKNOWN
 
     async def test_ungrounded_answer_still_includes_interaction_id(
-        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock,
-        mock_llm: AsyncMock
+        self, query_use_case: QueryUseCase
     ) -> None:
         """interaction_id is always present even when grounding fails."""
-        chunks = [_make_chunk("c1", "Store located downtown Manhattan.")]
-        mock_vectorstore.search.return_value = chunks
-        mock_llm.generate.return_value = (
-            "Jupiter astronomy planet universe galaxy telescope nebula observatory cosmos."
-        )
-
         result = await query_use_case.execute(kb_id="kb-001", question="Q?")
 
         assert result.interaction_id is not None
@@ -350,3 +372,211 @@ class TestQueryUseCaseInteractionId:
 
         saved = mock_interaction_store.save.call_args[0][0]
         assert saved.id == result.interaction_id
+
+
+# ---------------------------------------------------------------------------
+# Speculative drafts
+# ---------------------------------------------------------------------------
+
+class TestQueryUseCaseDraft:
+    """Tests for speculative generation with a draft model."""
+
+    async def test_grounded_draft_is_used_as_answer(
+        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock, mock_llm: AsyncMock
+    ) -> None:
+        """A grounded draft becomes the answer."""
+        mock_vectorstore.search.return_value = [
+            _make_chunk("c1", "Refunds allowed within 30 days purchase receipt."),
+        ]
+        mock_llm.generate_draft.return_value = "Refunds allowed within 30 days."
+        mock_llm.generate.return_value = "Refunds allowed within 30 days purchase receipt."
+
+        result = await query_use_case.execute(kb_id="kb-001", question="Refund policy?")
+
+        assert result.status == "answered"
+        assert result.answer == "Refunds allowed within 30 days."
+
+    async def test_ungrounded_draft_falls_back_to_full_generation(
+        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock, mock_llm: AsyncMock
+    ) -> None:
+        """An ungrounded draft is discarded in favour of the full answer."""
+        mock_vectorstore.search.return_value = [
+            _make_chunk("c1", "Refunds allowed within 30 days purchase receipt."),
+        ]
+        mock_llm.generate_draft.return_value = "Bananas grow on tropical plantations."
+        mock_llm.generate.return_value = "Refunds allowed within 30 days purchase receipt."
+
+        result = await query_use_case.execute(kb_id="kb-001", question="Refund policy?")
+
+        assert result.status == "answered"
+        assert result.answer == "Refunds allowed within 30 days purchase receipt."
+
+    async def test_full_generation_error_propagates_without_draft(
+        self, query_use_case: QueryUseCase, mock_vectorstore: AsyncMock, mock_llm: AsyncMock
+    ) -> None:
+        """Without a draft, a failing full generation still raises."""
+        mock_vectorstore.search.return_value = [_make_chunk("c1", "Refunds allowed.")]
+        mock_llm.generate.side_effect = RuntimeError("LLM unavailable")
+
+        with pytest.raises(RuntimeError, match="LLM unavailable"):
+            await query_use_case.execute(kb_id="kb-001", question="Refund policy?")
+
+
+# ---------------------------------------------------------------------------
+# Query cache
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def cached_query_use_case(
+    mock_llm: AsyncMock,
+    mock_vectorstore: AsyncMock,
+    mock_interaction_store: AsyncMock,
+    grounding_service: GroundingService,
+) -> QueryUseCase:
+    """QueryUseCase wired with a fresh QueryCache."""
+    return QueryUseCase(
+        llm=mock_llm,
+        vectorstore=mock_vectorstore,
+        interaction_store=mock_interaction_store,
+        grounding_service=grounding_service,
+        cache=QueryCache(),
+    )
+
+
+class TestQueryUseCaseCache:
+    """Tests for short-circuiting the pipeline through the query cache."""
+
+    async def test_repeated_question_skips_generation(
+        self, cached_query_use_case: QueryUseCase, mock_vectorstore: AsyncMock,
+        mock_llm: AsyncMock
+    ) -> None:
+        """A repeated question is answered from the cache without embedding or generating."""
+        mock_vectorstore.search.return_value = [
+            _make_chunk("c1", "Refunds allowed within 30 days purchase receipt."),
+        ]
+        mock_llm.generate.return_value = "Refunds allowed within 30 days purchase receipt."
+
+        first = await cached_query_use_case.execute(kb_id="kb-001", question="Refund policy?")
+        second = await cached_query_use_case.execute(kb_id="kb-001", question="refund policy?")
+
+        assert mock_llm.embed.call_count == 1
+        assert mock_llm.generate.call_count == 1
+        assert second.status == first.status
+        assert second.answer == first.answer
+        assert second.citations == first.citations
+
+    async def test_cache_hit_gets_new_interaction_id(
+        self, cached_query_use_case: QueryUseCase, mock_interaction_store: AsyncMock
+    ) -> None:
+        """A cached result is re-issued and persisted under a fresh interaction ID."""
+        first = await cached_query_use_case.execute(kb_id="kb-001", question="Q?")
+        second = await cached_query_use_case.execute(kb_id="kb-001", question="Q?")
+
+        assert second.interaction_id != first.interaction_id
+        assert mock_interaction_store.save.call_count == 2
+        saved = mock_interaction_store.save.call_args[0][0]
+        assert saved.id == second.interaction_id
+        assert saved.status == InteractionStatus.UNKNOWN
+
+    async def test_similar_embedding_skips_retrieval(
+        self, cached_query_use_case: QueryUseCase, mock_vectorstore: AsyncMock
+    ) -> None:
+        """A differently worded question with the same embedding skips search()."""
+        await cached_query_use_case.execute(kb_id="kb-001", question="Refund policy?")
+        await cached_query_use_case.execute(kb_id="kb-001", question="How do refunds work?")
+
+        mock_vectorstore.search.assert_called_once()
+
+    async def test_failed_save_is_not_cached(
+        self, cached_query_use_case: QueryUseCase, mock_interaction_store: AsyncMock,
+        mock_vectorstore: AsyncMock
+    ) -> None:
+        """A result whose interaction could not be saved is not served to later callers."""
+        mock_interaction_store.save.side_effect = RuntimeError("database is locked")
+        with pytest.raises(RuntimeError):
+            await cached_query_use_case.execute(kb_id="kb-001", question="Q?")
+        mock_interaction_store.save.side_effect = None
+
+        await cached_query_use_case.execute(kb_id="kb-001", question="Q?")
+
+        assert mock_vectorstore.search.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Background persistence
+# ---------------------------------------------------------------------------
+
+class TestQueryUseCaseBackgroundPersistence:
+    """Tests for returning before the interaction write completes."""
+
+    @pytest.fixture
+    def background_use_case(
+        self,
+        mock_llm: AsyncMock,
+        mock_vectorstore: AsyncMock,
+        mock_interaction_store: AsyncMock,
+        grounding_service: GroundingService,
+    ) -> QueryUseCase:
+        """QueryUseCase that persists interactions in the background."""
+        return QueryUseCase(
+            llm=mock_llm,
+            vectorstore=mock_vectorstore,
+            interaction_store=mock_interaction_store,
+            grounding_service=grounding_service,
+            persist_in_background=True,
+        )
+
+    async def test_result_is_returned_before_save_completes(
+        self, background_use_case: QueryUseCase, mock_interaction_store: AsyncMock
+    ) -> None:
+        """execute() returns while the save is still pending; draining finishes it."""
+        saved = asyncio.Event()
+
+        async def slow_save(interaction):
+            await asyncio.sleep(0)
+            saved.set()
+            return interaction
+
+        mock_interaction_store.save.side_effect = slow_save
+
+        result = await background_use_case.execute(kb_id="kb-001", question="Q?")
+
+        assert result.status == "unknown"
+        assert not saved.is_set()
+        await drain_pending_saves()
+        assert saved.is_set()
+
+    async def test_failed_background_save_does_not_fail_query(
+        self, background_use_case: QueryUseCase, mock_interaction_store: AsyncMock
+    ) -> None:
+        """A failing background write does not surface to the caller."""
+        mock_interaction_store.save.side_effect = RuntimeError("database is locked")
+
+        result = await background_use_case.execute(kb_id="kb-001", question="Q?")
+        await drain_pending_saves()
+
+        assert result.status == "unknown"
+
+    async def test_completed_save_drops_cached_interaction_pages(
+        self,
+        mock_llm: AsyncMock,
+        mock_vectorstore: AsyncMock,
+        mock_interaction_store: AsyncMock,
+        grounding_service: GroundingService,
+    ) -> None:
+        """Listing pages cached before a query are dropped once its save completes."""
+        interaction_cache = InteractionCache()
+        interaction_cache.put_page((None, 50, 0), [], interaction_cache.generation)
+        use_case = QueryUseCase(
+            llm=mock_llm,
+            vectorstore=mock_vectorstore,
+            interaction_store=mock_interaction_store,
+            grounding_service=grounding_service,
+            persist_in_background=True,
+            interaction_cache=interaction_cache,
+        )
+
+        await use_case.execute(kb_id="kb-001", question="Q?")
+        await drain_pending_saves()
+
+        assert interaction_cache.get_page((None, 50, 0)) is None
@@ -32,16 +32,17 @@ from app.application.use_cases.query_use_case import QueryUseCase
 @pytest.fixture
 def mock_llm() -> AsyncMock:
     """Mock LLMPort with async embed and generate methods."""
-    mock = AsyncMock(spec=LLMPort)
+    mock = AsyncMock(spec_set=LLMPort)
     mock.embed.return_value = [0.1, 0.2, 0.3, 0.4, 0.5]
     mock.generate.return_value = "This is a generated answer."
+    mock.generate_draft.return_value = None
     return mock
 
 
 @pytest.fixture
 def mock_vectorstore() -> AsyncMock:
     """Mock VectorStorePort with async methods."""
-    mock = AsyncMock(spec=VectorStorePort)
+    mock = AsyncMock(spec_set=VectorStorePort)
     mock.store.return_value = None
     mock.search.return_value = []
     mock.delete_by_document.return_value = None
@@ -52,24 +53,29 @@ def mock_vectorstore() -> AsyncMock:
 @pytest.fixture
 def mock_interaction_store() -> AsyncMock:
     """Mock InteractionStorePort with async methods."""
-    mock = AsyncMock(spec=InteractionStorePort)
+    mock = AsyncMock(spec_set=InteractionStorePort)
     mock.save.side_effect = lambda interaction: interaction
     mock.get.return_value = None
     mock.list_all.return_value = []
+    mock.stream_all.return_value.__aiter__.return_value = []
+    mock.count_by_status.return_value = {}
     return mock
 
 
 @pytest.fixture
 def mock_document_store() -> AsyncMock:
     """Mock DocumentStorePort with async methods."""
-    mock = AsyncMock(spec=DocumentStorePort)
+    mock = AsyncMock(spec_set=DocumentStorePort)
     mock.create_kb.side_effect = lambda kb: kb
     mock.get_kb.return_value = None
     mock.list_kbs.return_value = []
+    mock.count_kbs.return_value = 0
     mock.delete_kb.return_value = None
     mock.save_document.side_effect = lambda doc: doc
     mock.get_document.return_value = None
     mock.list_documents.return_value = []
+    mock.stream_documents.return_value.__aiter__.return_value = []
+    mock.count_documents.return_value = 0
     mock.delete_document.return_value = None
     mock.update_document_status.return_value = None
     return mock
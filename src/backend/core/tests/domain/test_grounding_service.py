@@ -184,6 +184,22 @@ class TestGroundingServiceConfidenceScoring:
         assert decision.confidence == 0.0
         assert decision.is_grounded is False
 
+    def test_stopword_only_answer_skips_chunk_processing(
+        self, grounding_service: GroundingService
+    ) -> None:
+        """A stopword-only answer is rejected before any chunk text is examined."""
+
+        class _UnreadableContent(str):
+            def lower(self) -> str:
+                raise AssertionError("chunk content should not be processed")
+
+        chunks = [_make_chunk("c1", _UnreadableContent("Some content about products."))]
+
+        decision = grounding_service.evaluate("Question?", "No it is not", chunks)
+
+        assert decision.is_grounded is False
+        assert decision.reasoning == "No meaningful content in answer"
+
     def test_confidence_between_zero_and_one(
         self, grounding_service: GroundingService
     ) -> None:
@@ -223,3 +239,54 @@ class TestGroundingServiceConfidenceScoring:
 
         # c1 matches refund/days; c2 about store hours should not be primary match
         assert "c1" in decision.supporting_chunks
+
+    def test_word_found_in_several_chunks_counts_once(
+        self, grounding_service: GroundingService
+    ) -> None:
+        """Overlap counts distinct answer words, however many chunks contain them."""
+        chunks = [
+            _make_chunk("c1", "Refunds are processed within 30 days."),
+            _make_chunk("c2", "Refunds require a receipt."),
+        ]
+        answer = "refunds receipt"
+
+        decision = grounding_service.evaluate("Refund policy?", answer, chunks)
+
+        assert decision.confidence == 1.0
+        assert decision.supporting_chunks == ["c1", "c2"]
+
+    def test_words_match_inside_longer_chunk_words(
+        self, grounding_service: GroundingService
+    ) -> None:
+        """An answer word is found when it occurs inside a longer chunk word."""
+        chunks = [_make_chunk("c1", "Refunds are issued to the original card.")]
+        answer = "refund issued"
+
+        decision = grounding_service.evaluate("Refunds?", answer, chunks)
+
+        assert decision.confidence == 1.0
+        assert decision.supporting_chunks == ["c1"]
+
+    def test_longer_answer_words_do_not_match_shorter_chunk_words(
+        self, grounding_service: GroundingService
+    ) -> None:
+        """Inflections longer than the chunk's word are not found in it."""
+        chunks = [_make_chunk("c1", "Orders ship within two days.")]
+        answer = "shipped shipping"
+
+        decision = grounding_service.evaluate("Shipping?", answer, chunks)
+
+        assert decision.confidence == 0.0
+        assert decision.supporting_chunks == []
+
+    def test_answer_punctuation_is_part_of_the_word(
+        self, grounding_service: GroundingService
+    ) -> None:
+        """Answer words are split on whitespace only, keeping their punctuation."""
+        chunks = [_make_chunk("c1", "Returns are accepted within 30 days")]
+        answer = "accepted within 30 days."
+
+        decision = grounding_service.evaluate("Returns?", answer, chunks)
+
+        assert decision.confidence == 0.75
+        assert decision.reasoning.startswith("Keyword overlap: 3/4")
@@ -62,12 +62,18 @@ class TestKnowledgeBaseModel:
         assert kb.created_at == now
         assert kb.updated_at == now
 
-    def test_is_mutable_dataclass(self) -> None:
-        """KnowledgeBase fields can be updated (not frozen)."""
+    def test_is_frozen(self) -> None:
+        """KnowledgeBase is a frozen dataclass — mutation raises an error."""
         kb = KnowledgeBase(id="kb-1", name="Old Name")
-        kb.name = "New Name"
 
-        assert kb.name == "New Name"
+        with pytest.raises(AttributeError):
+            kb.name = "New Name"  # type: ignore[misc]
+
+    def test_has_no_instance_dict(self) -> None:
+        """KnowledgeBase uses __slots__ instead of a per-instance __dict__."""
+        kb = KnowledgeBase(id="kb-1", name="My KB")
+
+        assert not hasattr(kb, "__dict__")
 
 
 # ---------------------------------------------------------------------------
@@ -235,6 +241,19 @@ class TestInteractionModel:
 
         assert len(int_b.citations) == 0
 
+    def test_interaction_is_frozen(self) -> None:
+        """Interaction is a frozen dataclass — mutation raises an error."""
+        interaction = Interaction(id="int-1", kb_id="kb-1", question="Q?")
+
+        with pytest.raises(AttributeError):
+            interaction.answer = "A."  # type: ignore[misc]
+
+    def test_interaction_has_no_instance_dict(self) -> None:
+        """Interaction uses __slots__ instead of a per-instance __dict__."""
+        interaction = Interaction(id="int-1", kb_id="kb-1", question="Q?")
+
+        assert not hasattr(interaction, "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # Citation
@@ -277,9 +296,15 @@ class TestCitationModel:
             relevance_score=0.9,
         )
 
-        with pytest.raises((AttributeError, TypeError)):
+        with pytest.raises(AttributeError):
             citation.relevance_score = 0.5  # type: ignore[misc]
 
+    def test_citation_has_no_instance_dict(self) -> None:
+        """Citation uses __slots__ instead of a per-instance __dict__."""
+        citation = Citation(source_document="a.pdf", page=1, chunk_id="c1", relevance_score=0.9)
+
+        assert not hasattr(citation, "__dict__")
+
     def test_citation_equality_by_value(self) -> None:
         """Two Citations with identical field values are equal."""
         c1 = Citation(source_document="a.pdf", page=1, chunk_id="c1", relevance_score=0.9)
@@ -334,9 +359,15 @@ class TestGroundingDecisionModel:
             reasoning="Good overlap",
         )
 
-        with pytest.raises((AttributeError, TypeError)):
+        with pytest.raises(AttributeError):
             decision.is_grounded = False  # type: ignore[misc]
 
+    def test_grounding_decision_has_no_instance_dict(self) -> None:
+        """GroundingDecision uses __slots__ instead of a per-instance __dict__."""
+        decision = GroundingDecision(is_grounded=True, confidence=0.9, reasoning="Good overlap")
+
+        assert not hasattr(decision, "__dict__")
+
     def test_create_not_grounded_decision(self) -> None:
         """GroundingDecision correctly represents ungrounded state."""
         decision = GroundingDecision(
@@ -394,3 +425,9 @@ class TestChunkModel:
 
         assert chunk.metadata["custom_key"] == "custom_value"
         assert chunk.metadata["nested"]["a"] == 1
+
+    def test_chunk_has_no_instance_dict(self) -> None:
+        """Chunk uses __slots__ instead of a per-instance __dict__."""
+        chunk = Chunk(id="chunk-1", document_id="doc-1", content="Text.", metadata={})
+
+        assert not hasattr(chunk, "__dict__")
@@ -0,0 +1,140 @@
+"""Unit tests for BatchingInteractionStore and SqliteInteractionStore.save_many.
+
+Tests cover group-committing concurrent saves, isolating failing rows and
+writing a lone save without waiting for a batch to fill.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.domain.models.interaction import Interaction
+from app.infrastructure.persistence.batching import BatchingInteractionStore
+from app.infrastructure.persistence.sqlite_store import (
+    SqliteInteractionStore,
+    create_engines,
+    create_schema,
+)
+
+
+def _interaction(interaction_id: str) -> Interaction:
+    return Interaction(id=interaction_id, kb_id="kb-001", question="Q?")
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+    """Mock SqliteInteractionStore rejecting any batch with a "bad" interaction."""
+    mock = AsyncMock(spec_set=SqliteInteractionStore)
+
+    async def save_many(interactions: list[Interaction]) -> list[Interaction]:
+        if any(i.id.startswith("bad") for i in interactions):
+            raise ValueError("bad row")
+        return interactions
+
+    mock.save_many.side_effect = save_many
+    return mock
+
+
+@pytest.fixture
+async def sqlite_store(tmp_path: Path) -> AsyncIterator[SqliteInteractionStore]:
+    """SqliteInteractionStore backed by a fresh database file."""
+    writer, reader = create_engines(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with writer.begin() as conn:
+        await conn.run_sync(create_schema)
+    yield SqliteInteractionStore(
+        async_sessionmaker(writer, expire_on_commit=False),
+        async_sessionmaker(reader, expire_on_commit=False),
+    )
+    await reader.dispose()
+    await writer.dispose()
+
+
+class TestBatchingInteractionStore:
+    """Tests for BatchingInteractionStore."""
+
+    async def test_concurrent_saves_share_one_transaction(self, inner: AsyncMock) -> None:
+        """Saves queued together are written with a single save_many call."""
+        store = BatchingInteractionStore(inner)
+
+        saved = await asyncio.gather(*(store.save(_interaction(f"i{n}")) for n in range(3)))
+        await store.close()
+
+        assert [i.id for i in saved] == ["i0", "i1", "i2"]
+        inner.save_many.assert_awaited_once()
+        assert [i.id for i in inner.save_many.await_args.args[0]] == ["i0", "i1", "i2"]
+
+    async def test_failing_row_only_fails_its_caller(self, inner: AsyncMock) -> None:
+        """A row that makes the batch fail is retried alone; the others are saved."""
+        store = BatchingInteractionStore(inner)
+
+        results = await asyncio.gather(
+            store.save(_interaction("i1")),
+            store.save(_interaction("bad")),
+            store.save(_interaction("i2")),
+            return_exceptions=True,
+        )
+        await store.close()
+
+        assert isinstance(results[0], Interaction) and results[0].id == "i1"
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], Interaction) and results[2].id == "i2"
+        # One failed batch, then one retry per row.
+        assert inner.save_many.await_count == 4
+
+    async def test_lone_save_is_written_without_waiting(self, inner: AsyncMock) -> None:
+        """A single save is committed straight away, not held for a full batch."""
+        store = BatchingInteractionStore(inner, max_batch_size=256)
+
+        saved = await asyncio.wait_for(store.save(_interaction("i1")), timeout=1.0)
+        await store.close()
+
+        assert saved.id == "i1"
+        inner.save_many.assert_awaited_once()
+
+    async def test_batches_are_capped_at_max_batch_size(self, inner: AsyncMock) -> None:
+        """No transaction writes more than max_batch_size interactions."""
+        store = BatchingInteractionStore(inner, max_batch_size=2)
+
+        await asyncio.gather(*(store.save(_interaction(f"i{n}")) for n in range(5)))
+        await store.close()
+
+        sizes = [len(call.args[0]) for call in inner.save_many.await_args_list]
+        assert sizes == [2, 2, 1]
+
+
+class TestSqliteInteractionStoreSaveMany:
+    """Tests for SqliteInteractionStore.save_many."""
+
+    async def test_saves_all_interactions(self, sqlite_store: SqliteInteractionStore) -> None:
+        """Every interaction of the batch is stored and returned in order."""
+        interactions = [_interaction(f"i{n}") for n in range(3)]
+
+        saved = await sqlite_store.save_many(interactions)
+
+        assert saved == interactions
+        for interaction in interactions:
+            stored = await sqlite_store.get(interaction.id)
+            assert stored is not None and stored.question == "Q?"
+
+    async def test_empty_batch_is_a_no_op(self, sqlite_store: SqliteInteractionStore) -> None:
+        """An empty batch returns without touching the database."""
+        assert await sqlite_store.save_many([]) == []
+        assert await sqlite_store.list_all() == []
+
+    async def test_failing_row_rolls_back_the_batch(
+        self, sqlite_store: SqliteInteractionStore
+    ) -> None:
+        """A duplicate ID fails the whole transaction, so no row is written."""
+        await sqlite_store.save(_interaction("i1"))
+
+        with pytest.raises(IntegrityError):
+            await sqlite_store.save_many([_interaction("i2"), _interaction("i1")])
+
+        assert await sqlite_store.get("i2") is None
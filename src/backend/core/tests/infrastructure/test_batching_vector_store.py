@@ -0,0 +1,67 @@
+"""Unit tests for BatchingVectorStore.
+
+Tests cover coalescing concurrent searches and isolating failing queries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.models.chunk import Chunk
+from app.infrastructure.vectorstore.batching import BatchingVectorStore
+from app.infrastructure.vectorstore.faiss_adapter import FaissVectorStore
+
+
+def _chunk(chunk_id: str) -> Chunk:
+    return Chunk(id=chunk_id, document_id="doc-001", content="text", metadata={})
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+    """Mock FaissVectorStore answering each query with a chunk named after it."""
+    mock = AsyncMock(spec_set=FaissVectorStore)
+
+    async def search_batch(
+        query_embeddings: list[list[float]], kb_id: str, top_k: int = 5
+    ) -> list[list[Chunk]]:
+        if any(q[0] < 0 for q in query_embeddings):
+            raise ValueError("bad query")
+        return [[_chunk(f"c{q[0]:g}")] for q in query_embeddings]
+
+    mock.search_batch.side_effect = search_batch
+    return mock
+
+
+class TestBatchingVectorStore:
+    """Tests for BatchingVectorStore."""
+
+    async def test_concurrent_searches_share_one_batch(self, inner: AsyncMock) -> None:
+        """Concurrent searches for the same KB run as a single batch search."""
+        store = BatchingVectorStore(inner, batch_window_ms=50.0)
+
+        results = await asyncio.gather(
+            store.search([1.0], "kb-001"), store.search([2.0], "kb-001")
+        )
+        await store.close()
+
+        assert [[c.id for c in r] for r in results] == [["c1"], ["c2"]]
+        inner.search_batch.assert_awaited_once()
+
+    async def test_failing_query_only_fails_its_caller(self, inner: AsyncMock) -> None:
+        """A query that makes the batch fail is retried alone; the others succeed."""
+        store = BatchingVectorStore(inner, batch_window_ms=50.0)
+
+        results = await asyncio.gather(
+            store.search([1.0], "kb-001"),
+            store.search([-1.0], "kb-001"),
+            store.search([2.0], "kb-001"),
+            return_exceptions=True,
+        )
+        await store.close()
+
+        assert [c.id for c in results[0]] == ["c1"]
+        assert isinstance(results[1], ValueError)
+        assert [c.id for c in results[2]] == ["c2"]
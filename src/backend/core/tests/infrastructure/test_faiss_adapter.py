@@ -0,0 +1,69 @@
+"""Unit tests for FaissVectorStore.
+
+Tests cover training of quantized indexes on incrementally stored chunks.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.domain.models.chunk import Chunk
+from app.infrastructure.vectorstore.faiss_adapter import FaissVectorStore
+
+_DIMENSION = 16
+
+
+def _chunks(vectors: np.ndarray) -> list[Chunk]:
+    return [
+        Chunk(
+            id=f"c{i}",
+            document_id="doc-001",
+            content="text",
+            metadata={},
+            embedding=vector.tolist(),
+        )
+        for i, vector in enumerate(vectors)
+    ]
+
+
+class TestFaissVectorStoreTraining:
+    """Tests for indexes that need training, such as SQ8."""
+
+    async def test_searches_are_exact_before_training(self) -> None:
+        """Vectors stored before the training threshold are searchable."""
+        store = FaissVectorStore(
+            dimension=_DIMENSION, index_description="SQ8", min_training_vectors=100
+        )
+        chunks = _chunks(np.random.default_rng(0).standard_normal((10, _DIMENSION)))
+        await store.store(chunks[:1])
+        await store.store(chunks[1:])
+
+        for chunk in chunks:
+            results = await store.search(chunk.embedding, "kb-001", top_k=1)
+            assert results[0].id == chunk.id
+
+    async def test_one_at_a_time_ingest_keeps_recall(self) -> None:
+        """The index is trained on all stored vectors, not on the first batch."""
+        store = FaissVectorStore(
+            dimension=_DIMENSION, index_description="SQ8", min_training_vectors=100
+        )
+        chunks = _chunks(np.random.default_rng(0).standard_normal((200, _DIMENSION)))
+        for chunk in chunks:
+            await store.store([chunk])
+
+        results = await store.search_batch([c.embedding for c in chunks], "kb-001", top_k=1)
+
+        recall = sum(r[0].id == c.id for r, c in zip(results, chunks, strict=True)) / len(chunks)
+        assert recall >= 0.95
+
+    async def test_delete_before_training_removes_vectors(self) -> None:
+        """Deleting a document drops its vectors from the staging index."""
+        store = FaissVectorStore(
+            dimension=_DIMENSION, index_description="SQ8", min_training_vectors=100
+        )
+        chunks = _chunks(np.random.default_rng(0).standard_normal((5, _DIMENSION)))
+        await store.store(chunks)
+
+        await store.delete_by_document("doc-001")
+
+        assert await store.search(chunks[0].embedding, "kb-001") == []
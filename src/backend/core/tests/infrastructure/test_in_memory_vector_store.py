@@ -0,0 +1,56 @@
+"""Unit tests for InMemoryVectorStore.
+
+Tests cover storing, replacing and searching chunks by cosine similarity.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.domain.models.chunk import Chunk
+from app.infrastructure.vectorstore.in_memory_store import InMemoryVectorStore
+
+
+def _chunk(chunk_id: str, embedding: list[float], content: str = "text") -> Chunk:
+    return Chunk(
+        id=chunk_id, document_id="doc-001", content=content, metadata={}, embedding=embedding
+    )
+
+
+class TestInMemoryVectorStore:
+    """Tests for InMemoryVectorStore."""
+
+    async def test_search_returns_most_similar_first(self) -> None:
+        """Chunks are ranked by cosine similarity to the query."""
+        store = InMemoryVectorStore()
+        await store.store([_chunk("c1", [1.0, 0.0]), _chunk("c2", [0.0, 1.0])])
+
+        results = await store.search([0.1, 1.0], "kb-001", top_k=2)
+
+        assert [c.id for c in results] == ["c2", "c1"]
+
+    async def test_duplicate_ids_in_one_batch_keep_last_copy(self) -> None:
+        """A batch repeating an ID stores one row holding the last copy."""
+        store = InMemoryVectorStore()
+
+        await store.store([
+            _chunk("c1", [1.0, 0.0], content="first"),
+            _chunk("c1", [0.0, 1.0], content="second"),
+        ])
+        await store.store([_chunk("c2", [1.0, 0.0])])
+
+        results = await store.search([0.0, 1.0], "kb-001", top_k=5)
+        assert [c.id for c in results] == ["c1", "c2"]
+        assert results[0].content == "second"
+
+    async def test_invalid_batch_leaves_store_unchanged(self) -> None:
+        """A batch with a mismatched dimension is rejected without partial writes."""
+        store = InMemoryVectorStore()
+        await store.store([_chunk("c1", [1.0, 0.0])])
+
+        with pytest.raises(ValueError):
+            await store.store([_chunk("c1", [0.0, 1.0]), _chunk("c2", [1.0, 0.0, 0.0])])
+
+        results = await store.search([1.0, 0.0], "kb-001", top_k=5)
+        assert [c.id for c in results] == ["c1"]
+        assert results[0].embedding == [1.0, 0.0]